@@ -37,7 +37,7 @@ CREATE TABLE system_logs (
     level VARCHAR(20) NOT NULL CHECK (level IN ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')),
     message TEXT NOT NULL,
     data JSONB,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
 );
 
 -- 4. traders 테이블 (strategies를 참조)
@@ -87,7 +87,20 @@ CREATE TABLE trades (
     realized_pnl DECIMAL(15,2),
     binance_order_id BIGINT,
     executed_at TIMESTAMP WITH TIME ZONE NOT NULL,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     
     CONSTRAINT fk_trades_trader FOREIGN KEY (trader_id) REFERENCES traders(id)
-);
\ No newline at end of file
+);
+
+-- 7. updated_at 자동 갱신 트리거 (클라이언트는 updated_at을 보내지 않음)
+CREATE OR REPLACE FUNCTION set_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_traders_updated_at
+    BEFORE UPDATE ON traders
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
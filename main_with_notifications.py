@@ -275,6 +275,10 @@ class IntegratedTradingSystem:
             if self.scheduler:
                 self.scheduler.stop()
             
+            # 큐에 남은 시스템 로그 저장, 로그 스레드·DB 커넥션 풀 정리
+            if self.supabase_client:
+                self.supabase_client.close()
+            
             self.is_running = False
             logger.info("자동매매 시스템 정지 완료")
             
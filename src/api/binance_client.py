@@ -3,6 +3,7 @@ import logging
 from typing import Dict, List, Optional, Tuple
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
+import numpy as np
 import pandas as pd
 from decimal import Decimal, ROUND_DOWN
 from src.utils.logger import get_logger
@@ -89,6 +90,34 @@ class BinanceClient:
                     logger.error(f"API 요청 최종 실패: {func.__name__} - {str(e)}")
                     raise e
     
+    @staticmethod
+    def _klines_to_dataframe(klines: List[List]) -> pd.DataFrame:
+        """
+        바이낸스 kline 응답(리스트의 리스트)을 OHLCV DataFrame으로 변환
+        
+        12컬럼 object DataFrame을 만든 뒤 컬럼별로 변환하지 않고,
+        필요한 6개 값만 numpy 배열로 바로 파싱한다.
+        
+        Args:
+            klines: [open_time(ms), open, high, low, close, volume, ...] 리스트
+            
+        Returns:
+            timestamp(datetime64[ns]) + OHLCV(float64) DataFrame
+        """
+        count = len(klines)
+        open_times = np.fromiter((kline[0] for kline in klines), dtype=np.int64, count=count)
+        # 가격/거래량은 문자열로 오므로 float64 배열로 한 번에 변환
+        values = np.array([kline[1:6] for kline in klines], dtype=np.float64).reshape(count, 5)
+        
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(open_times, unit='ms'),
+            'open': values[:, 0],
+            'high': values[:, 1],
+            'low': values[:, 2],
+            'close': values[:, 3],
+            'volume': values[:, 4]
+        })
+    
     def get_klines(self, symbol: str, interval: str = '1m', limit: int = 100) -> pd.DataFrame:
         """
         캔들스틱 데이터 조회
@@ -113,20 +142,45 @@ class BinanceClient:
         klines = self._retry_request(_get_klines)
         
         # DataFrame으로 변환
-        df = pd.DataFrame(klines, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # 필요한 컬럼만 선택하고 타입 변환
-        df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']].copy()
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        df[['open', 'high', 'low', 'close', 'volume']] = df[['open', 'high', 'low', 'close', 'volume']].astype(float)
+        df = self._klines_to_dataframe(klines)
         
         logger.debug(f"캔들 데이터 조회 완료: {symbol} {len(df)}개")
         return df
     
+    def get_recent_candles(self, symbol: str, interval: str = '1m', limit: int = 2) -> List[Dict]:
+        """
+        최근 캔들 몇 개를 DataFrame 변환 없이 조회 (매분 지표 증분 갱신용)
+        
+        Args:
+            symbol: 거래 심볼
+            interval: 시간 간격
+            limit: 조회할 캔들 개수
+            
+        Returns:
+            [{'timestamp', 'open', 'high', 'low', 'close', 'volume'}] 리스트 (오래된 것부터)
+        """
+        def _get_klines():
+            return self.client.futures_klines(
+                symbol=symbol,
+                interval=interval,
+                limit=limit
+            )
+        
+        klines = self._retry_request(_get_klines)
+        
+        # get_klines()와 같은 타입 (timestamp는 UTC naive Timestamp, 가격/거래량은 float)
+        return [
+            {
+                'timestamp': pd.Timestamp(kline[0], unit='ms'),
+                'open': float(kline[1]),
+                'high': float(kline[2]),
+                'low': float(kline[3]),
+                'close': float(kline[4]),
+                'volume': float(kline[5])
+            }
+            for kline in klines
+        ]
+    
     def get_klines_bulk(self, symbol: str, interval: str = '1m', 
                        start_time: datetime = None, end_time: datetime = None,
                        total_count: int = None) -> pd.DataFrame:
@@ -187,13 +241,12 @@ class BinanceClient:
                 
                 logger.debug(f"배치 {batch_count}: {current_start} ~ {batch_end}")
                 
-                # 시간 범위 기반 조회 사용
+                # 시간 범위 기반 조회 사용 (한 번에 최대 1000개)
                 batch_df = self.get_klines_by_time_range(
                     symbol=symbol,
                     interval=interval,
                     start_time=current_start,
-                    end_time=batch_end,
-                    max_count=max_limit
+                    end_time=batch_end
                 )
                 
                 if batch_df.empty:
@@ -298,22 +351,7 @@ class BinanceClient:
                 return pd.DataFrame()
             
             # DataFrame 변환
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-            ])
-            
-            # 데이터 타입 변환
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float) 
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
-            
-            # 필요한 컬럼만 선택
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+            df = self._klines_to_dataframe(klines)
             
             logger.info(f"{symbol} 시간 범위 조회 완료: {len(df)}개")
             return df
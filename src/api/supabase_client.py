@@ -5,28 +5,79 @@ Supabase 클라이언트 모듈 (datetime 직렬화 오류 수정)
 """
 
 import os
+import sys
+import atexit
+import gzip
+import json
+import time
+import random
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import httpx
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from pathlib import Path
+from queue import Queue, Empty, Full
 from supabase import create_client, Client
+from postgrest.types import ReturnMethod
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# 시장 데이터 기본 컬럼 (이외의 키는 지표 값으로 취급)
+_OHLCV_KEYS = frozenset(('symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume'))
+
+@lru_cache(maxsize=4096)
+def _iso_timestamp(dt: datetime) -> str:
+    """datetime을 ISO 문자열로 변환 (같은 분봉 시각이 반복 저장되므로 캐시)"""
+    return dt.isoformat()
+
 class SupabaseClient:
     """Supabase 데이터베이스 연동 클라이언트"""
     
-    def __init__(self, url: Optional[str] = None, key: Optional[str] = None):
+    # 시장 데이터 저장 재시도 설정
+    RETRY_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.05  # 초
+    RETRY_MAX_DELAY = 1.0  # 초
+    RETRY_AFTER_MAX_DELAY = 5.0  # 초 (서버 Retry-After 상한)
+    
+    # 이 크기(바이트)를 넘는 upsert 본문은 gzip 압축 전송
+    GZIP_MIN_BYTES = 64 * 1024
+    
+    # REST upsert 한 번에 보내는 최대 행 수 (큰 배치는 나눠 전송해 한 요청 실패가 전체를 막지 않도록)
+    REST_BATCH_SIZE = 1000
+    
+    # 이 행 수를 넘는 배치는 Postgres COPY로 저장 (SUPABASE_POOL_URL 또는 SUPABASE_DB_URL 필요)
+    COPY_THRESHOLD = 5000
+    MARKET_DATA_COLUMNS = (
+        'symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume',
+        'macd_12_26_9_line', 'macd_12_26_9_signal', 'macd_12_26_9_histogram', 'atr_14_value'
+    )
+    
+    # Postgres 커넥션 풀 크기 (SUPABASE_POOL_URL 사용 시)
+    PG_POOL_MIN_SIZE = 2
+    PG_POOL_MAX_SIZE = 10
+    
+    # 시스템 로그 비동기 저장 설정
+    LOG_QUEUE_SIZE = 100_000
+    LOG_BATCH_SIZE = 500
+    
+    def __init__(self, url: Optional[str] = None, key: Optional[str] = None,
+                 db_url: Optional[str] = None, pool_url: Optional[str] = None):
         """
         Supabase 클라이언트 초기화
         
         Args:
             url: Supabase 프로젝트 URL
             key: Supabase anon key
+            db_url: Postgres 직접 접속 URL (대용량 COPY 저장용, 선택)
+            pool_url: Supabase 커넥션 풀러(트랜잭션 모드) URL (선택, db_url보다 우선)
         """
         self.url = url or os.getenv('SUPABASE_URL')
         self.key = key or os.getenv('SUPABASE_KEY')
+        self.db_url = db_url or os.getenv('SUPABASE_DB_URL')
+        self.pool_url = pool_url or os.getenv('SUPABASE_POOL_URL')
         
         if not self.url or not self.key:
             raise ValueError("SUPABASE_URL과 SUPABASE_KEY가 필요합니다")
@@ -34,6 +85,29 @@ class SupabaseClient:
         # Supabase 클라이언트 생성
         self.client: Client = create_client(self.url, self.key)
         
+        # 시스템 로그 큐 (백그라운드 스레드가 배치 저장)
+        self.log_queue: Queue = Queue(maxsize=self.LOG_QUEUE_SIZE)
+        self._log_thread: Optional[threading.Thread] = None
+        self._log_thread_lock = threading.Lock()
+        self._log_stop = threading.Event()
+        self._close_at_exit = False  # atexit에 close 등록 여부 (close에서 해제)
+        
+        # Postgres 커넥션 풀 (pool_url 사용 시 첫 COPY 저장 때 생성)
+        self._pg_pool = None
+        self._pg_pool_lock = threading.Lock()
+        
+        # 트레이더별 거래 내역 저장 함수 (make_trade_writer 캐시)
+        self._trade_writers: Dict[int, Callable[[Dict], bool]] = {}
+        
+        # 서버가 gzip 본문을 거부한 적이 있으면 이후에는 압축하지 않음
+        self._gzip_supported = True
+        
+        # 심볼 문자열 풀 (행마다 같은 심볼 문자열을 재사용)
+        self._symbol_pool: Dict[str, str] = {}
+        
+        # 테이블 -> 컬럼 집합 스냅샷 (검증 시 1회 로드, 실패하면 None)
+        self._schema: Optional[Dict[str, frozenset]] = None
+        
         # 데이터베이스 검증
         if not self._validate_database():
             raise Exception("데이터베이스 검증 실패. 스키마를 확인하거나 생성하세요.")
@@ -43,7 +117,7 @@ class SupabaseClient:
     def _datetime_to_string(self, dt: datetime) -> str:
         """datetime 객체를 ISO 문자열로 변환"""
         if isinstance(dt, datetime):
-            return dt.isoformat()
+            return _iso_timestamp(dt)
         return dt
     
     def _validate_database(self) -> bool:
@@ -56,6 +130,9 @@ class SupabaseClient:
                 logger.error("데이터베이스 연결 실패")
                 return False
             
+            # 스키마 스냅샷 로드 (이후 테이블/컬럼 확인은 네트워크 요청 없이 처리)
+            self._schema = self._load_schema()
+            
             # 필수 테이블 확인
             required_tables = ['strategies', 'traders', 'positions', 'trades', 'market_data', 'system_logs']
             missing_tables = []
@@ -91,8 +168,39 @@ class SupabaseClient:
             logger.error(f"연결 테스트 실패: {e}")
             return False
     
+    def _load_schema(self) -> Optional[Dict[str, frozenset]]:
+        """
+        PostgREST OpenAPI 문서에서 테이블/컬럼 스냅샷 생성
+        
+        Returns:
+            {테이블명: 컬럼명 frozenset} 딕셔너리 (조회 실패 또는 빈 문서면 None)
+        """
+        try:
+            response = self.client.postgrest.session.get('/')
+            response.raise_for_status()
+            definitions = response.json().get('definitions', {})
+            
+            # 권한이나 노출 설정에 따라 definitions가 비어 올 수 있음 → 개별 조회로 대체
+            if not definitions:
+                logger.warning("스키마 스냅샷이 비어 있음, 개별 조회로 대체")
+                return None
+            
+            schema = {
+                table: frozenset(spec.get('properties', {}))
+                for table, spec in definitions.items()
+            }
+            logger.debug(f"스키마 스냅샷 로드: {len(schema)}개 테이블")
+            return schema
+            
+        except Exception as e:
+            logger.warning(f"스키마 스냅샷 로드 실패, 개별 조회로 대체: {e}")
+            return None
+    
     def _check_table_exists(self, table_name: str) -> bool:
         """테이블 존재 확인"""
+        if self._schema is not None:
+            return table_name in self._schema
+        
         try:
             response = self.client.table(table_name).select('*').limit(1).execute()
             return True
@@ -101,6 +209,9 @@ class SupabaseClient:
     
     def _check_column_exists(self, table_name: str, column_name: str) -> bool:
         """컬럼 존재 확인"""
+        if self._schema is not None:
+            return column_name in self._schema.get(table_name, frozenset())
+        
         try:
             response = self.client.table(table_name).select(column_name).limit(1).execute()
             return True
@@ -163,28 +274,295 @@ class SupabaseClient:
     
     def save_log(self, module_name: str, level: str, message: str, 
                  trader_id: Optional[int] = None, data: Optional[Dict] = None) -> bool:
-        """시스템 로그 저장"""
+        """
+        시스템 로그 저장 (비동기)
+        
+        로그는 큐에 넣고 바로 반환하며, 백그라운드 스레드가 모아서 배치 insert 한다.
+        트레이딩 스레드가 Supabase 응답 지연에 묶이지 않도록 하기 위함.
+        
+        Returns:
+            큐 적재 성공 여부 (큐가 가득 차면 False). 저장 완료 여부가 아니며, insert 실패는
+            백그라운드 스레드가 에러 로그로만 남기므로 호출자는 알 수 없다 (fire-and-forget)
+        """
         try:
             log_data = {
                 'module_name': module_name,
                 'level': level,
                 'message': message,
                 'trader_id': trader_id,
-                'data': data,
-                'created_at': self._datetime_to_string(datetime.now())
+                'data': data
             }
             
-            response = self.client.table('system_logs').insert(log_data).execute()
-            return len(response.data) > 0
-                
+            self._ensure_log_worker()
+            self.log_queue.put_nowait(log_data)
+            return True
+            
+        except Full:
+            logger.warning(f"로그 큐가 가득 차 로그를 버립니다: {module_name} - {message}")
+            return False
         except Exception as e:
             logger.error(f"로그 저장 중 에러: {e}")
             return False
     
+    def flush_logs(self, timeout: float = 5.0) -> bool:
+        """
+        큐에 쌓인 로그가 모두 저장될 때까지 대기 (종료 직전 호출용)
+        
+        Args:
+            timeout: 최대 대기 시간 (초)
+            
+        Returns:
+            큐가 비워졌는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        while self.log_queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.05)
+        return self.log_queue.unfinished_tasks == 0
+    
+    def _ensure_log_worker(self):
+        """로그 저장 스레드가 없으면 시작"""
+        if self._log_thread and self._log_thread.is_alive():
+            return
+        
+        with self._log_thread_lock:
+            if self._log_thread and self._log_thread.is_alive():
+                return
+            
+            # 데몬 스레드는 종료 시 그냥 사라지므로 남은 로그를 비우고 종료
+            # (close에서 해제해 닫힌 클라이언트를 프로세스 종료까지 붙잡지 않음)
+            if not self._close_at_exit:
+                atexit.register(self.close)
+                self._close_at_exit = True
+            
+            self._log_stop.clear()
+            self._log_thread = threading.Thread(
+                target=self._log_worker,
+                name="SupabaseLogWorker",
+                daemon=True
+            )
+            self._log_thread.start()
+    
+    def _log_worker(self):
+        """백그라운드 로그 저장 스레드 (최대 LOG_BATCH_SIZE개씩 배치 insert)"""
+        while True:
+            try:
+                batch = [self.log_queue.get(timeout=0.5)]
+            except Empty:
+                # 정지 요청은 큐가 빈 뒤에만 반영
+                if self._log_stop.is_set():
+                    return
+                continue
+            
+            while len(batch) < self.LOG_BATCH_SIZE:
+                try:
+                    batch.append(self.log_queue.get_nowait())
+                except Empty:
+                    break
+            
+            try:
+                self.client.table('system_logs').insert(
+                    batch,
+                    returning=ReturnMethod.minimal
+                ).execute()
+            except Exception as e:
+                logger.error(f"로그 배치 저장 중 에러 ({len(batch)}개): {e}")
+            finally:
+                for _ in batch:
+                    self.log_queue.task_done()
+    
+    def close(self, timeout: float = 5.0):
+        """
+        종료 정리: 남은 로그 저장 후 로그 스레드 정지, Postgres 커넥션 풀 반환
+        
+        Args:
+            timeout: 로그 저장 및 스레드 종료 최대 대기 시간 (초)
+        """
+        self.flush_logs(timeout)
+        
+        with self._log_thread_lock:
+            if self._close_at_exit:
+                atexit.unregister(self.close)
+                self._close_at_exit = False
+        
+        self._log_stop.set()
+        log_thread = self._log_thread
+        if log_thread and log_thread.is_alive():
+            log_thread.join(timeout)
+        
+        with self._pg_pool_lock:
+            pg_pool, self._pg_pool = self._pg_pool, None
+        if pg_pool is not None:
+            try:
+                pg_pool.close()
+                logger.info("Postgres 커넥션 풀 종료")
+            except Exception as e:
+                logger.error(f"Postgres 커넥션 풀 종료 중 에러: {e}")
+    
     # ===========================================
     # 시장 데이터 관련 메서드
     # ===========================================
     
+    def _row_to_record(self, data: Dict) -> Dict:
+        """
+        시장 데이터 1행을 DB 저장용 레코드로 변환
+        
+        Args:
+            data: symbol, timestamp, OHLCV 및 지표 값을 담은 딕셔너리
+            
+        Returns:
+            datetime 직렬화 및 float 변환이 끝난 레코드
+        """
+        symbol = self._symbol_pool.get(data['symbol'])
+        if symbol is None:
+            symbol = self._symbol_pool[data['symbol']] = sys.intern(str(data['symbol']))
+        
+        record = {
+            'symbol': symbol,
+            'timestamp': self._datetime_to_string(data['timestamp']),
+            'open': float(data['open']),
+            'high': float(data['high']),
+            'low': float(data['low']),
+            'close': float(data['close']),
+            'volume': float(data['volume'])
+        }
+        
+        # 지표 데이터 추가 (있는 경우만)
+        for key, value in data.items():
+            if key not in _OHLCV_KEYS:
+                if value is not None:
+                    record[key] = float(value)
+        
+        return record
+    
+    def _upsert_market_data(self, records: List[Dict]) -> List[Dict]:
+        """
+        market_data 테이블 upsert 실행
+        
+        페이로드가 GZIP_MIN_BYTES를 넘으면 gzip(level 1)으로 압축해 전송하고,
+        서버가 압축 본문을 거부하면 일반 upsert로 다시 보낸 뒤 이후로는 압축하지 않는다.
+        응답에는 저장 건수 확인용으로 symbol, timestamp만 돌려받는다.
+        
+        Args:
+            records: _row_to_record로 변환된 레코드 리스트
+            
+        Returns:
+            저장된 행의 (symbol, timestamp) 리스트
+        """
+        body = json.dumps(records, separators=(',', ':')).encode('utf-8')
+        
+        if self._gzip_supported and len(body) > self.GZIP_MIN_BYTES:
+            response = self._post_market_data(gzip.compress(body, compresslevel=1), {'Content-Encoding': 'gzip'})
+            
+            if response.status_code not in (400, 415):
+                response.raise_for_status()
+                return response.json() or []
+            
+            logger.warning(f"gzip 업로드 거부됨 ({response.status_code}), 일반 upsert로 재전송")
+            gzip_rejected = True
+        else:
+            gzip_rejected = False
+        
+        response = self._post_market_data(body)
+        response.raise_for_status()
+        
+        # 압축 없이는 성공했으므로 서버가 gzip을 지원하지 않는 것으로 기억
+        if gzip_rejected:
+            self._gzip_supported = False
+            logger.info("gzip 업로드 비활성화")
+        
+        return response.json() or []
+    
+    def _post_market_data(self, content: bytes, extra_headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        market_data upsert 요청 전송
+        
+        postgrest 빌더의 APIError는 응답 헤더를 버리므로 세션으로 직접 보내
+        실패 시 Retry-After를 담은 httpx.HTTPStatusError가 올라가게 한다.
+        """
+        headers = {
+            'Content-Type': 'application/json',
+            'Prefer': 'resolution=merge-duplicates,return=representation'
+        }
+        if extra_headers:
+            headers.update(extra_headers)
+        
+        return self.client.postgrest.session.post(
+            '/market_data',
+            params={'on_conflict': 'symbol,timestamp', 'select': 'symbol,timestamp'},
+            content=content,
+            headers=headers
+        )
+    
+    def _pg_connection(self):
+        """
+        Postgres 연결 획득 (psycopg 필요, postgres extra로 설치)
+        
+        pool_url이 있으면 커넥션 풀에서 빌려오고, 없으면 db_url로 직접 접속한다.
+        PgBouncer 트랜잭션 모드에서는 prepared statement를 쓸 수 없으므로 비활성화.
+        
+        Returns:
+            with 문으로 사용하는 연결 컨텍스트
+        """
+        if self.pool_url:
+            if self._pg_pool is None:
+                with self._pg_pool_lock:
+                    if self._pg_pool is None:
+                        from psycopg_pool import ConnectionPool
+                        
+                        self._pg_pool = ConnectionPool(
+                            self.pool_url,
+                            min_size=self.PG_POOL_MIN_SIZE,
+                            max_size=self.PG_POOL_MAX_SIZE,
+                            kwargs={'prepare_threshold': None, 'autocommit': True},
+                            open=True
+                        )
+                        logger.info("Postgres 커넥션 풀 생성 완료")
+            return self._pg_pool.connection()
+        
+        import psycopg
+        
+        # URL에 sslmode가 지정돼 있으면 그대로 따르고, 없으면 SSL 필수
+        if 'sslmode=' in self.db_url:
+            return psycopg.connect(self.db_url, autocommit=True)
+        return psycopg.connect(self.db_url, sslmode='require', autocommit=True)
+    
+    def _copy_market_data(self, records: List[Dict]) -> int:
+        """
+        Postgres COPY로 market_data 대량 upsert (psycopg 필요)
+        
+        임시 테이블에 COPY 한 뒤 INSERT ... ON CONFLICT로 병합한다.
+        
+        Args:
+            records: _row_to_record로 변환된 레코드 리스트
+            
+        Returns:
+            저장(삽입/갱신)된 행 수
+        """
+        columns = ', '.join(self.MARKET_DATA_COLUMNS)
+        updates = ', '.join(
+            f"{col} = EXCLUDED.{col}"
+            for col in self.MARKET_DATA_COLUMNS if col not in ('symbol', 'timestamp')
+        )
+        
+        with self._pg_connection() as conn, conn.transaction():
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"CREATE TEMP TABLE market_data_staging ON COMMIT DROP AS "
+                    f"SELECT {columns} FROM market_data WITH NO DATA"
+                )
+                
+                with cur.copy(f"COPY market_data_staging ({columns}) FROM STDIN") as copy:
+                    for record in records:
+                        copy.write_row([record.get(col) for col in self.MARKET_DATA_COLUMNS])
+                
+                cur.execute(
+                    f"INSERT INTO market_data ({columns}) "
+                    f"SELECT DISTINCT ON (symbol, timestamp) {columns} FROM market_data_staging "
+                    f"ORDER BY symbol, timestamp "
+                    f"ON CONFLICT (symbol, timestamp) DO UPDATE SET {updates}"
+                )
+                return cur.rowcount
+    
     def save_market_data_batch(self, market_data_list: List[Dict]) -> bool:
         """
         시장 데이터 배치 저장 (디버깅 강화 버전)
@@ -194,6 +572,9 @@ class SupabaseClient:
             
         Returns:
             저장 성공 여부
+            
+        Raises:
+            httpx.HTTPError: 재시도할 만한 실패 (전송 오류, 429, 5xx)
         """
         try:
             if not market_data_list:
@@ -203,26 +584,11 @@ class SupabaseClient:
             logger.info(f"[DEBUG] 배치 저장 시작: {len(market_data_list)}개")
             
             # 데이터 형식 변환 및 datetime 직렬화
+            # (timestamp 타입은 행마다 확인, datetime이 섞여 있어도 문자열은 그대로 사용)
             processed_data = []
             for i, data in enumerate(market_data_list):
                 try:
-                    processed_row = {
-                        'symbol': data['symbol'],
-                        'timestamp': self._datetime_to_string(data['timestamp']),
-                        'open': float(data['open']),
-                        'high': float(data['high']),
-                        'low': float(data['low']),
-                        'close': float(data['close']),
-                        'volume': float(data['volume'])
-                    }
-                    
-                    # 지표 데이터 추가 (있는 경우만)
-                    for key, value in data.items():
-                        if key not in ['symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume']:
-                            if value is not None:
-                                processed_row[key] = float(value)
-                    
-                    processed_data.append(processed_row)
+                    processed_data.append(self._row_to_record(data))
                     
                 except Exception as e:
                     logger.error(f"[DEBUG] 데이터 변환 실패 (인덱스 {i}): {e}")
@@ -236,35 +602,54 @@ class SupabaseClient:
             logger.info(f"[DEBUG] 변환 완료: {len(processed_data)}개")
             logger.info(f"[DEBUG] 첫 번째 데이터: {processed_data[0]}")
             
-            
-            # Upsert로 배치 저장
-            try:
-                response = self.client.table('market_data').upsert(
-                    processed_data,
-                    on_conflict='symbol,timestamp'
-                ).execute()
-                
-                success_count = len(response.data) if response.data else 0
-                logger.info(f"[DEBUG] Supabase 응답: {success_count}개 저장됨")
-                
-                if success_count != len(processed_data):
-                    logger.warning(f"[DEBUG] 저장 불일치: 요청 {len(processed_data)}개, 실제 {success_count}개")
+            # 대용량 백필은 Postgres COPY로 저장 (DB URL이 설정된 경우만)
+            if (self.pool_url or self.db_url) and len(processed_data) > self.COPY_THRESHOLD:
+                try:
+                    copied_count = self._copy_market_data(processed_data)
+                    logger.info(f"[DEBUG] COPY 저장 완료: {copied_count}개")
+                    return copied_count > 0
+                except Exception as copy_error:
+                    logger.warning(f"[DEBUG] COPY 저장 실패, REST upsert로 대체: {copy_error}")
+            
+            # Upsert로 배치 저장 (REST_BATCH_SIZE 행씩 나눠 전송, 실패한 청크가 있어도 나머지는 저장)
+            success_count = 0
+            failed_chunks = 0
+            for start in range(0, len(processed_data), self.REST_BATCH_SIZE):
+                chunk = processed_data[start:start + self.REST_BATCH_SIZE]
+                try:
+                    saved_rows = self._upsert_market_data(chunk)
+                    success_count += len(saved_rows)
                     
-                    # 일부만 저장된 경우 저장된 데이터 확인
-                    if response.data:
-                        logger.info(f"[DEBUG] 실제 저장된 첫 번째: {response.data[0]}")
-                        logger.info(f"[DEBUG] 실제 저장된 마지막: {response.data[-1]}")
-                
-                return success_count > 0
-                
-            except Exception as upsert_error:
-                logger.error(f"[DEBUG] Upsert 실행 실패: {upsert_error}")
-                logger.error(f"[DEBUG] 데이터 타입 확인:")
-                for key, value in processed_data[0].items():
-                    logger.error(f"[DEBUG]   {key}: {type(value)} = {value}")
+                    if len(saved_rows) != len(chunk):
+                        logger.warning(f"[DEBUG] 저장 불일치 (시작 인덱스 {start}): 요청 {len(chunk)}개, 실제 {len(saved_rows)}개")
+                        
+                        # 일부만 저장된 경우 저장된 데이터 확인
+                        if saved_rows:
+                            logger.info(f"[DEBUG] 실제 저장된 첫 번째: {saved_rows[0]}")
+                            logger.info(f"[DEBUG] 실제 저장된 마지막: {saved_rows[-1]}")
+                    
+                except Exception as upsert_error:
+                    # 재시도할 만한 실패는 호출자(save_market_data_with_retry)로 전달
+                    # (이미 저장된 청크는 upsert라 다시 보내도 중복되지 않음)
+                    if self._is_retriable_error(upsert_error):
+                        raise
+                    
+                    failed_chunks += 1
+                    logger.error(f"[DEBUG] Upsert 실행 실패 (시작 인덱스 {start}, {len(chunk)}개): {upsert_error}")
+                    logger.error(f"[DEBUG] 데이터 타입 확인:")
+                    for key, value in chunk[0].items():
+                        logger.error(f"[DEBUG]   {key}: {type(value)} = {value}")
+            
+            logger.info(f"[DEBUG] Supabase 응답: {success_count}개 저장됨")
+            if failed_chunks:
+                logger.error(f"[DEBUG] 청크 저장 실패: {failed_chunks}개 청크")
                 return False
             
+            return success_count > 0
+            
         except Exception as e:
+            if self._is_retriable_error(e):
+                raise
             logger.error(f"[DEBUG] 배치 저장 전체 실패: {e}")
             import traceback
             logger.error(f"[DEBUG] 스택 트레이스: {traceback.format_exc()}")
@@ -287,38 +672,92 @@ class SupabaseClient:
             if indicators:
                 data.update(indicators)
             
-            return self.save_market_data_batch([data])
+            # 단일 행은 배치 경로(디버그 로깅, 응답 비교)를 거치지 않고 바로 upsert
+            record = self._row_to_record(data)
+            self.client.table('market_data').upsert(
+                record,
+                on_conflict='symbol,timestamp',
+                returning=ReturnMethod.minimal
+            ).execute()
+            return True
             
         except Exception as e:
             logger.error(f"시장 데이터 단일 저장 실패: {e}")
             return False
     
-    def save_market_data_with_retry(self, data_list: List[Dict]) -> bool:
-        """시장 데이터 저장 (3단계 재시도)"""
-        try:
-            # 1차 시도
-            return self.save_market_data_batch(data_list)
-            
-        except Exception as e:
-            logger.warning(f"시장 데이터 저장 실패 (1차), 재시도: {e}")
+    @staticmethod
+    def _is_retriable_error(error: Exception) -> bool:
+        """
+        재시도로 해결될 수 있는 실패인지 판단
+        
+        전송 오류(타임아웃, 연결 끊김)와 429, 5xx만 재시도하고
+        스키마 오류 같은 4xx나 데이터 변환 실패는 바로 실패 처리한다.
+        """
+        if isinstance(error, httpx.TransportError):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            return status_code == 429 or status_code >= 500
+        return False
+    
+    def _retry_delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """
+        재시도 전 대기 시간 계산 (지수 백오프 + 지터)
+        
+        Args:
+            attempt: 방금 실패한 시도 번호 (1부터 시작)
+            error: 실패 원인 예외 (Retry-After 헤더 확인용)
             
+        Returns:
+            대기 시간 (초)
+        """
+        # 서버가 Retry-After를 알려준 경우 우선 적용 (429, 503 등)
+        # 수집 주기가 1분이므로 RETRY_AFTER_MAX_DELAY 이상은 기다리지 않는다
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = error.response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return min(max(float(retry_after), 0.0), self.RETRY_AFTER_MAX_DELAY)
+                except ValueError:
+                    pass
+        
+        # 50ms → 200ms → 800ms (최대 1초), 동시 재시도가 몰리지 않도록 지터 적용
+        delay = min(self.RETRY_BASE_DELAY * (4 ** (attempt - 1)), self.RETRY_MAX_DELAY)
+        return random.uniform(delay / 2, delay)
+    
+    def save_market_data_with_retry(self, data_list: List[Dict]) -> bool:
+        """
+        시장 데이터 저장 (3단계 재시도, 지수 백오프 + 지터)
+        
+        전송 오류, 429, 5xx만 재시도한다. 배치가 False를 반환하는 경우(변환 실패,
+        스키마 4xx 등)는 다시 보내도 결과가 같으므로 재시도하지 않는다.
+        """
+        last_error: Optional[Exception] = None
+        
+        for attempt in range(1, self.RETRY_ATTEMPTS + 1):
             try:
-                # 2차 시도
-                return self.save_market_data_batch(data_list)
+                if attempt == self.RETRY_ATTEMPTS:
+                    # 마지막 시도: 재연결 후 저장
+                    if not self.reconnect():
+                        raise Exception("재연결 실패")
                 
-            except Exception as e2:
-                logger.warning(f"시장 데이터 저장 실패 (2차), 재연결 후 시도: {e2}")
+                if self.save_market_data_batch(data_list):
+                    return True
                 
-                try:
-                    # 3차 시도: 재연결 후 저장
-                    if self.reconnect():
-                        return self.save_market_data_batch(data_list)
-                    else:
-                        raise Exception("재연결 실패")
-                        
-                except Exception as e3:
-                    logger.error(f"시장 데이터 저장 최종 실패: {e3}")
-                    raise Exception(f"시장 데이터 저장 최종 실패: {e3}")
+                logger.error(f"시장 데이터 저장 실패 ({attempt}차, 재시도 불가)")
+                return False
+                
+            except Exception as e:
+                last_error = e
+                logger.warning(f"시장 데이터 저장 실패 ({attempt}차): {e}")
+                if not self._is_retriable_error(e):
+                    break
+            
+            if attempt < self.RETRY_ATTEMPTS:
+                time.sleep(self._retry_delay(attempt, last_error))
+        
+        logger.error(f"시장 데이터 저장 최종 실패: {last_error}")
+        raise Exception(f"시장 데이터 저장 최종 실패: {last_error}")
     
     def get_latest_market_data(self, symbol: str, limit: int = 100) -> pd.DataFrame:
         """최신 시장 데이터 조회"""
@@ -595,30 +1034,49 @@ class SupabaseClient:
     
     def save_trade(self, trader_id: int, trade_data: Dict) -> bool:
         """거래 내역 저장"""
-        try:
-            trade_record = {
-                'trader_id': trader_id,
-                **trade_data,
-                'created_at': self._datetime_to_string(datetime.now())
-            }
-            
-            # executed_at이 datetime 객체인 경우 변환
-            if 'executed_at' in trade_record and isinstance(trade_record['executed_at'], datetime):
-                trade_record['executed_at'] = self._datetime_to_string(trade_record['executed_at'])
-            
-            response = self.client.table('trades').insert(trade_record).execute()
-            return len(response.data) > 0
+        return self.make_trade_writer(trader_id)(trade_data)
+    
+    def make_trade_writer(self, trader_id: int) -> Callable[[Dict], bool]:
+        """
+        트레이더 전용 거래 내역 저장 함수 생성
+        
+        trader_id를 미리 묶어 둔 함수를 반환하며, trader_id별로 한 번만 만들어 재사용한다.
+        
+        Args:
+            trader_id: 트레이더 ID
             
-        except Exception as e:
-            logger.error(f"거래 내역 저장 중 에러: {e}")
-            return False
+        Returns:
+            거래 데이터를 받아 저장 성공 여부를 반환하는 함수
+        """
+        writer = self._trade_writers.get(trader_id)
+        if writer is not None:
+            return writer
+        
+        def write_trade(trade_data: Dict) -> bool:
+            try:
+                # created_at은 DB 기본값(NOW())으로 채움
+                trade_record = {'trader_id': trader_id, **trade_data}
+                
+                # executed_at이 datetime 객체인 경우 변환
+                executed_at = trade_record.get('executed_at')
+                if isinstance(executed_at, datetime):
+                    trade_record['executed_at'] = _iso_timestamp(executed_at)
+                
+                response = self.client.table('trades').insert(trade_record).execute()
+                return len(response.data) > 0
+                
+            except Exception as e:
+                logger.error(f"거래 내역 저장 중 에러: {e}")
+                return False
+        
+        return self._trade_writers.setdefault(trader_id, write_trade)
     
     def update_trader_pnl(self, trader_id: int, total_pnl: float) -> bool:
         """트레이더 총 손익 업데이트"""
         try:
+            # updated_at은 DB 트리거(trg_traders_updated_at)가 갱신
             response = self.client.table('traders').update({
-                'total_pnl': total_pnl,
-                'updated_at': self._datetime_to_string(datetime.now())
+                'total_pnl': total_pnl
             }).eq('id', trader_id).execute()
             
             return len(response.data) > 0
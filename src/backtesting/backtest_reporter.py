@@ -5,21 +5,128 @@
 """
 
 import os
-import tempfile
-import base64
+import types
+import threading
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 
 from src.utils.logger import get_logger
 from src.api.slack_client import SlackClient
 from src.backtesting.backtester import BacktestResult
-from src.backtesting.performance_analyzer import PerformanceAnalyzer
+
+# PerformanceAnalyzer는 matplotlib까지 끌어오므로 처음 분석할 때 임포트
+# (send_quick_summary처럼 분석이 필요 없는 경로는 임포트 비용이 없음)
+
+try:
+    from numba import njit
+except ImportError:  # pandas-ta 경유로 설치되지만 없을 때도 동작하도록
+    njit = None
 
 logger = get_logger(__name__)
 
+# 누락된 지표 묶음에 쓰는 읽기 전용 빈 매핑 (호출마다 {} 를 만들지 않음)
+_EMPTY = types.MappingProxyType({})
+
+# 리포트 섹션 텍스트 템플릿 (format_map으로 채움)
+_PROFIT_TPL = (
+    "*📈 수익성*\n"
+    "• 총 수익률: *{return_pct:.2f}%*\n"
+    "• 연환산 수익률: {annual:.2f}%\n"
+    "• 최종 자본: ${final:,.2f}\n"
+    "• 총 수익: ${total:,.2f}"
+)
+_TRADE_TPL = (
+    "*⚡ 거래 통계*\n"
+    "• 총 거래: {total_trades}회\n"
+    "• 승률: {win_rate:.1f}% ({winning_trades}승 {losing_trades}패)\n"
+    "• 평균 수익: ${avg_win:.2f}\n"
+    "• 평균 손실: ${avg_loss:.2f}\n"
+    "• Profit Factor: {profit_factor}"
+)
+_RISK_TPL = (
+    "*⚠️ 리스크 지표*\n"
+    "• 최대 낙폭: {max_drawdown_pct:.2f}%\n"
+    "• 변동성: {volatility:.2f}%\n"
+    "• 샤프 비율: {sharpe_ratio:.3f}\n"
+    "• 칼마 비율: {calmar_ratio:.3f}\n"
+    "• 소르티노 비율: {sortino_ratio:.3f}"
+)
+_COMPARISON_ROW_TPL = (
+    "{rank_emoji} *{strategy}*\n"
+    "{return_emoji} 총 수익률: *{return_pct:.2f}%*\n"
+    "• 연환산: {annual_return:.2f}%\n"
+    "• 최대낙폭: {max_dd:.2f}%\n"
+    "• 샤프비율: {sharpe:.3f}\n"
+    "• 승률: {win_rate:.1f}% ({total_trades}회)"
+)
+
+def _comparison_dtype(name_len: int) -> np.dtype:
+    """전략 비교 테이블의 구조화 배열 dtype"""
+    return np.dtype([
+        ('strategy', f'U{max(name_len, 1)}'),
+        ('return_pct', 'f8'),
+        ('annual_return', 'f8'),
+        ('max_dd', 'f8'),
+        ('sharpe', 'f8'),
+        ('win_rate', 'f8'),
+        ('total_trades', 'i8'),
+        ('profit_factor', 'f8')
+    ])
+
+# 월별 수익률 분류 코드 → 이모지
+_MONTH_EMOJI = {1: "📈", -1: "📉", 0: "➖"}
+
+def _classify_py(arr: np.ndarray) -> np.ndarray:
+    """수익률 부호 분류 (1: 상승, -1: 하락, 0: 보합)"""
+    return (arr > 0).astype(np.int8) - (arr < 0).astype(np.int8)
+
+if njit is not None:
+    @njit(cache=True)
+    def _classify(arr):
+        out = np.empty(arr.shape[0], dtype=np.int8)
+        for i in range(arr.shape[0]):
+            out[i] = 1 if arr[i] > 0 else (-1 if arr[i] < 0 else 0)
+        return out
+    
+    # 첫 리포트에서 JIT 컴파일 비용이 들지 않도록 임포트 시 예열
+    try:
+        _classify(np.zeros(1, dtype=np.float64))
+    except Exception:
+        _classify = _classify_py
+else:
+    _classify = _classify_py
+
+def _format_profit_factor(value) -> str:
+    """Profit Factor 표시 (손실 거래가 없어 NaN이면 Inf)"""
+    if isinstance(value, float) and np.isnan(value):
+        return 'Inf'
+    return str(value)
+
+def _b64_decoded_len(data: str) -> int:
+    """base64 문자열을 디코딩하지 않고 원본 바이트 길이 계산"""
+    return (len(data.rstrip('=')) * 3) // 4
+
 class BacktestReporter:
     """백테스트 결과 리포터"""
     
+    # 차트 전송 순서 (차트 키, 제목)
+    CHART_ORDER = (
+        ('equity_curve', '📈 자본 곡선'),
+        ('drawdown', '📉 낙폭 분석'),
+        ('trade_analysis', '📊 거래 분석'),
+        ('monthly_heatmap', '🗓️ 월별 수익률')
+    )
+    
+    # 메시지당 블록 수 (Slack 제한 50개보다 여유 있게)
+    MAX_BLOCKS_PER_MESSAGE = 45
+    
+    # 상세 리포트 파일에 한 번에 기록할 줄 수
+    DETAIL_WRITE_BATCH = 4096
+    
     def __init__(self, slack_client: Optional[SlackClient] = None):
         """
         리포터 초기화
@@ -28,7 +135,12 @@ class BacktestReporter:
             slack_client: SlackClient 인스턴스 (None이면 자동 생성)
         """
         self.slack_client = slack_client
-        self.analyzer = PerformanceAnalyzer()
+        self._analyzer = None
+        self._analyzer_lock = threading.Lock()
+        
+        # 매 리포트마다 같은 모양인 Slack 블록 템플릿
+        self._divider = {"type": "divider"}
+        self._header_tpl = ("header", "plain_text")
         
         # Slack 클라이언트가 없으면 생성
         if not self.slack_client:
@@ -40,6 +152,16 @@ class BacktestReporter:
         
         logger.info("BacktestReporter 초기화 완료")
     
+    @property
+    def analyzer(self):
+        """성과 분석기 (첫 접근 시 생성)"""
+        if self._analyzer is None:
+            with self._analyzer_lock:
+                if self._analyzer is None:
+                    from src.backtesting.performance_analyzer import PerformanceAnalyzer
+                    self._analyzer = PerformanceAnalyzer()
+        return self._analyzer
+    
     def send_backtest_report(self, result: BacktestResult, 
                            include_charts: bool = True, 
                            channel: Optional[str] = None) -> bool:
@@ -59,43 +181,122 @@ class BacktestReporter:
                 logger.error("Slack 클라이언트가 없어서 리포트 전송 불가")
                 return False
             
-            logger.info(f"백테스트 리포트 전송 시작 - {result.strategy_name}")
+            # 성과 분석 수행 (차트를 보내지 않으면 렌더링도 생략)
+            analysis = self._analyze(result, include_charts)
             
-            # 성과 분석 수행
-            analysis = self.analyzer.analyze_performance(result)
-            
-            # 메인 리포트 메시지 생성
-            message_blocks = self._create_main_report_blocks(result, analysis)
-            
-            # 메인 리포트 전송
-            success = self.slack_client.send_message(
-                text=f"📊 백테스트 결과: {result.strategy_name}",
-                blocks=message_blocks,
-                channel=channel
-            )
-            
-            if not success:
-                logger.error("메인 리포트 전송 실패")
-                return False
-            
-            # 차트 전송 (옵션)
-            if include_charts:
-                self._send_charts(analysis.get('charts', {}), result, channel)
-            
-            logger.info("백테스트 리포트 전송 완료")
-            return True
+            return self._send_report(result, analysis, include_charts, channel)
             
         except Exception as e:
             logger.error(f"백테스트 리포트 전송 실패: {e}")
             return False
     
+    def send_and_save(self, result: BacktestResult, filepath: str,
+                      include_charts: bool = True,
+                      channel: Optional[str] = None) -> Tuple[bool, bool, Dict]:
+        """
+        백테스트 결과를 Slack으로 전송하고 상세 리포트를 파일로 저장
+        
+        성과 분석을 한 번만 수행해 전송과 저장에 함께 사용하므로,
+        전송 후 저장까지 하는 CLI 파이프라인에서는 이 메서드를 사용
+        
+        Args:
+            result: BacktestResult 객체
+            filepath: 저장할 파일 경로
+            include_charts: 차트 포함 여부
+            channel: 전송할 채널 (None이면 기본 채널)
+            
+        Returns:
+            (전송 성공 여부, 저장 성공 여부, 분석 결과). 분석에 실패하면 (False, False, {})
+        """
+        try:
+            analysis = self._analyze(result, include_charts)
+        except Exception as e:
+            logger.error(f"백테스트 성과 분석 실패: {e}")
+            return False, False, {}
+        
+        sent = False
+        if self.slack_client:
+            try:
+                sent = self._send_report(result, analysis, include_charts, channel)
+            except Exception as e:
+                logger.error(f"백테스트 리포트 전송 실패: {e}")
+        else:
+            logger.error("Slack 클라이언트가 없어서 리포트 전송 불가")
+        
+        saved = self.save_detailed_report(result, analysis, filepath)
+        return sent, saved, analysis
+    
+    def _send_report(self, result: BacktestResult, analysis: Dict,
+                     include_charts: bool, channel: Optional[str]) -> bool:
+        """분석 결과로 메인 리포트와 차트 전송"""
+        logger.info(f"백테스트 리포트 전송 시작 - {result.strategy_name}")
+        
+        # 메인 리포트 메시지 생성
+        message_blocks = self._create_main_report_blocks(result, analysis)
+        
+        # 메인 리포트 전송
+        success = self.slack_client.send_message(
+            text=f"📊 백테스트 결과: {result.strategy_name}",
+            blocks=message_blocks,
+            channel=channel
+        )
+        
+        if not success:
+            logger.error("메인 리포트 전송 실패")
+            return False
+        
+        # 차트 전송 (옵션, 분석 데이터가 없으면 생략)
+        if include_charts and self._has_metrics(analysis):
+            self._send_charts(analysis.get('charts', {}), result, channel)
+        
+        logger.info("백테스트 리포트 전송 완료")
+        return True
+    
+    def _analyze(self, result: BacktestResult, include_charts: bool = True) -> Dict:
+        """
+        성과 분석 (같은 BacktestResult 객체의 재분석은 PerformanceAnalyzer 캐시가 처리)
+        
+        Args:
+            result: BacktestResult 객체
+            include_charts: 차트 생성 여부 (False면 charts가 빈 딕셔너리)
+            
+        Returns:
+            분석 결과 딕셔너리
+        """
+        return self.analyzer.analyze_performance(result, include_charts=include_charts)
+    
+    def _header_block(self, text: str) -> Dict:
+        """헤더 블록 생성"""
+        block_type, text_type = self._header_tpl
+        return {"type": block_type, "text": {"type": text_type, "text": text}}
+    
+    @staticmethod
+    def _has_metrics(analysis: Dict) -> bool:
+        """분석 결과에 리포트할 지표가 하나라도 있는지 확인"""
+        return any(analysis.get(key) for key in ('basic_metrics', 'risk_metrics', 'trade_analysis'))
+    
     def _create_main_report_blocks(self, result: BacktestResult, analysis: Dict) -> List[Dict]:
         """메인 리포트 블록 생성"""
         try:
-            basic = analysis.get('basic_metrics', {})
-            risk = analysis.get('risk_metrics', {})
-            trade = analysis.get('trade_analysis', {})
-            monthly = analysis.get('monthly_returns', {})
+            # 분석 데이터가 없으면 0으로 채운 리포트 대신 간단한 경고만 전송
+            if not self._has_metrics(analysis):
+                return [{
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"⚠️ 분석 데이터 없음: {result.strategy_name}"
+                    }
+                }]
+            
+            basic = analysis.get('basic_metrics') or _EMPTY
+            risk = analysis.get('risk_metrics') or _EMPTY
+            trade = analysis.get('trade_analysis') or _EMPTY
+            monthly = analysis.get('monthly_returns') or _EMPTY
+            
+            # 리포트당 한 번만 포맷
+            now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            start_str = result.start_date.strftime('%Y-%m-%d')
+            end_str = result.end_date.strftime('%Y-%m-%d')
             
             # 수익률에 따른 이모지
             return_pct = basic.get('total_return_pct', 0)
@@ -103,13 +304,7 @@ class BacktestReporter:
             
             blocks = [
                 # 헤더
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": f"{emoji} 백테스트 결과 리포트"
-                    }
-                },
+                self._header_block(f"{emoji} 백테스트 결과 리포트"),
                 
                 # 기본 정보
                 {
@@ -134,18 +329,19 @@ class BacktestReporter:
                     ]
                 },
                 
-                {"type": "divider"},
+                dict(self._divider),
                 
                 # 수익성 섹션
                 {
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": f"*📈 수익성*\n"
-                               f"• 총 수익률: *{return_pct:.2f}%*\n"
-                               f"• 연환산 수익률: {basic.get('annual_return', 0):.2f}%\n"
-                               f"• 최종 자본: ${basic.get('final_capital', 0):,.2f}\n"
-                               f"• 총 수익: ${basic.get('total_return', 0):,.2f}"
+                        "text": _PROFIT_TPL.format_map({
+                            "return_pct": return_pct,
+                            "annual": basic.get('annual_return', 0),
+                            "final": basic.get('final_capital', 0),
+                            "total": basic.get('total_return', 0)
+                        })
                     }
                 },
                 
@@ -154,12 +350,15 @@ class BacktestReporter:
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": f"*⚡ 거래 통계*\n"
-                               f"• 총 거래: {trade.get('total_trades', 0)}회\n"
-                               f"• 승률: {trade.get('win_rate', 0):.1f}% ({trade.get('winning_trades', 0)}승 {trade.get('losing_trades', 0)}패)\n"
-                               f"• 평균 수익: ${trade.get('avg_win', 0):.2f}\n"
-                               f"• 평균 손실: ${trade.get('avg_loss', 0):.2f}\n"
-                               f"• Profit Factor: {trade.get('profit_factor', 'N/A')}"
+                        "text": _TRADE_TPL.format_map({
+                            "total_trades": trade.get('total_trades', 0),
+                            "win_rate": trade.get('win_rate', 0),
+                            "winning_trades": trade.get('winning_trades', 0),
+                            "losing_trades": trade.get('losing_trades', 0),
+                            "avg_win": trade.get('avg_win', 0),
+                            "avg_loss": trade.get('avg_loss', 0),
+                            "profit_factor": _format_profit_factor(trade.get('profit_factor', 'N/A'))
+                        })
                     }
                 },
                 
@@ -168,26 +367,32 @@ class BacktestReporter:
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": f"*⚠️ 리스크 지표*\n"
-                               f"• 최대 낙폭: {risk.get('max_drawdown_pct', 0):.2f}%\n"
-                               f"• 변동성: {risk.get('volatility', 0):.2f}%\n"
-                               f"• 샤프 비율: {risk.get('sharpe_ratio', 0):.3f}\n"
-                               f"• 칼마 비율: {risk.get('calmar_ratio', 0):.3f}\n"
-                               f"• 소르티노 비율: {risk.get('sortino_ratio', 0):.3f}"
+                        "text": _RISK_TPL.format_map({
+                            "max_drawdown_pct": risk.get('max_drawdown_pct', 0),
+                            "volatility": risk.get('volatility', 0),
+                            "sharpe_ratio": risk.get('sharpe_ratio', 0),
+                            "calmar_ratio": risk.get('calmar_ratio', 0),
+                            "sortino_ratio": risk.get('sortino_ratio', 0)
+                        })
                     }
                 }
             ]
             
             # 월별 성과가 있으면 추가
             if monthly:
-                monthly_text = ""
-                for month, ret in list(monthly.get('monthly_returns', {}).items())[-6:]:  # 최근 6개월만
-                    emoji_month = "📈" if ret > 0 else "📉" if ret < 0 else "➖"
-                    monthly_text += f"• {month}: {emoji_month} {ret:.1f}%\n"
+                # 최근 6개월만 (전체 목록을 만들지 않고 뒤에서부터 6개)
+                monthly_items = (monthly.get('monthly_returns') or _EMPTY).items()
+                recent = list(islice(reversed(monthly_items), 6))[::-1]
+                rets = np.asarray([ret for _, ret in recent], dtype=np.float64)
+                codes = _classify(rets)
+                monthly_text = "".join(
+                    f"• {month}: {_MONTH_EMOJI[int(code)]} {ret:.1f}%\n"
+                    for (month, _), ret, code in zip(recent, rets, codes)
+                )
                 
                 if monthly_text:
                     blocks.extend([
-                        {"type": "divider"},
+                        dict(self._divider),
                         {
                             "type": "section",
                             "text": {
@@ -199,14 +404,14 @@ class BacktestReporter:
             
             # 추가 정보
             blocks.extend([
-                {"type": "divider"},
+                dict(self._divider),
                 {
                     "type": "context",
                     "elements": [
                         {
                             "type": "mrkdwn",
-                            "text": f"백테스트 완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
-                                   f"데이터 기간: {result.start_date.strftime('%Y-%m-%d')} ~ {result.end_date.strftime('%Y-%m-%d')}"
+                            "text": f"백테스트 완료 시간: {now_str} | "
+                                   f"데이터 기간: {start_str} ~ {end_str}"
                         }
                     ]
                 }
@@ -225,18 +430,27 @@ class BacktestReporter:
                 logger.info("전송할 차트가 없습니다")
                 return
             
-            # 차트 순서 정의
-            chart_order = [
-                ('equity_curve', '📈 자본 곡선'),
-                ('drawdown', '📉 낙폭 분석'),
-                ('trade_analysis', '📊 거래 분석'),
-                ('monthly_heatmap', '🗓️ 월별 수익률')
+            tasks = [
+                (chart_data, chart_title)
+                for chart_key, chart_title in self.CHART_ORDER
+                if (chart_data := charts.get(chart_key))
             ]
             
-            for chart_key, chart_title in chart_order:
-                chart_data = charts.get(chart_key)
-                if chart_data:
-                    self._send_single_chart(chart_data, chart_title, result, channel)
+            if not tasks:
+                return
+            
+            # 차트별 전송은 서로 독립적인 HTTP 요청이므로 동시 전송
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                future_to_title = {
+                    executor.submit(self._send_single_chart, chart_data, chart_title, result, channel): chart_title
+                    for chart_data, chart_title in tasks
+                }
+                
+                for future in as_completed(future_to_title):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"차트 전송 작업 실패 ({future_to_title[future]}): {e}")
             
         except Exception as e:
             logger.error(f"차트 전송 실패: {e}")
@@ -248,41 +462,27 @@ class BacktestReporter:
             if not chart_base64:
                 return
             
-            # Base64를 이미지 파일로 변환
-            image_data = base64.b64decode(chart_base64)
-            
-            # 임시 파일 생성
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
-                temp_file.write(image_data)
-                temp_file_path = temp_file.name
-            
-            try:
-                # Slack 파일 업로드 (현재는 메시지로 대체)
-                # 실제 구현에서는 Slack Files API를 사용해야 함
-                
-                # 차트 정보를 텍스트 메시지로 전송 (임시)
-                self.slack_client.send_message(
-                    text=f"{title} - {result.strategy_name}",
-                    blocks=[
-                        {
-                            "type": "section",
-                            "text": {
-                                "type": "mrkdwn",
-                                "text": f"*{title}*\n차트가 생성되었습니다 (이미지 파일: {len(image_data)} bytes)"
-                            }
+            # Slack 파일 업로드 (현재는 메시지로 대체)
+            # 실제 구현에서는 base64를 디코딩해 io.BytesIO로 Slack Files API에 전달
+            # (files_upload_v2(file=io.BytesIO(base64.b64decode(chart_base64)), ...))
+            # 지금은 크기만 필요하므로 디코딩하지 않고 길이로 계산
+            
+            # 차트 정보를 텍스트 메시지로 전송 (임시)
+            self.slack_client.send_message(
+                text=f"{title} - {result.strategy_name}",
+                blocks=[
+                    {
+                        "type": "section",
+                        "text": {
+                            "type": "mrkdwn",
+                            "text": f"*{title}*\n차트가 생성되었습니다 (이미지 파일: {_b64_decoded_len(chart_base64)} bytes)"
                         }
-                    ],
-                    channel=channel
-                )
-                
-                logger.info(f"차트 정보 전송 완료: {title}")
-                
-            finally:
-                # 임시 파일 삭제
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
+                    }
+                ],
+                channel=channel
+            )
+            
+            logger.info(f"차트 정보 전송 완료: {title}")
             
         except Exception as e:
             logger.error(f"개별 차트 전송 실패 ({title}): {e}")
@@ -313,12 +513,28 @@ class BacktestReporter:
             # 비교 테이블 생성
             comparison_blocks = self._create_comparison_blocks(results)
             
-            # 비교 리포트 전송
-            success = self.slack_client.send_message(
-                text=f"⚖️ 전략 비교 리포트 ({len(results)}개 전략)",
-                blocks=comparison_blocks,
-                channel=channel
-            )
+            # 블록 제한을 넘으면 여러 메시지로 나눠 순서대로 전송
+            # (마지막 context 블록은 자연히 마지막 조각에 포함)
+            step = self.MAX_BLOCKS_PER_MESSAGE
+            chunks = [comparison_blocks[i:i + step] for i in range(0, len(comparison_blocks), step)]
+            text = f"⚖️ 전략 비교 리포트 ({len(results)}개 전략)"
+            
+            if len(chunks) <= 1:
+                success = self.slack_client.send_message(
+                    text=text,
+                    blocks=comparison_blocks,
+                    channel=channel
+                )
+            else:
+                # 동시에 보내면 채널에 [i/n] 순서가 뒤섞이므로 하나씩 보내고, 실패하면 중단
+                success = all(
+                    self.slack_client.send_message(
+                        text=f"{text} [{i}/{len(chunks)}]",
+                        blocks=chunk,
+                        channel=channel
+                    )
+                    for i, chunk in enumerate(chunks, 1)
+                )
             
             if success:
                 logger.info("전략 비교 리포트 전송 완료")
@@ -334,42 +550,42 @@ class BacktestReporter:
     def _create_comparison_blocks(self, results: List[BacktestResult]) -> List[Dict]:
         """전략 비교 블록 생성"""
         try:
+            now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            
             blocks = [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": f"⚖️ 전략 비교 리포트 ({len(results)}개)"
-                    }
-                }
+                self._header_block(f"⚖️ 전략 비교 리포트 ({len(results)}개)")
             ]
             
-            # 각 전략별 분석
-            analyses = []
-            for result in results:
-                analysis = self.analyzer.analyze_performance(result)
-                analyses.append((result, analysis))
-            
-            # 비교 테이블 생성
-            comparison_data = []
-            for result, analysis in analyses:
-                basic = analysis.get('basic_metrics', {})
-                risk = analysis.get('risk_metrics', {})
-                trade = analysis.get('trade_analysis', {})
+            # 각 전략별 분석 (전략 간 독립적이므로 병렬 처리, map이 입력 순서 유지)
+            # 비교 리포트는 지표 표만 보내므로 차트는 생성하지 않음
+            max_workers = min(len(results), os.cpu_count() or 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                analyses = list(zip(results, executor.map(
+                    lambda result: self._analyze(result, include_charts=False), results
+                )))
+            
+            # 비교 테이블 생성 (필드별로 연속 배치되는 구조화 배열)
+            name_len = max(len(result.strategy_name) for result in results)
+            comparison_data = np.empty(len(analyses), dtype=_comparison_dtype(name_len))
+            for idx, (result, analysis) in enumerate(analyses):
+                basic = analysis.get('basic_metrics') or _EMPTY
+                risk = analysis.get('risk_metrics') or _EMPTY
+                trade = analysis.get('trade_analysis') or _EMPTY
                 
-                comparison_data.append({
-                    'strategy': result.strategy_name,
-                    'return_pct': basic.get('total_return_pct', 0),
-                    'annual_return': basic.get('annual_return', 0),
-                    'max_dd': risk.get('max_drawdown_pct', 0),
-                    'sharpe': risk.get('sharpe_ratio', 0),
-                    'win_rate': trade.get('win_rate', 0),
-                    'total_trades': trade.get('total_trades', 0),
-                    'profit_factor': trade.get('profit_factor', 0)
-                })
+                comparison_data[idx] = (
+                    result.strategy_name,
+                    basic.get('total_return_pct', 0),
+                    basic.get('annual_return', 0),
+                    risk.get('max_drawdown_pct', 0),
+                    risk.get('sharpe_ratio', 0),
+                    trade.get('win_rate', 0),
+                    trade.get('total_trades', 0),
+                    trade.get('profit_factor', 0)  # 손실 거래가 없으면 NaN
+                )
             
-            # 성과 순으로 정렬
-            comparison_data.sort(key=lambda x: x['return_pct'], reverse=True)
+            # 성과 순으로 정렬 (동률이면 입력 순서 유지)
+            comparison_data = comparison_data[np.argsort(-comparison_data['return_pct'], kind='stable')]
+            fields = comparison_data.dtype.names
             
             # 헤더 추가
             blocks.append({
@@ -381,7 +597,8 @@ class BacktestReporter:
             })
             
             # 각 전략 정보 추가
-            for i, data in enumerate(comparison_data):
+            for i, row in enumerate(comparison_data):
+                data = dict(zip(fields, row.item()))
                 rank_emoji = ["🥇", "🥈", "🥉"][i] if i < 3 else f"{i+1}️⃣"
                 return_emoji = "📈" if data['return_pct'] > 0 else "📉" if data['return_pct'] < 0 else "➖"
                 
@@ -389,25 +606,25 @@ class BacktestReporter:
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": f"{rank_emoji} *{data['strategy']}*\n"
-                               f"{return_emoji} 총 수익률: *{data['return_pct']:.2f}%*\n"
-                               f"• 연환산: {data['annual_return']:.2f}%\n"
-                               f"• 최대낙폭: {data['max_dd']:.2f}%\n"
-                               f"• 샤프비율: {data['sharpe']:.3f}\n"
-                               f"• 승률: {data['win_rate']:.1f}% ({data['total_trades']}회)"
+                        "text": _COMPARISON_ROW_TPL.format_map({
+                            **data,
+                            "rank_emoji": rank_emoji,
+                            "return_emoji": return_emoji
+                        })
                     }
                 })
                 
                 if i < len(comparison_data) - 1:  # 마지막이 아니면 구분선 추가
-                    blocks.append({"type": "divider"})
+                    blocks.append(dict(self._divider))
             
             # 요약 통계 추가
-            avg_return = sum(d['return_pct'] for d in comparison_data) / len(comparison_data)
-            best_strategy = comparison_data[0]
-            worst_strategy = comparison_data[-1]
+            returns = comparison_data['return_pct']
+            avg_return = float(returns.mean())
+            best_strategy = comparison_data[int(returns.argmax())]
+            worst_strategy = comparison_data[int(returns.argmin())]
             
             blocks.extend([
-                {"type": "divider"},
+                dict(self._divider),
                 {
                     "type": "section",
                     "text": {
@@ -424,7 +641,7 @@ class BacktestReporter:
                     "elements": [
                         {
                             "type": "mrkdwn",
-                            "text": f"비교 리포트 생성: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                            "text": f"비교 리포트 생성: {now_str}"
                         }
                     ]
                 }
@@ -480,6 +697,45 @@ class BacktestReporter:
             logger.error(f"백테스트 요약 전송 실패: {e}")
             return False
     
+    def _iter_detail_lines(self, result: BacktestResult):
+        """
+        상세 리포트의 거래 내역 / 자본 곡선 줄 생성
+        
+        Args:
+            result: BacktestResult 객체
+            
+        Yields:
+            리포트 한 줄 (줄바꿈 미포함)
+        """
+        # 거래 내역
+        if result.trades:
+            yield "\n\n📋 **거래 내역**"
+            yield "=" * 50
+            
+            for i, trade in enumerate(result.trades, 1):
+                yield (
+                    f"{i}. {trade.timestamp:%Y-%m-%d %H:%M} | "
+                    f"{trade.action} {trade.position_side} | "
+                    f"${trade.price:.2f} | {trade.quantity:.6f} | "
+                    f"{trade.trade_type}"
+                )
+        
+        # 자본 곡선 데이터
+        if not result.equity_curve.empty:
+            yield "\n\n📊 **자본 곡선 (마지막 10개)**"
+            yield "=" * 50
+            
+            last_10 = result.equity_curve.tail(10)
+            positions = last_10['position'] if 'position' in last_10 else pd.Series('None', index=last_10.index)
+            
+            # 행 단위 루프 대신 컬럼 단위 문자열 연산으로 포맷팅
+            formatted = (
+                last_10['timestamp'].map(str) + " | $" +
+                last_10['total_value'].map("{:.2f}".format) + " | 포지션: " +
+                positions.map(str)
+            )
+            yield from formatted
+    
     def save_detailed_report(self, result: BacktestResult, 
                            analysis: Dict, filepath: str) -> bool:
         """
@@ -497,40 +753,25 @@ class BacktestReporter:
             # 상세 리포트 텍스트 생성
             report_text = self.analyzer.generate_summary_report(result, analysis)
             
-            # 추가 상세 정보
-            detailed_sections = []
-            
-            # 거래 내역
-            if result.trades:
-                detailed_sections.append("\n\n📋 **거래 내역**")
-                detailed_sections.append("=" * 50)
+            # 파일 저장 (상세 내역은 전체 문자열을 만들지 않고 묶음 단위로 기록)
+            with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(report_text)
                 
-                for i, trade in enumerate(result.trades, 1):
-                    detailed_sections.append(
-                        f"{i}. {trade.timestamp.strftime('%Y-%m-%d %H:%M')} | "
-                        f"{trade.action} {trade.position_side} | "
-                        f"${trade.price:.2f} | {trade.quantity:.6f} | "
-                        f"{trade.trade_type}"
-                    )
-            
-            # 자본 곡선 데이터
-            if not result.equity_curve.empty:
-                detailed_sections.append("\n\n📊 **자본 곡선 (마지막 10개)**")
-                detailed_sections.append("=" * 50)
+                buf = []
+                written = False
+                for line in self._iter_detail_lines(result):
+                    buf.append(line)
+                    if len(buf) >= self.DETAIL_WRITE_BATCH:
+                        if written:
+                            f.write("\n")
+                        f.write("\n".join(buf))
+                        buf.clear()
+                        written = True
                 
-                last_10 = result.equity_curve.tail(10)
-                for _, row in last_10.iterrows():
-                    detailed_sections.append(
-                        f"{row['timestamp']} | ${row['total_value']:.2f} | "
-                        f"포지션: {row.get('position', 'None')}"
-                    )
-            
-            # 전체 리포트 조합
-            full_report = report_text + "\n".join(detailed_sections)
-            
-            # 파일 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(full_report)
+                if buf:
+                    if written:
+                        f.write("\n")
+                    f.write("\n".join(buf))
             
             logger.info(f"상세 리포트 저장 완료: {filepath}")
             return True
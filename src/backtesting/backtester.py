@@ -4,17 +4,45 @@
 파일 위치: src/backtesting/backtester.py
 """
 
+import hashlib
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from src.utils.logger import get_logger
+from src.strategies.signals import (
+    SIGNAL_ENTRY_LONG, SIGNAL_ENTRY_SHORT, SIGNAL_EXIT_LONG, SIGNAL_EXIT_SHORT
+)
+
+try:
+    from numba import njit
+except ImportError:  # pandas-ta 경유로 설치되지만 없을 때도 동작하도록
+    njit = None
 
 logger = get_logger(__name__)
 
-@dataclass
+# 시뮬레이션 거래 기록 종류
+_TRADE_ENTRY = 0
+_TRADE_EXIT = 1
+_TRADE_EXIT_END = 2
+
+# 자본 곡선의 포지션 컬럼 인코딩 (None=0, LONG=1, SHORT=-1)
+_POSITION_CODES = {None: 0, 'LONG': 1, 'SHORT': -1}
+_POSITION_LABELS = np.array([None, 'LONG', 'SHORT'], dtype=object)  # 코드로 인덱싱 (-1 → SHORT)
+
+# 자본 곡선 구조화 배열 dtype (position은 _POSITION_CODES 코드)
+EQUITY_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[ns]'),
+    ('capital', 'f8'),
+    ('unrealized_pnl', 'f8'),
+    ('total_value', 'f8'),
+    ('position', 'i1'),
+])
+
+@dataclass(slots=True)
 class BacktestTrade:
     """백테스트 거래 기록"""
     timestamp: datetime
@@ -25,7 +53,7 @@ class BacktestTrade:
     trade_type: str  # 'ENTRY', 'EXIT'
     signal_data: Dict  # 시그널 생성 시 데이터
 
-@dataclass
+@dataclass(slots=True)
 class BacktestPosition:
     """백테스트 포지션"""
     side: str  # 'LONG', 'SHORT'
@@ -34,9 +62,9 @@ class BacktestPosition:
     quantity: float
     unrealized_pnl: float = 0.0
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class BacktestResult:
-    """백테스트 결과"""
+    """백테스트 결과 (리포터의 분석 캐시가 약한 참조를 쓰므로 weakref 슬롯 유지)"""
     strategy_name: str
     symbol: str
     start_date: datetime
@@ -56,37 +84,160 @@ class BacktestResult:
     sharpe_ratio: float
     trades: List[BacktestTrade]
     equity_curve: pd.DataFrame
+    # 거래 배열 (trades와 같은 내용을 필드별 배열로, 분석기가 trades를 다시 순회하지 않도록)
+    # 백테스터가 채우며 직접 만든 결과나 trades를 바꾼 결과에서는 None
+    exit_pnls: Optional[np.ndarray] = None         # 청산 거래별 순손익 (float64)
+    entry_timestamps: Optional[np.ndarray] = None  # 진입 시각 (datetime64[ns])
+    exit_timestamps: Optional[np.ndarray] = None   # 청산 시각 (datetime64[ns])
+
+def _simulate_py(prices, signals, initial_capital, commission_rate,
+                 eq_capital, eq_upnl, eq_total, eq_pos,
+                 tr_bar, tr_kind, tr_side, tr_price, tr_qty, tr_pnl):
+    """
+    시그널 배열로 바 단위 손익/자본 곡선 계산 (_process_bar와 같은 규칙)
+    
+    진입은 포지션이 없을 때만, 청산은 보유 방향의 EXIT 플래그일 때만 처리하고
+    마지막 바에서 남은 포지션을 청산한다. 자본 곡선과 거래 내역은 전달받은 배열에 기록.
+    
+    Returns:
+        (최종 자본, 거래 기록 수)
+    """
+    n = prices.shape[0]
+    capital = initial_capital
+    side = 0  # 0: 없음, 1: LONG, -1: SHORT
+    entry_price = 0.0
+    quantity = 0.0
+    n_trades = 0
+    
+    for i in range(n):
+        price = prices[i]
+        flags = signals[i]
+        
+        # 미실현 손익
+        upnl = 0.0
+        if side == 1:
+            upnl = (price - entry_price) * quantity
+        elif side == -1:
+            upnl = (entry_price - price) * quantity
+        
+        if side == 0:
+            new_side = 0
+            if flags & SIGNAL_ENTRY_LONG:
+                new_side = 1
+            elif flags & SIGNAL_ENTRY_SHORT:
+                new_side = -1
+            
+            if new_side != 0:
+                # 현재 자본 100% 투자, 진입 수수료 차감
+                quantity = capital / price
+                capital -= capital * commission_rate
+                entry_price = price
+                side = new_side
+                upnl = 0.0
+                
+                tr_bar[n_trades] = i
+                tr_kind[n_trades] = _TRADE_ENTRY
+                tr_side[n_trades] = side
+                tr_price[n_trades] = price
+                tr_qty[n_trades] = quantity
+                tr_pnl[n_trades] = 0.0
+                n_trades += 1
+        elif (side == 1 and flags & SIGNAL_EXIT_LONG) or (side == -1 and flags & SIGNAL_EXIT_SHORT):
+            net_pnl = upnl - price * quantity * commission_rate
+            capital += net_pnl
+            
+            tr_bar[n_trades] = i
+            tr_kind[n_trades] = _TRADE_EXIT
+            tr_side[n_trades] = side
+            tr_price[n_trades] = price
+            tr_qty[n_trades] = quantity
+            tr_pnl[n_trades] = net_pnl
+            n_trades += 1
+            
+            side = 0
+            upnl = 0.0
+        
+        eq_capital[i] = capital
+        eq_upnl[i] = upnl
+        eq_total[i] = capital + upnl
+        eq_pos[i] = side
+    
+    # 마지막 포지션 청산
+    if side != 0 and n > 0:
+        price = prices[n - 1]
+        if side == 1:
+            pnl = (price - entry_price) * quantity
+        else:
+            pnl = (entry_price - price) * quantity
+        net_pnl = pnl - price * quantity * commission_rate
+        capital += net_pnl
+        
+        tr_bar[n_trades] = n - 1
+        tr_kind[n_trades] = _TRADE_EXIT_END
+        tr_side[n_trades] = side
+        tr_price[n_trades] = price
+        tr_qty[n_trades] = quantity
+        tr_pnl[n_trades] = net_pnl
+        n_trades += 1
+    
+    return capital, n_trades
+
+_simulate = njit(cache=True)(_simulate_py) if njit is not None else _simulate_py
 
 class Backtester:
     """백테스팅 엔진"""
     
-    def __init__(self, initial_capital: float = 10000.0, commission_rate: float = 0.001):
+    # 전략에 전달하는 과거 데이터 길이 (바 개수)
+    LOOKBACK_PERIOD = 100
+    
+    def __init__(self, initial_capital: float = 10000.0, commission_rate: float = 0.001,
+                 signal_cache_size: int = 0, equity_sample_interval: int = 1):
         """
         백테스터 초기화
         
         Args:
             initial_capital: 초기 자본금
             commission_rate: 수수료율 (기본 0.1%)
+            signal_cache_size: generate_signal 결과 캐시 크기 (0이면 비활성).
+                               같은 창/포지션에 항상 같은 시그널을 내는 전략에서만 사용
+            equity_sample_interval: 자본 곡선 기록 간격 (바 단위, 1이면 매 바 기록).
+                                    K로 두면 포지션/자본이 바뀐 바와 K바마다만 기록하고
+                                    결과에서는 빈 바를 직전 값으로 채움 (예: 분봉에 60 → 시간 해상도)
         """
         self.initial_capital = initial_capital
         self.commission_rate = commission_rate
         
+        # 시그널 캐시 {(전략, 포지션, 창 지문): 시그널} - 같은 데이터로 반복 실행할 때 재사용
+        self.signal_cache_size = signal_cache_size
+        self._signal_cache: OrderedDict = OrderedDict()
+        self.signal_cache_hits = 0
+        self.signal_cache_misses = 0
+        
+        # 자본 곡선 기록 간격
+        self.equity_sample_interval = max(1, int(equity_sample_interval))
+        
         # 백테스트 상태
         self.current_capital = initial_capital
         self.current_position = None
-        self.trades = []
-        self.equity_curve = []
+        self._reset_trade_log()
+        self._allocate_equity_curve(0)
         
         logger.info(f"Backtester 초기화 - 초기자본: ${initial_capital}, 수수료: {commission_rate*100}%")
     
-    def run_backtest(self, strategy, market_data: pd.DataFrame, symbol: str = "BTCUSDT") -> BacktestResult:
+    def run_backtest(self, strategy, market_data: pd.DataFrame, symbol: str = "BTCUSDT",
+                     signals: Optional[np.ndarray] = None) -> BacktestResult:
         """
         백테스트 실행
         
         Args:
-            strategy: 전략 객체 (generate_signal 메서드 필요)
-            market_data: 시장 데이터 (OHLCV + 지표)
+            strategy: 전략 객체 (generate_signal 메서드 필요,
+                      generate_signals_batch(market_data)가 있으면 시그널 배열을 한 번에 계산하고
+                      거래가 난 바에서만 generate_signal을 호출해 바 단위 실행과 같은 signal_data 기록)
+            market_data: 시장 데이터 (OHLCV + 지표, 복사하지 않고 읽기 전용으로 사용)
             symbol: 거래 심볼
+            signals: 바별 시그널 비트 플래그 배열 (SIGNAL_* 조합).
+                     주어지면 바마다 전략을 호출하지 않고 배열로 한 번에 시뮬레이션
+                     (이 경우 거래의 signal_data에는 전략 시그널 대신 배열 기준 사유만 기록)
             
         Returns:
             BacktestResult 객체
@@ -101,18 +252,46 @@ class Backtester:
             if not self._validate_market_data(market_data):
                 raise ValueError("시장 데이터가 유효하지 않습니다")
 
+            # 자본 곡선 배열을 바 개수만큼 미리 할당
+            self._allocate_equity_curve(len(market_data))
+            
             # 시장 데이터를 인스턴스 변수로 저장 (중요!)
-            self.market_data = market_data.copy()
+            # 백테스트 중에는 읽기만 하므로 복사하지 않음 (호출자도 실행 중에 수정하지 말 것)
+            self.market_data = market_data
+            
+            # 바마다 iloc으로 행 Series를 만들지 않도록 필요한 컬럼을 배열로 미리 추출
+            self._timestamps = self.market_data['timestamp'].array
+            # (시뮬레이션 커널과 창 슬라이스가 stride 1로 읽도록 C 연속 배열로 고정)
+            self._close = np.ascontiguousarray(self.market_data['close'].to_numpy(dtype=np.float64))
+            
+            # 시그널 캐시용 행 해시 (창 지문은 이 해시 구간으로 계산)
+            if self.signal_cache_size > 0:
+                self._row_hashes = pd.util.hash_pandas_object(self.market_data, index=False).to_numpy()
 
-            # 백테스트 실행
-            for i in range(len(market_data)):
-                current_row = market_data.iloc[i]
-                self._process_bar(strategy, current_row, symbol, i)
+            # 전략이 일괄 시그널 계산을 지원하면 바마다 호출하지 않음
+            # (Mock 등 동적 속성 객체를 거르기 위해 인스턴스가 아닌 클래스에서 확인)
+            signal_source = None
+            if signals is None and callable(getattr(type(strategy), 'generate_signals_batch', None)):
+                signals = strategy.generate_signals_batch(self.market_data)
+                signal_source = (strategy, symbol)
+                logger.info("전략 일괄 시그널 계산 사용")
             
-            # 마지막 포지션 청산
-            if self.current_position:
-                final_price = market_data.iloc[-1]['close']
-                self._close_position(final_price, market_data.iloc[-1]['timestamp'], "BACKTEST_END")
+            # 백테스트 실행
+            if signals is not None:
+                self._run_signal_array(signals, signal_source)
+            else:
+                # 바 처리 중 예외는 백테스트 전체를 중단 (바마다 try를 두지 않음)
+                i = 0
+                try:
+                    for i in range(len(market_data)):
+                        self._process_bar(strategy, symbol, i)
+                except Exception as e:
+                    logger.error(f"바 처리 중 에러 ({i}번째 바, {self._timestamps[i]}): {e}")
+                    raise
+                
+                # 마지막 포지션 청산
+                if self.current_position:
+                    self._close_position(self._close[-1], self._timestamps[-1], "BACKTEST_END")
             
             # 결과 생성
             result = self._generate_result(strategy, market_data, symbol)
@@ -128,8 +307,97 @@ class Backtester:
         """백테스트 상태 초기화"""
         self.current_capital = self.initial_capital
         self.current_position = None
-        self.trades = []
-        self.equity_curve = []
+        self._reset_trade_log()
+        self._allocate_equity_curve(0)
+    
+    def _reset_trade_log(self):
+        """거래 기록 초기화 (필드별 리스트, BacktestTrade는 조회할 때 생성)"""
+        self._trade_ts = []
+        self._trade_actions = []
+        self._trade_sides = []
+        self._trade_prices = []
+        self._trade_qtys = []
+        self._trade_types = []
+        self._trade_signals = []
+        self._exit_pnls = []  # 청산 거래별 순손익 (결과 집계용)
+    
+    def _record_trade(self, timestamp, action: str, side: str, price: float,
+                      quantity: float, trade_type: str, signal_data: Dict):
+        """거래 한 건 기록"""
+        self._trade_ts.append(timestamp)
+        self._trade_actions.append(action)
+        self._trade_sides.append(side)
+        self._trade_prices.append(price)
+        self._trade_qtys.append(quantity)
+        self._trade_types.append(trade_type)
+        self._trade_signals.append(signal_data)
+    
+    @property
+    def trades(self) -> List[BacktestTrade]:
+        """지금까지의 거래 내역 (BacktestTrade 리스트)"""
+        return list(map(
+            BacktestTrade,
+            self._trade_ts, self._trade_actions, self._trade_sides,
+            self._trade_prices, self._trade_qtys, self._trade_types, self._trade_signals
+        ))
+    
+    def _allocate_equity_curve(self, size: int):
+        """자본 곡선 기록용 배열 할당 (바마다 dict를 쌓지 않고 인덱스로 기록)"""
+        self._eq_len = 0
+        self._eq_bar = np.empty(size, dtype=np.int64)  # 기록한 바의 인덱스
+        self._eq_capital = np.empty(size, dtype=np.float64)
+        self._eq_upnl = np.empty(size, dtype=np.float64)
+        self._eq_total = np.empty(size, dtype=np.float64)
+        self._eq_pos = np.empty(size, dtype=np.int8)
+    
+    @property
+    def equity_curve(self) -> List[Dict]:
+        """지금까지 기록된 자본 곡선 (행 딕셔너리 리스트)"""
+        if self._eq_len == 0:
+            return []
+        return self._equity_frame().to_dict('records')
+    
+    @property
+    def equity_array(self) -> np.ndarray:
+        """
+        기록된 자본 곡선을 구조화 배열로 반환 (EQUITY_DTYPE, DataFrame 생성 없음)
+        
+        배열만 필요한 호출자용. DataFrame이 필요하면 pd.DataFrame(arr)로 변환
+        """
+        if self._eq_len == 0:
+            return np.empty(0, dtype=EQUITY_DTYPE)
+        
+        bars, rows = self._equity_rows()
+        arr = np.empty(len(bars), dtype=EQUITY_DTYPE)
+        arr['timestamp'] = self._timestamps[bars].to_numpy(dtype='datetime64[ns]')
+        arr['capital'] = self._eq_capital[rows]
+        arr['unrealized_pnl'] = self._eq_upnl[rows]
+        arr['total_value'] = self._eq_total[rows]
+        arr['position'] = self._eq_pos[rows]
+        return arr
+    
+    def _equity_rows(self):
+        """자본 곡선 바 인덱스와 기록 배열의 행 인덱스 (간격 기록으로 빠진 바는 직전 기록으로 채움)"""
+        n = self._eq_len
+        bars = self._eq_bar[:n]
+        n_bars = bars[-1] + 1
+        if n < n_bars:
+            return np.arange(n_bars), np.searchsorted(bars, np.arange(n_bars), side='right') - 1
+        return bars, slice(0, n)
+    
+    def _equity_frame(self) -> pd.DataFrame:
+        """기록된 자본 곡선 배열로 DataFrame 한 번에 생성"""
+        if self._eq_len == 0:
+            return pd.DataFrame()
+        
+        bars, rows = self._equity_rows()
+        return pd.DataFrame({
+            'timestamp': self._timestamps[bars],
+            'capital': self._eq_capital[rows],
+            'unrealized_pnl': self._eq_upnl[rows],
+            'total_value': self._eq_total[rows],
+            'position': _POSITION_LABELS[self._eq_pos[rows]]
+        })
     
     def _validate_market_data(self, market_data: pd.DataFrame) -> bool:
         """시장 데이터 유효성 검증"""
@@ -146,211 +414,296 @@ class Backtester:
         
         return True
     
-    def _process_bar(self, strategy, current_row: pd.Series, symbol: str, current_index: int):
+    def _process_bar(self, strategy, symbol: str, current_index: int):
         """개별 바 처리 (market_data 전달 추가)"""
-        try:
-            timestamp = current_row['timestamp']
-            current_price = current_row['close']
-            
-            # 미실현 손익 업데이트
-            if self.current_position:
-                self._update_unrealized_pnl(current_price)
-            
-            # 전략용 시장 데이터 준비 (현재 시점까지의 데이터)
-            lookback_period = min(100, current_index + 1)
-            start_idx = max(0, current_index + 1 - lookback_period)
-            
-            # 전략에 전달할 market_data 준비
-            market_data_for_strategy = self.market_data.iloc[start_idx:current_index + 1].copy()
-            
-            # 현재 포지션 정보
-            position_info = self.current_position.side if self.current_position else None
-            
-            # 전략에서 시그널 생성 (market_data 명시적 전달) ← 핵심!
+        # 타임스탬프 객체는 거래가 일어날 때만 꺼냄 (대부분의 바는 필요 없음)
+        current_price = self._close[current_index]
+        
+        # 미실현 손익 업데이트 (속성 조회를 줄이기 위해 포지션을 지역 변수로)
+        pos = self.current_position
+        if pos:
+            self._update_unrealized_pnl(pos, current_price)
+        
+        # 전략에 전달할 market_data 준비 (현재 시점까지 최대 LOOKBACK_PERIOD개)
+        # 순환 버퍼는 시간 순서가 깨지므로 쓰지 않고, 복사 없는 원본 행 구간 뷰를 전달
+        end_idx = current_index + 1
+        market_data_for_strategy = self.market_data.iloc[max(0, end_idx - self.LOOKBACK_PERIOD):end_idx]
+        
+        # 현재 포지션 정보
+        position_info = pos.side if pos else None
+        
+        # 전략에서 시그널 생성 (market_data 명시적 전달) ← 핵심!
+        if self.signal_cache_size > 0:
+            signal = self._cached_signal(
+                strategy, symbol, position_info, market_data_for_strategy,
+                max(0, end_idx - self.LOOKBACK_PERIOD), end_idx
+            )
+        else:
             signal = strategy.generate_signal(
                 symbol=symbol, 
                 current_position=position_info,
                 market_data=market_data_for_strategy
             )
-            
-            # 시그널 처리
-            if signal['signal'] in ['ENTRY_LONG', 'ENTRY_SHORT'] and not self.current_position:
-                self._open_position(signal, current_price, timestamp)
-            elif signal['signal'] in ['EXIT_LONG', 'EXIT_SHORT'] and self.current_position:
-                self._close_position(current_price, timestamp, signal['reason'])
-            
-            # 자본 곡선 기록
-            total_value = self._calculate_total_value(current_price)
-            self.equity_curve.append({
-                'timestamp': timestamp,
-                'capital': self.current_capital,
-                'unrealized_pnl': self.current_position.unrealized_pnl if self.current_position else 0,
-                'total_value': total_value,
-                'position': self.current_position.side if self.current_position else None
-            })
-            
-        except Exception as e:
-            logger.error(f"바 처리 중 에러 ({timestamp}): {e}")
+        
+        # 시그널 처리
+        signal_type = signal['signal']
+        if signal_type in ('ENTRY_LONG', 'ENTRY_SHORT') and not pos:
+            self._open_position(signal, current_price, self._timestamps[current_index])
+            pos = self.current_position
+        elif signal_type in ('EXIT_LONG', 'EXIT_SHORT') and pos:
+            self._close_position(current_price, self._timestamps[current_index], signal['reason'])
+            pos = self.current_position
+        
+        # 자본 곡선 기록
+        cap = self.current_capital
+        if pos:
+            upnl = pos.unrealized_pnl
+            side = pos.side
+        else:
+            upnl = 0.0
+            side = None
+        
+        k = self._eq_len
+        
+        # 간격 기록: 포지션/자본이 그대로인 바는 K바마다만 기록 (빈 바는 결과에서 채움)
+        # (첫 바와 마지막 바는 항상 기록)
+        if (self.equity_sample_interval > 1 and k > 0 and current_index % self.equity_sample_interval
+                and current_index + 1 < len(self._close)):
+            if self._eq_capital[k - 1] == cap and self._eq_pos[k - 1] == _POSITION_CODES[side]:
+                return
+        
+        self._eq_bar[k] = current_index
+        self._eq_capital[k] = cap
+        self._eq_upnl[k] = upnl
+        self._eq_total[k] = cap + upnl
+        self._eq_pos[k] = _POSITION_CODES[side]
+        self._eq_len = k + 1
+    
+    def _run_signal_array(self, signals: np.ndarray, signal_source: Optional[Tuple] = None):
+        """
+        미리 계산된 시그널 배열로 전체 구간을 한 번에 시뮬레이션
+        
+        Args:
+            signals: 바별 시그널 비트 플래그 배열
+            signal_source: 배열을 만든 (전략, 심볼). 주어지면 거래가 난 바에서만
+                           generate_signal을 호출해 바 단위 실행과 같은 signal_data를 기록
+        """
+        n = len(self._close)
+        signals = np.ascontiguousarray(signals, dtype=np.int8)
+        if signals.shape[0] != n:
+            raise ValueError(f"시그널 배열 길이 불일치: {signals.shape[0]} != {n}")
+        
+        # 거래는 바마다 최대 1건 + 마지막 청산 1건
+        tr_bar = np.empty(n + 1, dtype=np.int64)
+        tr_kind = np.empty(n + 1, dtype=np.int8)
+        tr_side = np.empty(n + 1, dtype=np.int8)
+        tr_price = np.empty(n + 1, dtype=np.float64)
+        tr_qty = np.empty(n + 1, dtype=np.float64)
+        tr_pnl = np.empty(n + 1, dtype=np.float64)
+        
+        capital, n_trades = _simulate(
+            self._close, signals, float(self.initial_capital), float(self.commission_rate),
+            self._eq_capital, self._eq_upnl, self._eq_total, self._eq_pos,
+            tr_bar, tr_kind, tr_side, tr_price, tr_qty, tr_pnl
+        )
+        
+        self.current_capital = capital
+        self._eq_bar[:n] = np.arange(n)
+        self._eq_len = n
+        
+        # 거래 기록 생성 (거래 수만큼만 파이썬 객체화)
+        for k in range(n_trades):
+            side = _POSITION_LABELS[tr_side[k]]
+            timestamp = self._timestamps[tr_bar[k]]
+            price = float(tr_price[k])
+            quantity = float(tr_qty[k])
+            
+            if tr_kind[k] == _TRADE_ENTRY:
+                if signal_source is not None:
+                    signal = self._signal_at(*signal_source, int(tr_bar[k]), None)
+                else:
+                    signal = {'signal': f'ENTRY_{side}', 'reason': 'SIGNAL_ARRAY'}
+                self._record_trade(
+                    timestamp, 'BUY' if side == 'LONG' else 'SELL', side, price, quantity, 'ENTRY', signal
+                )
+            else:
+                net_pnl = float(tr_pnl[k])
+                if tr_kind[k] == _TRADE_EXIT_END:
+                    reason = 'BACKTEST_END'
+                elif signal_source is not None:
+                    reason = self._signal_at(*signal_source, int(tr_bar[k]), side)['reason']
+                else:
+                    reason = 'SIGNAL'
+                self._record_trade(
+                    timestamp, 'SELL' if side == 'LONG' else 'BUY', side, price, quantity, 'EXIT',
+                    {'reason': reason, 'pnl': net_pnl}
+                )
+                self._exit_pnls.append(net_pnl)
+    
+    def _signal_at(self, strategy, symbol: str, index: int, position_info: Optional[str]) -> Dict:
+        """바 단위 실행과 같은 창으로 index번째 바의 generate_signal 결과 조회"""
+        end_idx = index + 1
+        return strategy.generate_signal(
+            symbol=symbol,
+            current_position=position_info,
+            market_data=self.market_data.iloc[max(0, end_idx - self.LOOKBACK_PERIOD):end_idx]
+        )
+    
+    def _cached_signal(self, strategy, symbol: str, position_info: Optional[str],
+                       window: pd.DataFrame, start_idx: int, end_idx: int) -> Dict:
+        """창 내용 지문과 포지션으로 generate_signal 결과 캐시 (LRU)"""
+        fingerprint = hashlib.blake2b(
+            self._row_hashes[start_idx:end_idx].tobytes(), digest_size=16
+        ).digest()
+        key = (strategy, symbol, position_info, fingerprint)
+        
+        cached = self._signal_cache.get(key)
+        if cached is not None:
+            self._signal_cache.move_to_end(key)
+            self.signal_cache_hits += 1
+            return cached
+        
+        self.signal_cache_misses += 1
+        signal = strategy.generate_signal(
+            symbol=symbol,
+            current_position=position_info,
+            market_data=window
+        )
+        
+        self._signal_cache[key] = signal
+        if len(self._signal_cache) > self.signal_cache_size:
+            self._signal_cache.popitem(last=False)
+        return signal
     
     def _open_position(self, signal: Dict, price: float, timestamp: datetime):
         """포지션 진입"""
-        try:
-            direction = signal['signal'].split('_')[1]  # 'ENTRY_LONG' -> 'LONG'
-            
-            # 투자 가능 금액 (현재 자본의 100%)
-            investment_amount = self.current_capital
-            
-            # 수량 계산
-            quantity = investment_amount / price
-            
-            # 수수료 차감
-            commission = investment_amount * self.commission_rate
-            self.current_capital -= commission
-            
-            # 포지션 생성
-            self.current_position = BacktestPosition(
-                side=direction,
-                entry_price=price,
-                entry_time=timestamp,
-                quantity=quantity
-            )
-            
-            # 거래 기록
-            action = 'BUY' if direction == 'LONG' else 'SELL'
-            trade = BacktestTrade(
-                timestamp=timestamp,
-                action=action,
-                position_side=direction,
-                price=price,
-                quantity=quantity,
-                trade_type='ENTRY',
-                signal_data=signal
-            )
-            self.trades.append(trade)
-            
-            logger.debug(f"포지션 진입: {direction} {quantity:.6f} @ ${price:.2f}")
-            
-        except Exception as e:
-            logger.error(f"포지션 진입 실패: {e}")
+        direction = signal['signal'].split('_')[1]  # 'ENTRY_LONG' -> 'LONG'
+        
+        # 투자 가능 금액 (현재 자본의 100%)
+        investment_amount = self.current_capital
+        
+        # 수량 계산
+        quantity = investment_amount / price
+        
+        # 수수료 차감
+        commission = investment_amount * self.commission_rate
+        self.current_capital -= commission
+        
+        # 포지션 생성
+        self.current_position = BacktestPosition(
+            side=direction,
+            entry_price=price,
+            entry_time=timestamp,
+            quantity=quantity
+        )
+        
+        # 거래 기록
+        action = 'BUY' if direction == 'LONG' else 'SELL'
+        self._record_trade(timestamp, action, direction, price, quantity, 'ENTRY', signal)
+        
+        # 디버그 로그는 %-인자로 넘겨 레벨이 꺼져 있으면 문자열을 만들지 않음
+        logger.debug("포지션 진입: %s %.6f @ $%.2f", direction, quantity, price)
     
     def _close_position(self, price: float, timestamp: datetime, reason: str = "SIGNAL"):
         """포지션 청산"""
-        try:
-            if not self.current_position:
-                return
-            
-            # 손익 계산
-            if self.current_position.side == 'LONG':
-                pnl = (price - self.current_position.entry_price) * self.current_position.quantity
-            else:  # SHORT
-                pnl = (self.current_position.entry_price - price) * self.current_position.quantity
-            
-            # 청산 금액 계산
-            exit_value = price * self.current_position.quantity
-            commission = exit_value * self.commission_rate
-            net_pnl = pnl - commission
-            
-            # 자본 업데이트
-            self.current_capital += net_pnl
-            
-            # 거래 기록
-            action = 'SELL' if self.current_position.side == 'LONG' else 'BUY'
-            trade = BacktestTrade(
-                timestamp=timestamp,
-                action=action,
-                position_side=self.current_position.side,
-                price=price,
-                quantity=self.current_position.quantity,
-                trade_type='EXIT',
-                signal_data={'reason': reason, 'pnl': net_pnl}
-            )
-            self.trades.append(trade)
-            
-            logger.debug(f"포지션 청산: {self.current_position.side} @ ${price:.2f} (PnL: ${net_pnl:.2f})")
-            
-            # 포지션 초기화
-            self.current_position = None
-            
-        except Exception as e:
-            logger.error(f"포지션 청산 실패: {e}")
-    
-    def _update_unrealized_pnl(self, current_price: float):
-        """미실현 손익 업데이트"""
         if not self.current_position:
             return
         
+        # 손익 계산
         if self.current_position.side == 'LONG':
-            self.current_position.unrealized_pnl = (
-                (current_price - self.current_position.entry_price) * self.current_position.quantity
-            )
+            pnl = (price - self.current_position.entry_price) * self.current_position.quantity
         else:  # SHORT
-            self.current_position.unrealized_pnl = (
-                (self.current_position.entry_price - current_price) * self.current_position.quantity
-            )
-    
-    def _calculate_total_value(self, current_price: float) -> float:
-        """총 자산 가치 계산"""
-        total_value = self.current_capital
+            pnl = (self.current_position.entry_price - price) * self.current_position.quantity
+        
+        # 청산 금액 계산
+        exit_value = price * self.current_position.quantity
+        commission = exit_value * self.commission_rate
+        net_pnl = pnl - commission
+        
+        # 자본 업데이트
+        self.current_capital += net_pnl
         
-        if self.current_position:
-            total_value += self.current_position.unrealized_pnl
+        # 거래 기록
+        action = 'SELL' if self.current_position.side == 'LONG' else 'BUY'
+        self._record_trade(
+            timestamp, action, self.current_position.side, price,
+            self.current_position.quantity, 'EXIT', {'reason': reason, 'pnl': net_pnl}
+        )
+        self._exit_pnls.append(net_pnl)
         
-        return total_value
+        logger.debug("포지션 청산: %s @ $%.2f (PnL: $%.2f)", self.current_position.side, price, net_pnl)
+        
+        # 포지션 초기화
+        self.current_position = None
+    
+    def _update_unrealized_pnl(self, position: BacktestPosition, current_price: float):
+        """미실현 손익 업데이트"""
+        if position.side == 'LONG':
+            position.unrealized_pnl = (current_price - position.entry_price) * position.quantity
+        else:  # SHORT
+            position.unrealized_pnl = (position.entry_price - current_price) * position.quantity
     
     def _generate_result(self, strategy, market_data: pd.DataFrame, symbol: str) -> BacktestResult:
         """백테스트 결과 생성"""
         try:
-            # 기본 정보
-            start_date = market_data.iloc[0]['timestamp']
-            end_date = market_data.iloc[-1]['timestamp']
+            # 기본 정보 (행 Series를 만들지 않고 미리 추출한 타임스탬프 배열에서 위치로 조회)
+            start_date = self._timestamps[0]
+            end_date = self._timestamps[-1]
             final_capital = self.current_capital
             total_return = final_capital - self.initial_capital
             total_return_pct = (total_return / self.initial_capital) * 100
             
-            # 거래 분석
-            entry_trades = [t for t in self.trades if t.trade_type == 'ENTRY']
-            exit_trades = [t for t in self.trades if t.trade_type == 'EXIT']
+            # 거래 분석 (청산 시 기록한 순손익 배열로 집계)
+            pnls = np.asarray(self._exit_pnls, dtype=np.float64)
             
-            total_trades = len(exit_trades)  # 완료된 거래만 카운트
+            total_trades = pnls.size  # 완료된 거래만 카운트
             
             if total_trades > 0:
                 # 승패 분석
-                winning_trades = len([t for t in exit_trades if t.signal_data.get('pnl', 0) > 0])
+                wins = pnls[pnls > 0]
+                losses = pnls[pnls < 0]
+                winning_trades = wins.size
                 losing_trades = total_trades - winning_trades
                 win_rate = (winning_trades / total_trades) * 100
                 
                 # 평균 수익/손실
-                wins = [t.signal_data.get('pnl', 0) for t in exit_trades if t.signal_data.get('pnl', 0) > 0]
-                losses = [t.signal_data.get('pnl', 0) for t in exit_trades if t.signal_data.get('pnl', 0) < 0]
-                
-                avg_win = np.mean(wins) if wins else 0.0
-                avg_loss = np.mean(losses) if losses else 0.0
+                avg_win = wins.mean() if wins.size else 0.0
+                avg_loss = losses.mean() if losses.size else 0.0
             else:
                 winning_trades = losing_trades = 0
                 win_rate = avg_win = avg_loss = 0.0
             
             # 자본 곡선 DataFrame 생성
-            equity_df = pd.DataFrame(self.equity_curve)
+            equity_df = self._equity_frame()
             
             # 최대 낙폭 계산
             if not equity_df.empty:
-                peak = equity_df['total_value'].expanding().max()
-                drawdown = (equity_df['total_value'] - peak) / peak * 100
+                total_values = equity_df['total_value'].to_numpy()
+                peak = np.maximum.accumulate(total_values)
+                drawdown = (total_values - peak) / peak * 100
                 max_drawdown_pct = drawdown.min()
-                max_drawdown = (peak - equity_df['total_value']).max()
+                max_drawdown = (peak - total_values).max()
             else:
                 max_drawdown = max_drawdown_pct = 0.0
             
             # 샤프 비율 계산 (간단 버전)
             if not equity_df.empty and len(equity_df) > 1:
-                returns = equity_df['total_value'].pct_change().dropna()
-                if len(returns) > 0 and returns.std() > 0:
-                    sharpe_ratio = (returns.mean() / returns.std()) * np.sqrt(365 * 24 * 60)  # 연환산
+                total_values = equity_df['total_value'].to_numpy()
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    returns = np.diff(total_values) / total_values[:-1]
+                returns = returns[np.isfinite(returns)]
+                std = returns.std(ddof=1) if returns.size > 1 else 0.0  # pandas std와 같은 표본 표준편차
+                if std > 0:
+                    sharpe_ratio = (returns.mean() / std) * np.sqrt(365 * 24 * 60)  # 연환산
                 else:
                     sharpe_ratio = 0.0
             else:
                 sharpe_ratio = 0.0
             
+            # 진입/청산 시각 배열 (거래 기록 리스트에서 한 번만 추출)
+            entry_ts = [ts for ts, kind in zip(self._trade_ts, self._trade_types) if kind == 'ENTRY']
+            exit_ts = [ts for ts, kind in zip(self._trade_ts, self._trade_types) if kind == 'EXIT']
+            
             # 전략 이름 추출
             strategy_name = getattr(strategy, '__class__', type(strategy)).__name__
             
@@ -373,7 +726,10 @@ class Backtester:
                 max_drawdown_pct=max_drawdown_pct,
                 sharpe_ratio=sharpe_ratio,
                 trades=self.trades,
-                equity_curve=equity_df
+                equity_curve=equity_df,
+                exit_pnls=pnls,
+                entry_timestamps=pd.DatetimeIndex(entry_ts).to_numpy(dtype='datetime64[ns]'),
+                exit_timestamps=pd.DatetimeIndex(exit_ts).to_numpy(dtype='datetime64[ns]')
             )
             
         except Exception as e:
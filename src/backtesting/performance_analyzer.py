@@ -6,49 +6,248 @@
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # 차트는 PNG로만 저장하므로 GUI 백엔드 초기화 없이 렌더링
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.figure import Figure
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import io
 import base64
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 from src.utils.logger import get_logger
 from src.backtesting.backtester import BacktestResult
 
+try:
+    from numba import njit
+except ImportError:  # pandas-ta 경유로 설치되지만 없을 때도 동작하도록
+    njit = None
+
 logger = get_logger(__name__)
 
+
+def _max_run_length(mask: np.ndarray) -> int:
+    """불리언 배열에서 True가 연속된 가장 긴 구간 길이"""
+    # 양 끝을 0으로 감싸 열린 구간도 닫은 뒤 시작/끝 전환점의 거리로 계산
+    transitions = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts = np.flatnonzero(transitions == 1)
+    ends = np.flatnonzero(transitions == -1)
+    return int((ends - starts).max()) if starts.size else 0
+
+
+def _drawdown_stats_py(values: np.ndarray, threshold_pct: float) -> Tuple[float, int]:
+    """최대 낙폭(%, 양수)과 threshold_pct보다 깊은 낙폭이 이어진 최장 바 수"""
+    peak = np.maximum.accumulate(values)
+    drawdown = (values - peak) / peak * 100
+    return abs(drawdown.min()), _max_run_length(drawdown < -threshold_pct)
+
+
+def _pnl_stats_py(pnls: np.ndarray) -> Tuple:
+    """
+    청산 PnL 배열 집계
+    
+    Returns:
+        (승 수, 패 수, 총 수익, 총 손실(음수), 최대 수익, 최대 손실, 최대 연승, 최대 연패)
+        연승/연패에서는 수익이 아닌 거래를 패로 계산
+    """
+    is_win = pnls > 0
+    wins = pnls[is_win]
+    losses = pnls[pnls < 0]
+    return (
+        wins.size, losses.size,
+        wins.sum() if wins.size else 0.0, losses.sum() if losses.size else 0.0,
+        wins.max() if wins.size else 0.0, losses.min() if losses.size else 0.0,
+        _max_run_length(is_win), _max_run_length(~is_win)
+    )
+
+if njit is not None:
+    @njit(cache=True)
+    def _drawdown_stats(values, threshold_pct):
+        peak = values[0]
+        min_drawdown = 0.0
+        run = 0
+        longest = 0
+        for i in range(values.shape[0]):
+            if values[i] > peak:
+                peak = values[i]
+            drawdown = (values[i] - peak) / peak * 100
+            if drawdown < min_drawdown:
+                min_drawdown = drawdown
+            if drawdown < -threshold_pct:
+                run += 1
+                if run > longest:
+                    longest = run
+            else:
+                run = 0
+        return abs(min_drawdown), longest
+    
+    @njit(cache=True)
+    def _pnl_stats(pnls):
+        win_count = 0
+        loss_count = 0
+        wins_sum = 0.0
+        losses_sum = 0.0
+        max_win = 0.0
+        max_loss = 0.0
+        win_run = 0
+        loss_run = 0
+        longest_win_run = 0
+        longest_loss_run = 0
+        for i in range(pnls.shape[0]):
+            pnl = pnls[i]
+            if pnl > 0:
+                if win_count == 0 or pnl > max_win:
+                    max_win = pnl
+                win_count += 1
+                wins_sum += pnl
+                win_run += 1
+                loss_run = 0
+                if win_run > longest_win_run:
+                    longest_win_run = win_run
+            else:
+                if pnl < 0:
+                    if loss_count == 0 or pnl < max_loss:
+                        max_loss = pnl
+                    loss_count += 1
+                    losses_sum += pnl
+                loss_run += 1
+                win_run = 0
+                if loss_run > longest_loss_run:
+                    longest_loss_run = loss_run
+        return (win_count, loss_count, wins_sum, losses_sum, max_win, max_loss,
+                longest_win_run, longest_loss_run)
+    
+    # 첫 분석에서 JIT 컴파일 비용이 들지 않도록 임포트 시 예열
+    try:
+        _drawdown_stats(np.ones(1, dtype=np.float64), 0.01)
+        _pnl_stats(np.zeros(1, dtype=np.float64))
+    except Exception:
+        _drawdown_stats = _drawdown_stats_py
+        _pnl_stats = _pnl_stats_py
+else:
+    _drawdown_stats = _drawdown_stats_py
+    _pnl_stats = _pnl_stats_py
+
+
+def _group_means(keys: np.ndarray, values: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    정수 키(0 ~ n_groups-1)별 NaN 제외 평균 (groupby(keys).mean()과 동일)
+    
+    Returns:
+        (등장한 키 배열, 키별 평균 배열 - 유효 값이 없는 키는 NaN)
+    """
+    valid = ~np.isnan(values)
+    sums = np.bincount(keys[valid], weights=values[valid], minlength=n_groups)
+    counts = np.bincount(keys[valid], minlength=n_groups)
+    groups = np.flatnonzero(np.bincount(keys, minlength=n_groups))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums[groups] / counts[groups]
+    return groups, means
+
+
+def _nearest_positions(index: pd.DatetimeIndex, times) -> np.ndarray:
+    """정렬된 시각 인덱스에서 각 시각과 가장 가까운 위치 (같은 거리면 앞쪽)"""
+    times = pd.DatetimeIndex(pd.to_datetime(times))
+    last = len(index) - 1
+    
+    # 이진 탐색으로 오른쪽 후보를 찾고 왼쪽 후보와 거리 비교
+    right = np.clip(index.searchsorted(times), 0, last)
+    left = np.clip(right - 1, 0, last)
+    right_dist = np.abs((index[right] - times).asi8)
+    left_dist = np.abs((times - index[left]).asi8)
+    return np.where(right_dist < left_dist, right, left)
+
 class PerformanceAnalyzer:
     """백테스트 성과 분석기"""
     
-    def __init__(self):
-        """성과 분석기 초기화"""
+    # 차트 PNG 해상도 (인코딩 비용은 픽셀 수, 즉 dpi 제곱에 비례)
+    DEFAULT_DPI = 100
+    
+    def __init__(self, dpi: int = DEFAULT_DPI):
+        """
+        성과 분석기 초기화
+        
+        Args:
+            dpi: 차트 PNG 해상도
+        """
+        self.dpi = dpi
+        
+        # 차트마다 새로 만들지 않고 비워서 재사용하는 Figure와 PNG 버퍼 (스레드별로 하나씩, pyplot 전역 상태에 등록하지 않음)
+        self._chart_local = threading.local()
+        self._chart_executor: Optional[ThreadPoolExecutor] = None  # 차트 병렬 생성용 (처음 쓸 때 생성)
+        self._chart_executor_lock = threading.Lock()
+        
+        # 분석 결과 캐시 {(id(result), 차트 포함 여부): (결과 약한 참조, 결과 지문, 분석)}
+        # 조회/저장만 잠그고 분석은 잠금 밖에서 수행 (같은 결과를 동시에 분석하면 중복 계산될 수 있으나 결과는 같음)
+        self._analysis_cache: Dict[Tuple[int, bool], Tuple[weakref.ref, Tuple, Dict]] = {}
+        self._analysis_cache_lock = threading.Lock()
+        self.analysis_cache_hits = 0
+        self.analysis_cache_misses = 0
+        
         # matplotlib 한글 폰트 설정 (선택사항)
         plt.rcParams['font.family'] = 'DejaVu Sans'
         plt.rcParams['axes.unicode_minus'] = False
         
         logger.info("PerformanceAnalyzer 초기화 완료")
     
-    def analyze_performance(self, result: BacktestResult) -> Dict:
+    def analyze_performance(self, result: BacktestResult, include_charts: bool = True) -> Dict:
         """
         성과 분석 수행
         
         Args:
             result: BacktestResult 객체
+            include_charts: 차트 생성 여부. 차트 렌더링(PNG 인코딩)이 분석 시간의 대부분이므로
+                            지표만 필요한 파라미터 스윕 등에서는 False로 두면 charts가 빈 딕셔너리
             
         Returns:
-            분석 결과 딕셔너리
+            분석 결과 딕셔너리 (같은 결과 객체를 다시 분석하면 캐시된 딕셔너리를 그대로 반환.
+            분석 후 결과 객체를 수정하면 지문 필드가 바뀐 경우에만 다시 분석하므로 수정하지 말 것)
         """
+        key = (id(result), include_charts)
+        fingerprint = self._result_fingerprint(result)
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(key)
+            if cached is not None and cached[0]() is result and cached[1] == fingerprint:
+                self.analysis_cache_hits += 1
+                return cached[2]
+            self.analysis_cache_misses += 1
+        
+        analysis = self._analyze(result, include_charts)
+        
+        result_ref = weakref.ref(result, lambda _, key=key: self._analysis_cache.pop(key, None))
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = (result_ref, fingerprint, analysis)
+        return analysis
+    
+    @staticmethod
+    def _result_fingerprint(result: BacktestResult) -> Tuple:
+        """캐시 무효화 확인용 결과 지문 (전체 해시 대신 값싼 필드만)"""
+        return (result.strategy_name, result.symbol, result.start_date, result.end_date,
+                len(result.trades), result.final_capital)
+    
+    def _analyze(self, result: BacktestResult, include_charts: bool) -> Dict:
+        """성과 분석 수행 (캐시 없이)"""
         try:
             logger.info(f"성과 분석 시작 - {result.strategy_name} ({result.symbol})")
             
+            # 기본 지표는 한 번만 계산해 칼마 비율에 재사용
+            basic_metrics = self._calculate_basic_metrics(result)
+            
+            # 타임스탬프 변환과 월별 수익률 리샘플링은 한 번만 해서 각 분석/차트가 공유
+            timestamps = self._equity_timestamps(result)
+            monthly_returns = self._monthly_return_series(result, timestamps)
+            
             analysis = {
-                'basic_metrics': self._calculate_basic_metrics(result),
-                'risk_metrics': self._calculate_risk_metrics(result),
+                'basic_metrics': basic_metrics,
+                'risk_metrics': self._calculate_risk_metrics(result, basic_metrics.get('annual_return', 0)),
                 'trade_analysis': self._analyze_trades(result),
-                'time_analysis': self._analyze_time_performance(result),
-                'monthly_returns': self._calculate_monthly_returns(result),
-                'charts': self._generate_charts(result)
+                'time_analysis': self._analyze_time_performance(result, timestamps),
+                'monthly_returns': self._calculate_monthly_returns(result, monthly_returns),
+                'charts': self._generate_charts(result, monthly_returns, timestamps) if include_charts else {}
             }
             
             logger.info("성과 분석 완료")
@@ -58,6 +257,17 @@ class PerformanceAnalyzer:
             logger.error(f"성과 분석 실패: {e}")
             raise
     
+    def _equity_timestamps(self, result: BacktestResult) -> Optional[pd.DatetimeIndex]:
+        """자본 곡선 타임스탬프를 DatetimeIndex로 한 번 변환 (실패 시 None)"""
+        try:
+            if result.equity_curve.empty:
+                return pd.DatetimeIndex([])
+            return pd.DatetimeIndex(pd.to_datetime(result.equity_curve['timestamp']))
+            
+        except Exception as e:
+            logger.error(f"타임스탬프 변환 실패: {e}")
+            return None
+    
     def _calculate_basic_metrics(self, result: BacktestResult) -> Dict:
         """기본 성과 지표 계산"""
         try:
@@ -77,9 +287,8 @@ class PerformanceAnalyzer:
             # 거래당 평균 수익
             avg_trade_return = 0.0
             if result.total_trades > 0:
-                exit_trades = [t for t in result.trades if t.trade_type == 'EXIT']
-                total_trade_pnl = sum(t.signal_data.get('pnl', 0) for t in exit_trades)
-                avg_trade_return = total_trade_pnl / result.total_trades
+                pnls, _, _ = self._trade_arrays(result)
+                avg_trade_return = pnls.sum() / result.total_trades
             
             return {
                 'duration_days': duration_days,
@@ -96,62 +305,40 @@ class PerformanceAnalyzer:
             logger.error(f"기본 지표 계산 실패: {e}")
             return {}
     
-    def _calculate_risk_metrics(self, result: BacktestResult) -> Dict:
-        """리스크 지표 계산"""
+    def _calculate_risk_metrics(self, result: BacktestResult, annual_return: float) -> Dict:
+        """리스크 지표 계산 (annual_return: 기본 지표의 연환산 수익률, 칼마 비율용)"""
         try:
             if result.equity_curve.empty:
                 return {}
             
-            # 일일 수익률 계산
-            equity_curve = result.equity_curve.copy()
-            equity_curve['daily_return'] = equity_curve['total_value'].pct_change()
-            daily_returns = equity_curve['daily_return'].dropna()
+            # 일일 수익률 계산 (Series 대신 자본 배열로 직접 계산)
+            values = result.equity_curve['total_value'].to_numpy(dtype=np.float64)
+            periods_per_year = 365 * 24 * 60  # 분단위 -> 연환산
+            with np.errstate(divide='ignore', invalid='ignore'):
+                daily_returns = np.diff(values) / values[:-1]
+            daily_returns = daily_returns[~np.isnan(daily_returns)]  # pct_change().dropna()와 동일
             
-            # 변동성 (연환산)
+            # 변동성 (연환산, pandas std와 같은 표본 표준편차)
             volatility = 0.0
-            if len(daily_returns) > 1:
-                volatility = daily_returns.std() * np.sqrt(365 * 24 * 60) * 100  # 분단위 -> 연환산
-            
-            # 최대 낙폭 상세 계산
-            peak = equity_curve['total_value'].expanding().max()
-            drawdown = (equity_curve['total_value'] - peak) / peak * 100
-            max_dd_pct = abs(drawdown.min())
-            
-            # 최대 낙폭 기간
-            in_drawdown = drawdown < -0.01  # 0.01% 이상 낙폭
-            if in_drawdown.any():
-                dd_periods = []
-                start_idx = None
-                
-                for i, is_dd in enumerate(in_drawdown):
-                    if is_dd and start_idx is None:
-                        start_idx = i
-                    elif not is_dd and start_idx is not None:
-                        dd_periods.append(i - start_idx)
-                        start_idx = None
-                
-                # 마지막 낙폭이 끝나지 않은 경우
-                if start_idx is not None:
-                    dd_periods.append(len(in_drawdown) - start_idx)
-                
-                max_dd_duration = max(dd_periods) if dd_periods else 0
-            else:
-                max_dd_duration = 0
+            if daily_returns.size > 1:
+                volatility = daily_returns.std(ddof=1) * np.sqrt(periods_per_year) * 100
+            
+            # 최대 낙폭과 최대 낙폭 기간 (0.01% 이상 낙폭, 끝나지 않은 마지막 낙폭 포함)
+            max_dd_pct, max_dd_duration = _drawdown_stats(values, 0.01)
             
             # 칼마 비율 (연환산 수익률 / 최대 낙폭)
             calmar_ratio = 0.0
-            basic_metrics = self._calculate_basic_metrics(result)
             if max_dd_pct > 0:
-                calmar_ratio = basic_metrics.get('annual_return', 0) / max_dd_pct
+                calmar_ratio = annual_return / max_dd_pct
             
             # 소르티노 비율 (하방 리스크 고려)
             sortino_ratio = 0.0
-            if len(daily_returns) > 1:
+            if daily_returns.size > 1:
                 negative_returns = daily_returns[daily_returns < 0]
-                if len(negative_returns) > 0:
-                    downside_deviation = negative_returns.std() * np.sqrt(365 * 24 * 60)
+                if negative_returns.size > 1:  # 표본 표준편차는 2개 이상 필요
+                    downside_deviation = negative_returns.std(ddof=1) * np.sqrt(periods_per_year)
                     if downside_deviation > 0:
-                        avg_return = daily_returns.mean() * 365 * 24 * 60
+                        avg_return = daily_returns.mean() * periods_per_year
                         sortino_ratio = avg_return / downside_deviation
             
             return {
@@ -168,12 +355,36 @@ class PerformanceAnalyzer:
             logger.error(f"리스크 지표 계산 실패: {e}")
             return {}
     
+    @staticmethod
+    def _trade_arrays(result: BacktestResult) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        청산 PnL(float64), 진입 시각, 청산 시각(datetime64[ns]) 배열
+        
+        백테스터가 채운 결과 배열이 있으면 그대로 쓰고, 없으면 trades를 한 번 순회해 생성
+        """
+        if result.exit_pnls is not None:
+            return result.exit_pnls, result.entry_timestamps, result.exit_timestamps
+        
+        pnls = []
+        entry_times = []
+        exit_times = []
+        for t in result.trades:
+            if t.trade_type == 'EXIT':
+                pnls.append(t.signal_data.get('pnl', 0))
+                exit_times.append(t.timestamp)
+            elif t.trade_type == 'ENTRY':
+                entry_times.append(t.timestamp)
+        
+        return (np.asarray(pnls, dtype=np.float64),
+                pd.DatetimeIndex(entry_times).to_numpy(dtype='datetime64[ns]'),
+                pd.DatetimeIndex(exit_times).to_numpy(dtype='datetime64[ns]'))
+    
     def _analyze_trades(self, result: BacktestResult) -> Dict:
         """거래 분석"""
         try:
-            exit_trades = [t for t in result.trades if t.trade_type == 'EXIT']
+            pnls, entry_times, exit_times = self._trade_arrays(result)
             
-            if not exit_trades:
+            if not pnls.size:
                 return {
                     'total_trades': 0,
                     'winning_trades': 0,
@@ -181,61 +392,37 @@ class PerformanceAnalyzer:
                     'win_rate': 0.0
                 }
             
-            # PnL 리스트
-            pnls = [t.signal_data.get('pnl', 0) for t in exit_trades]
-            wins = [pnl for pnl in pnls if pnl > 0]
-            losses = [pnl for pnl in pnls if pnl < 0]
+            # PnL 배열을 한 번 훑어 승패 수/합계/최대값/연승·연패 집계
+            (winning_trades, losing_trades, total_wins, losses_sum,
+             max_win, max_loss, max_consecutive_wins, max_consecutive_losses) = _pnl_stats(pnls)
             
             # 승률 및 평균
-            win_rate = (len(wins) / len(exit_trades)) * 100
-            avg_win = np.mean(wins) if wins else 0.0
-            avg_loss = np.mean(losses) if losses else 0.0
-            
-            # 최대 수익/손실
-            max_win = max(wins) if wins else 0.0
-            max_loss = min(losses) if losses else 0.0
-            
-            # Profit Factor (총 수익 / 총 손실)
-            total_wins = sum(wins) if wins else 0.0
-            total_losses = abs(sum(losses)) if losses else 0.0
-            profit_factor = total_wins / total_losses if total_losses > 0 else float('inf')
-            
-            # 연속 승/패
-            consecutive_wins = 0
-            consecutive_losses = 0
-            max_consecutive_wins = 0
-            max_consecutive_losses = 0
-            
-            for pnl in pnls:
-                if pnl > 0:
-                    consecutive_wins += 1
-                    consecutive_losses = 0
-                    max_consecutive_wins = max(max_consecutive_wins, consecutive_wins)
-                else:
-                    consecutive_losses += 1
-                    consecutive_wins = 0
-                    max_consecutive_losses = max(max_consecutive_losses, consecutive_losses)
-            
-            # 거래 기간 분석
-            entry_trades = [t for t in result.trades if t.trade_type == 'ENTRY']
-            hold_times = []
-            
-            for i in range(min(len(entry_trades), len(exit_trades))):
-                hold_time = exit_trades[i].timestamp - entry_trades[i].timestamp
-                hold_times.append(hold_time.total_seconds() / 60)  # 분 단위
-            
-            avg_hold_time = np.mean(hold_times) if hold_times else 0.0
+            win_rate = (winning_trades / pnls.size) * 100
+            avg_win = total_wins / winning_trades if winning_trades else 0.0
+            avg_loss = losses_sum / losing_trades if losing_trades else 0.0
+            
+            # Profit Factor (총 수익 / 총 손실, 손실이 없으면 NaN - 표시는 출력하는 쪽에서 결정)
+            total_losses = abs(losses_sum)
+            profit_factor = total_wins / total_losses if total_losses > 0 else np.nan
+            
+            # 거래 기간 분석 (i번째 진입과 i번째 청산을 짝지음)
+            n_pairs = min(entry_times.size, exit_times.size)
+            if n_pairs:
+                hold_times = (exit_times[:n_pairs] - entry_times[:n_pairs]) / np.timedelta64(1, 'm')  # 분 단위
+                avg_hold_time = hold_times.mean()
+            else:
+                avg_hold_time = 0.0
             
             return {
-                'total_trades': len(exit_trades),
-                'winning_trades': len(wins),
-                'losing_trades': len(losses),
+                'total_trades': pnls.size,
+                'winning_trades': winning_trades,
+                'losing_trades': losing_trades,
                 'win_rate': round(win_rate, 1),
                 'avg_win': round(avg_win, 2),
                 'avg_loss': round(avg_loss, 2),
                 'max_win': round(max_win, 2),
                 'max_loss': round(max_loss, 2),
-                'profit_factor': round(profit_factor, 2) if profit_factor != float('inf') else 'Inf',
+                'profit_factor': round(profit_factor, 2),
                 'max_consecutive_wins': max_consecutive_wins,
                 'max_consecutive_losses': max_consecutive_losses,
                 'avg_hold_time_minutes': round(avg_hold_time, 1),
@@ -247,36 +434,41 @@ class PerformanceAnalyzer:
             logger.error(f"거래 분석 실패: {e}")
             return {}
     
-    def _analyze_time_performance(self, result: BacktestResult) -> Dict:
-        """시간대별 성과 분석"""
+    def _analyze_time_performance(self, result: BacktestResult,
+                                  timestamps: Optional[pd.DatetimeIndex] = None) -> Dict:
+        """시간대별 성과 분석 (timestamps: 미리 변환한 자본 곡선 DatetimeIndex)"""
         try:
             if result.equity_curve.empty:
                 return {}
             
-            equity_curve = result.equity_curve.copy()
-            equity_curve['hour'] = pd.to_datetime(equity_curve['timestamp']).dt.hour
-            equity_curve['weekday'] = pd.to_datetime(equity_curve['timestamp']).dt.dayofweek
-            equity_curve['daily_return'] = equity_curve['total_value'].pct_change()
-            
-            # 시간대별 평균 수익률
-            hourly_returns = equity_curve.groupby('hour')['daily_return'].mean()
-            best_hour = hourly_returns.idxmax() if not hourly_returns.empty else None
-            worst_hour = hourly_returns.idxmin() if not hourly_returns.empty else None
+            # 바별 수익률 (첫 바는 NaN, pct_change와 동일)
+            if timestamps is None:
+                timestamps = self._equity_timestamps(result)
+            values = result.equity_curve['total_value'].to_numpy(dtype=np.float64)
+            returns = np.empty(values.size, dtype=np.float64)
+            returns[0] = np.nan
+            with np.errstate(divide='ignore', invalid='ignore'):
+                returns[1:] = np.diff(values) / values[:-1]
+            
+            # 시간대별 평균 수익률 (groupby 대신 bincount로 합계/개수 집계)
+            hours, hourly_returns = _group_means(timestamps.hour.to_numpy(), returns, 24)
+            has_hourly = not np.isnan(hourly_returns).all()
+            best_hour = hours[np.nanargmax(hourly_returns)] if has_hourly else None
+            worst_hour = hours[np.nanargmin(hourly_returns)] if has_hourly else None
             
             # 요일별 평균 수익률 (0=월요일, 6=일요일)
             weekday_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            daily_returns = equity_curve.groupby('weekday')['daily_return'].mean()
+            weekdays, daily_returns = _group_means(timestamps.dayofweek.to_numpy(), returns, 7)
             
             weekday_performance = {}
-            for day_num, avg_return in daily_returns.items():
-                if day_num < len(weekday_names):
-                    weekday_performance[weekday_names[day_num]] = round(avg_return * 100, 3)
+            for day_num, avg_return in zip(weekdays, daily_returns):
+                weekday_performance[weekday_names[day_num]] = round(avg_return * 100, 3)
             
             return {
                 'best_hour': int(best_hour) if best_hour is not None else None,
                 'worst_hour': int(worst_hour) if worst_hour is not None else None,
-                'best_hour_return': round(hourly_returns.max() * 100, 3) if not hourly_returns.empty else 0,
-                'worst_hour_return': round(hourly_returns.min() * 100, 3) if not hourly_returns.empty else 0,
+                'best_hour_return': round(np.nanmax(hourly_returns) * 100, 3) if has_hourly else 0,
+                'worst_hour_return': round(np.nanmin(hourly_returns) * 100, 3) if has_hourly else 0,
                 'weekday_performance': weekday_performance
             }
             
@@ -284,19 +476,37 @@ class PerformanceAnalyzer:
             logger.error(f"시간대별 분석 실패: {e}")
             return {}
     
-    def _calculate_monthly_returns(self, result: BacktestResult) -> Dict:
-        """월별 수익률 계산"""
+    def _monthly_return_series(self, result: BacktestResult,
+                               timestamps: Optional[pd.DatetimeIndex] = None) -> Optional[pd.Series]:
+        """월말 자본 기준 월별 수익률(%) Series (실패 시 None)"""
         try:
             if result.equity_curve.empty:
-                return {}
+                return pd.Series(dtype=np.float64)
             
-            equity_curve = result.equity_curve.copy()
-            equity_curve['timestamp'] = pd.to_datetime(equity_curve['timestamp'])
-            equity_curve = equity_curve.set_index('timestamp')
+            # 복사본에 인덱스를 다시 잡지 않고 타임스탬프 인덱스의 자본 Series만 생성
+            if timestamps is None:
+                timestamps = self._equity_timestamps(result)
+            total_values = pd.Series(result.equity_curve['total_value'].to_numpy(), index=timestamps)
             
             # 월말 값으로 리샘플링
-            monthly_values = equity_curve['total_value'].resample('M').last()
-            monthly_returns = monthly_values.pct_change().dropna() * 100
+            monthly_values = total_values.resample('M').last()
+            return monthly_values.pct_change().dropna() * 100
+            
+        except Exception as e:
+            logger.error(f"월별 수익률 리샘플링 실패: {e}")
+            return None
+    
+    def _calculate_monthly_returns(self, result: BacktestResult,
+                                   monthly_returns: Optional[pd.Series] = None) -> Dict:
+        """월별 수익률 계산 (monthly_returns: 미리 계산한 월별 수익률 Series)"""
+        try:
+            if result.equity_curve.empty:
+                return {}
+            
+            if monthly_returns is None:
+                monthly_returns = self._monthly_return_series(result)
+            if monthly_returns is None:
+                return {}
             
             monthly_data = {}
             for date, return_pct in monthly_returns.items():
@@ -322,41 +532,92 @@ class PerformanceAnalyzer:
             logger.error(f"월별 수익률 계산 실패: {e}")
             return {}
     
-    def _generate_charts(self, result: BacktestResult) -> Dict:
-        """차트 생성"""
+    def _generate_charts(self, result: BacktestResult,
+                         monthly_returns: Optional[pd.Series] = None,
+                         timestamps: Optional[pd.DatetimeIndex] = None) -> Dict:
+        """
+        차트 생성
+        
+        Args:
+            result: BacktestResult 객체
+            monthly_returns: 미리 계산한 월별 수익률 Series (히트맵용)
+            timestamps: 미리 변환한 자본 곡선 DatetimeIndex
+        """
         try:
-            charts = {}
+            tasks = []
             
             if not result.equity_curve.empty:
                 # 1. 자본 곡선 차트
-                charts['equity_curve'] = self._create_equity_curve_chart(result)
+                tasks.append(('equity_curve', self._create_equity_curve_chart, (result, timestamps)))
                 
                 # 2. 낙폭 차트
-                charts['drawdown'] = self._create_drawdown_chart(result)
+                tasks.append(('drawdown', self._create_drawdown_chart, (result, timestamps)))
                 
                 # 3. 월별 수익률 히트맵
-                charts['monthly_heatmap'] = self._create_monthly_heatmap(result)
+                tasks.append(('monthly_heatmap', self._create_monthly_heatmap, (result, monthly_returns)))
             
             if result.trades:
                 # 4. 거래 분석 차트
-                charts['trade_analysis'] = self._create_trade_analysis_chart(result)
+                tasks.append(('trade_analysis', self._create_trade_analysis_chart, (result,)))
+            
+            if not tasks:
+                return {}
             
-            return charts
+            # Agg 렌더링은 Figure 단위로 독립적이고 차트 함수는 pyplot 전역 상태를 쓰지 않으므로
+            # (Figure는 작업 스레드별 재사용) 여러 분석이 동시에 들어와도 같은 풀에 그대로 제출
+            if self._chart_executor is None:
+                with self._chart_executor_lock:
+                    if self._chart_executor is None:
+                        self._chart_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='chart')
+            futures = [
+                (name, self._chart_executor.submit(func, *args))
+                for name, func, args in tasks
+            ]
+            return {name: future.result() for name, future in futures}
             
         except Exception as e:
             logger.error(f"차트 생성 실패: {e}")
             return {}
     
-    def _create_equity_curve_chart(self, result: BacktestResult) -> str:
-        """자본 곡선 차트 생성"""
+    def _reset_figure(self, width: float, height: float) -> Figure:
+        """현재 스레드의 재사용 Figure를 비우고 크기 지정 (스레드에서 처음 호출 시 생성)"""
+        fig = getattr(self._chart_local, 'fig', None)
+        if fig is None:
+            fig = self._chart_local.fig = Figure()
+        else:
+            # clear()는 이전 차트의 tight_layout 여백을 남기므로 기본 여백으로 되돌림
+            fig.clear()
+            fig.subplots_adjust(**{
+                key: matplotlib.rcParams[f'figure.subplot.{key}']
+                for key in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+            })
+        fig.set_size_inches(width, height)
+        return fig
+    
+    def _encode_figure(self, fig: Figure) -> str:
+        """Figure를 PNG로 저장해 base64 문자열로 반환 (getvalue() 복사 없이 버퍼를 바로 인코딩)"""
+        buffer = getattr(self._chart_local, 'png_buffer', None)
+        if buffer is None:
+            buffer = self._chart_local.png_buffer = io.BytesIO()
+        buffer.seek(0)
+        buffer.truncate()
+        fig.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight')
+        with buffer.getbuffer() as view:
+            return base64.b64encode(view).decode('ascii')
+    
+    def _create_equity_curve_chart(self, result: BacktestResult,
+                                   timestamps: Optional[pd.DatetimeIndex] = None) -> str:
+        """자본 곡선 차트 생성 (timestamps: 미리 변환한 자본 곡선 DatetimeIndex)"""
         try:
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig = self._reset_figure(12, 6)
+            ax = fig.add_subplot()
             
-            equity_curve = result.equity_curve.copy()
-            equity_curve['timestamp'] = pd.to_datetime(equity_curve['timestamp'])
+            if timestamps is None:
+                timestamps = self._equity_timestamps(result)
+            total_values = result.equity_curve['total_value']
             
             # 자본 곡선 플롯
-            ax.plot(equity_curve['timestamp'], equity_curve['total_value'], 
+            ax.plot(timestamps, total_values, 
                    linewidth=2, color='#2E86AB', label='Portfolio Value')
             
             # 초기 자본 기준선
@@ -367,23 +628,20 @@ class PerformanceAnalyzer:
             entry_trades = [t for t in result.trades if t.trade_type == 'ENTRY']
             exit_trades = [t for t in result.trades if t.trade_type == 'EXIT']
             
-            for trade in entry_trades:
-                # 해당 시점의 포트폴리오 가치 찾기
-                trade_time = pd.to_datetime(trade.timestamp)
-                closest_idx = equity_curve['timestamp'].sub(trade_time).abs().idxmin()
-                portfolio_value = equity_curve.loc[closest_idx, 'total_value']
-                
-                color = 'green' if trade.position_side == 'LONG' else 'red'
-                ax.scatter(trade_time, portfolio_value, color=color, s=50, 
-                          marker='^', alpha=0.7, zorder=5)
-            
-            for trade in exit_trades:
-                trade_time = pd.to_datetime(trade.timestamp)
-                closest_idx = equity_curve['timestamp'].sub(trade_time).abs().idxmin()
-                portfolio_value = equity_curve.loc[closest_idx, 'total_value']
-                
-                ax.scatter(trade_time, portfolio_value, color='orange', s=50, 
-                          marker='v', alpha=0.7, zorder=5)
+            # 거래 시점의 포트폴리오 가치는 전체 거래를 한 번에 이진 탐색으로 찾음
+            values = total_values.to_numpy()
+            entry_values = values[_nearest_positions(timestamps, [t.timestamp for t in entry_trades])]
+            exit_values = values[_nearest_positions(timestamps, [t.timestamp for t in exit_trades])]
+            
+            # 진입/청산 마커는 거래마다가 아니라 그룹별로 scatter 한 번씩
+            if entry_trades:
+                entry_colors = ['green' if t.position_side == 'LONG' else 'red' for t in entry_trades]
+                ax.scatter(pd.to_datetime([t.timestamp for t in entry_trades]), entry_values,
+                          c=entry_colors, s=50, marker='^', alpha=0.7, zorder=5)
+            
+            if exit_trades:
+                ax.scatter(pd.to_datetime([t.timestamp for t in exit_trades]), exit_values,
+                          color='orange', s=50, marker='v', alpha=0.7, zorder=5)
             
             # 차트 설정
             ax.set_title(f'{result.strategy_name} - Portfolio Value Over Time\n'
@@ -397,41 +655,37 @@ class PerformanceAnalyzer:
             
             # 날짜 포맷팅
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-            ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(equity_curve)//10)))
-            plt.xticks(rotation=45)
+            ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(timestamps)//10)))
+            ax.tick_params(axis='x', labelrotation=45)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # 이미지를 base64로 인코딩
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-            
-            return image_base64
+            return self._encode_figure(fig)
             
         except Exception as e:
             logger.error(f"자본 곡선 차트 생성 실패: {e}")
-            plt.close()
             return ""
     
-    def _create_drawdown_chart(self, result: BacktestResult) -> str:
-        """낙폭 차트 생성"""
+    def _create_drawdown_chart(self, result: BacktestResult,
+                               timestamps: Optional[pd.DatetimeIndex] = None) -> str:
+        """낙폭 차트 생성 (timestamps: 미리 변환한 자본 곡선 DatetimeIndex)"""
         try:
-            fig, ax = plt.subplots(figsize=(12, 4))
+            fig = self._reset_figure(12, 4)
+            ax = fig.add_subplot()
             
-            equity_curve = result.equity_curve.copy()
-            equity_curve['timestamp'] = pd.to_datetime(equity_curve['timestamp'])
+            if timestamps is None:
+                timestamps = self._equity_timestamps(result)
+            values = result.equity_curve['total_value'].to_numpy()
             
             # 낙폭 계산
-            peak = equity_curve['total_value'].expanding().max()
-            drawdown = (equity_curve['total_value'] - peak) / peak * 100
+            peak = np.maximum.accumulate(values)
+            drawdown = (values - peak) / peak * 100
             
             # 낙폭 영역 플롯
-            ax.fill_between(equity_curve['timestamp'], drawdown, 0, 
+            ax.fill_between(timestamps, drawdown, 0, 
                            color='red', alpha=0.3, label='Drawdown')
-            ax.plot(equity_curve['timestamp'], drawdown, color='red', linewidth=1)
+            ax.plot(timestamps, drawdown, color='red', linewidth=1)
             
             # 차트 설정
             ax.set_title(f'Drawdown Analysis - Max: {abs(drawdown.min()):.2f}%', 
@@ -443,40 +697,30 @@ class PerformanceAnalyzer:
             
             # 날짜 포맷팅
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-            ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(equity_curve)//10)))
-            plt.xticks(rotation=45)
+            ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(timestamps)//10)))
+            ax.tick_params(axis='x', labelrotation=45)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # 이미지를 base64로 인코딩
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-            
-            return image_base64
+            return self._encode_figure(fig)
             
         except Exception as e:
             logger.error(f"낙폭 차트 생성 실패: {e}")
-            plt.close()
             return ""
     
-    def _create_monthly_heatmap(self, result: BacktestResult) -> str:
-        """월별 수익률 히트맵 생성"""
+    def _create_monthly_heatmap(self, result: BacktestResult,
+                                monthly_returns: Optional[pd.Series] = None) -> str:
+        """월별 수익률 히트맵 생성 (monthly_returns: 미리 계산한 월별 수익률 Series)"""
         try:
             if result.equity_curve.empty:
                 return ""
             
-            equity_curve = result.equity_curve.copy()
-            equity_curve['timestamp'] = pd.to_datetime(equity_curve['timestamp'])
-            equity_curve = equity_curve.set_index('timestamp')
-            
-            # 월별 수익률 계산
-            monthly_values = equity_curve['total_value'].resample('M').last()
-            monthly_returns = monthly_values.pct_change().dropna() * 100
+            # 월별 수익률 계산 (전달받지 못했을 때만)
+            if monthly_returns is None:
+                monthly_returns = self._monthly_return_series(result)
             
-            if monthly_returns.empty:
+            if monthly_returns is None or monthly_returns.empty:
                 return ""
             
             # 연도와 월 분리
@@ -495,7 +739,8 @@ class PerformanceAnalyzer:
             heatmap_data.columns = [month_names[i-1] for i in heatmap_data.columns]
             
             # 히트맵 생성
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig = self._reset_figure(12, 6)
+            ax = fig.add_subplot()
             
             # 컬러맵 설정 (빨강-흰색-초록)
             import matplotlib.colors as mcolors
@@ -503,17 +748,18 @@ class PerformanceAnalyzer:
             n_bins = 100
             cmap = mcolors.LinearSegmentedColormap.from_list('returns', colors, N=n_bins)
             
-            # 히트맵 플롯
-            im = ax.imshow(heatmap_data.values, cmap=cmap, aspect='auto',
-                          vmin=-abs(heatmap_data.values).max(), 
-                          vmax=abs(heatmap_data.values).max())
-            
-            # 텍스트 추가
-            for i in range(len(heatmap_data.index)):
-                for j in range(len(heatmap_data.columns)):
-                    value = heatmap_data.iloc[i, j]
-                    if not pd.isna(value):
-                        text_color = 'white' if abs(value) > abs(heatmap_data.values).max() * 0.7 else 'black'
+            # 히트맵 플롯 (색 범위와 글자색 기준은 한 번만 계산)
+            values = heatmap_data.to_numpy(dtype=np.float64)
+            vmax = abs(values).max()
+            text_threshold = vmax * 0.7
+            im = ax.imshow(values, cmap=cmap, aspect='auto', vmin=-vmax, vmax=vmax)
+            
+            # 텍스트 추가 (iloc 대신 ndarray 인덱싱)
+            for i in range(values.shape[0]):
+                for j in range(values.shape[1]):
+                    value = values[i, j]
+                    if not np.isnan(value):
+                        text_color = 'white' if abs(value) > text_threshold else 'black'
                         ax.text(j, i, f'{value:.1f}%', ha='center', va='center',
                                color=text_color, fontweight='bold')
             
@@ -526,23 +772,16 @@ class PerformanceAnalyzer:
             ax.set_title('Monthly Returns Heatmap (%)', fontsize=14, fontweight='bold')
             
             # 컬러바 추가
-            cbar = plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
+            cbar = fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
             cbar.set_label('Return (%)', rotation=270, labelpad=15)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # 이미지를 base64로 인코딩
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-            
-            return image_base64
+            return self._encode_figure(fig)
             
         except Exception as e:
             logger.error(f"월별 히트맵 생성 실패: {e}")
-            plt.close()
             return ""
     
     def _create_trade_analysis_chart(self, result: BacktestResult) -> str:
@@ -552,7 +791,8 @@ class PerformanceAnalyzer:
             if not exit_trades:
                 return ""
             
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+            fig = self._reset_figure(15, 10)
+            ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
             
             # PnL 리스트
             pnls = [t.signal_data.get('pnl', 0) for t in exit_trades]
@@ -595,20 +835,13 @@ class PerformanceAnalyzer:
             ax4.set_ylabel('PnL ($)')
             ax4.grid(True, alpha=0.3)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # 이미지를 base64로 인코딩
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
-            
-            return image_base64
+            return self._encode_figure(fig)
             
         except Exception as e:
             logger.error(f"거래 분석 차트 생성 실패: {e}")
-            plt.close()
             return ""
     
     def generate_summary_report(self, result: BacktestResult, analysis: Dict) -> str:
@@ -618,6 +851,11 @@ class PerformanceAnalyzer:
             risk = analysis.get('risk_metrics', {})
             trade = analysis.get('trade_analysis', {})
             
+            # 손실 거래가 없어 Profit Factor가 NaN이면 Inf로 표시
+            profit_factor = trade.get('profit_factor', 0)
+            if isinstance(profit_factor, float) and np.isnan(profit_factor):
+                profit_factor = 'Inf'
+            
             report = f"""
 📊 **백테스트 결과 요약**
 
@@ -635,7 +873,7 @@ class PerformanceAnalyzer:
 • 승률: {trade.get('win_rate', 0):.1f}%
 • 평균 수익: ${trade.get('avg_win', 0):.2f}
 • 평균 손실: ${trade.get('avg_loss', 0):.2f}
-• Profit Factor: {trade.get('profit_factor', 0)}
+• Profit Factor: {profit_factor}
 
 **⚠️ 리스크**
 • 최대 낙폭: {risk.get('max_drawdown_pct', 0):.2f}%
@@ -4,6 +4,7 @@
 파일 위치: src/core/data_collector.py
 """
 
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 from datetime import datetime, timedelta
@@ -13,8 +14,139 @@ import time
 
 from src.utils.logger import get_logger
 
+try:
+    from numba import njit
+except ImportError:  # pandas-ta 경유로 설치되지만 없을 때도 동작하도록
+    njit = None
+
 logger = get_logger(__name__)
 
+# DB 저장용 캔들 딕셔너리 컬럼 (순서 유지)
+CANDLE_RECORD_COLUMNS = ['symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# MACD(12, 26, 9) / ATR(14) 한 단계 갱신 계수 (pandas-ta의 adjust=False EMA, RMA 점화식과 동일)
+MACD_FAST_ALPHA = 2 / 13
+MACD_SLOW_ALPHA = 2 / 27
+MACD_SIGNAL_ALPHA = 2 / 10
+ATR_LENGTH = 14
+
+def _macd_atr_py(close: np.ndarray, high: np.ndarray, low: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    pandas-ta MACD(12, 26, 9) / ATR(14) 계산
+    
+    Returns:
+        (MACD, 히스토그램, 시그널, ATR) 배열 - 값이 없는 구간은 NaN
+    """
+    close_s = pd.Series(close)
+    macd = ta.macd(close_s, fast=12, slow=26, signal=9)
+    atr = ta.atr(pd.Series(high), pd.Series(low), close_s, length=14)
+    
+    empty = np.full(close.shape[0], np.nan)
+    if macd is None or len(macd.columns) < 3:
+        macd_columns = (empty, empty, empty)
+    else:
+        macd_columns = tuple(macd.iloc[:, k].to_numpy(dtype=np.float64) for k in range(3))
+    return macd_columns + (empty if atr is None else atr.to_numpy(dtype=np.float64),)
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _ewm_step(weighted, cur, alpha):
+        # pandas ewm(adjust=False).mean()의 한 단계와 같은 연산 순서
+        if weighted == cur:
+            return weighted
+        old_wt_factor = 1.0 - alpha
+        return (old_wt_factor * weighted + alpha * cur) / (old_wt_factor + alpha)
+    
+    # nogil: 심볼별 수집 스레드(collect_all_symbols_concurrent)가 지표를 동시에 계산하도록 GIL 해제
+    @njit(cache=True, nogil=True)
+    def _macd_atr(close, high, low):
+        n = close.shape[0]
+        macd_line = np.full(n, np.nan)
+        histogram = np.full(n, np.nan)
+        signal = np.full(n, np.nan)
+        atr = np.full(n, np.nan)
+        
+        # pandas ewm과 같은 방식으로 span/alpha에서 계수 계산
+        fast_alpha = 1.0 / (1.0 + (12 - 1) / 2.0)
+        slow_alpha = 1.0 / (1.0 + (26 - 1) / 2.0)
+        signal_alpha = 1.0 / (1.0 + (9 - 1) / 2.0)
+        atr_alpha = 1.0 / (1.0 + (1.0 / (1.0 / 14) - 1.0))
+        
+        # pandas-ta non_zero_range와 동일하게 0 구간이 있으면 전체 고저폭에 epsilon 가산
+        eps = 0.0
+        for i in range(n):
+            if high[i] - low[i] == 0.0:
+                eps = np.finfo(np.float64).eps
+                break
+        
+        # 한 번의 순회로 EMA(12), EMA(26), 시그널 EMA(9), ATR(14)를 함께 갱신
+        # 각 EMA/RMA는 pandas-ta처럼 첫 구간 평균(SMA)으로 시작
+        fast_sum = 0.0
+        slow_sum = 0.0
+        line_sum = 0.0
+        tr_sum = 0.0
+        ema_fast = 0.0
+        ema_slow = 0.0
+        signal_value = 0.0
+        atr_value = 0.0
+        for i in range(n):
+            price = close[i]
+            
+            if i < 12:
+                fast_sum += price
+                if i == 11:
+                    ema_fast = fast_sum / 12
+            else:
+                ema_fast = _ewm_step(ema_fast, price, fast_alpha)
+            
+            if i < 26:
+                slow_sum += price
+                if i == 25:
+                    ema_slow = slow_sum / 26
+            else:
+                ema_slow = _ewm_step(ema_slow, price, slow_alpha)
+            
+            # MACD는 시그널까지 계산 가능한 길이(34개 이상)일 때만 채움
+            if i >= 25 and n >= 34:
+                line = ema_fast - ema_slow
+                macd_line[i] = line
+                if i < 34:
+                    line_sum += line
+                    if i == 33:
+                        signal_value = line_sum / 9
+                else:
+                    signal_value = _ewm_step(signal_value, line, signal_alpha)
+                if i >= 33:
+                    signal[i] = signal_value
+                    histogram[i] = line - signal_value
+            
+            if n >= 15:
+                if i == 0:
+                    true_range = high[0] - low[0] + eps
+                else:
+                    prev_close = close[i - 1]
+                    true_range = max(high[i] - low[i] + eps, abs(high[i] - prev_close), abs(prev_close - low[i]))
+                if i < 14:
+                    tr_sum += true_range
+                    if i == 13:
+                        atr_value = tr_sum / 14
+                        atr[i] = atr_value
+                else:
+                    atr_value = _ewm_step(atr_value, true_range, atr_alpha)
+                    atr[i] = atr_value
+        
+        return macd_line, histogram, signal, atr
+    
+    # 첫 지표 계산에서 JIT 컴파일 비용이 들지 않도록 임포트 시 예열
+    try:
+        _warmup = np.linspace(1.0, 2.0, 40)
+        _macd_atr(_warmup, _warmup + 0.1, _warmup - 0.1)
+    except Exception:
+        _macd_atr = _macd_atr_py
+else:
+    _macd_atr = _macd_atr_py
+
+
 class DataCollector:
     """시장 데이터 수집 및 지표 계산 (다중 심볼 지원)"""
     
@@ -39,6 +171,10 @@ class DataCollector:
             self.symbols = symbols
             logger.info(f"사용자 지정 심볼: {symbols}")
         
+        # 심볼별 마지막 확정 캔들의 지표 상태 (매분 수집 시 최신 캔들만 한 단계 갱신)
+        # {symbol: {'ema_fast', 'ema_slow', 'signal', 'atr', 'prev_close', 'prev_ts'}}
+        self._indicator_state: Dict[str, Dict] = {}
+        
         logger.info(f"DataCollector 초기화 완료 - 대상 심볼: {self.symbols}")
     
     def add_symbol(self, symbol: str):
@@ -83,30 +219,43 @@ class DataCollector:
                 logger.info(f"{symbol} 데이터가 최신 상태")
                 return True
             
-            # 청크별 데이터 수집
-            total_collected = 0
+            # 청크별 데이터 수집 (저장은 모든 청크를 모아 한 번에)
+            all_candles = []
             
             for i, chunk in enumerate(strategy['chunks'], 1):
                 logger.info(f"{symbol} 청크 {i}/{len(strategy['chunks'])} 수집: "
                            f"{chunk['start_time']} ({chunk['count']}개)")
                 
-                collected_count = self._collect_chunk(symbol, chunk['start_time'], chunk['count'])
-                total_collected += collected_count
+                chunk_candles = self._collect_chunk(symbol, chunk['start_time'], chunk['count'])
+                all_candles.extend(chunk_candles)
                 
-                logger.debug(f"{symbol} 청크 {i} 완료: {collected_count}개")
+                logger.debug(f"{symbol} 청크 {i} 완료: {len(chunk_candles)}개")
                 
                 # 청크 간 간격 (API 제한 방지)
                 if i < len(strategy['chunks']):
                     time.sleep(0.1)
             
-            logger.info(f"{symbol} 과거 데이터 보완 완료: {total_collected}개 수집")
-            return total_collected > 0
+            if not all_candles:
+                logger.warning(f"{symbol} 과거 데이터 보완: 수집된 데이터 없음")
+                return False
+            
+            # DB 저장 (upsert 방식, REST는 DB 클라이언트가 REST_BATCH_SIZE행씩 나눠 전송, COPY 설정 시 한 번에 처리)
+            logger.info(f"[DATACOLLECTOR] 저장 시도: {len(all_candles)}개")
+            success = self.db_client.save_market_data_with_retry(all_candles)
+            logger.info(f"[DATACOLLECTOR] 저장 결과: {success}")
+            
+            if not success:
+                logger.error(f"[DATACOLLECTOR] {symbol} 과거 데이터 저장 실패")
+                return False
+            
+            logger.info(f"{symbol} 과거 데이터 보완 완료: {len(all_candles)}개 수집")
+            return True
             
         except Exception as e:
             logger.error(f"{symbol} 과거 데이터 보완 실패: {e}")
             return False
     
-    def _collect_chunk(self, symbol: str, start_time: datetime, count: int) -> int:
+    def _collect_chunk(self, symbol: str, start_time: datetime, count: int) -> List[Dict]:
         """
         특정 시작점에서 지정된 개수만큼 수집 (근본적 수정)
         
@@ -116,7 +265,7 @@ class DataCollector:
             count: 수집할 개수
             
         Returns:
-            실제 수집된 개수
+            지표가 포함된 캔들 데이터 리스트 (DB 저장은 호출 측에서 한 번에)
         """
         try:
             end_time = start_time + timedelta(minutes=count-1)
@@ -124,68 +273,23 @@ class DataCollector:
             logger.debug(f"{symbol} 청크 수집: {start_time} ~ {end_time} ({count}개)")
             
             # 시간 범위 기반 수집 사용
-            if count <= 1000:
-                # 1000개 이하면 단일 호출
-                df = self.binance_client.get_klines_by_time_range(
-                    symbol=symbol,
-                    interval='1m',
-                    start_time=start_time,
-                    end_time=end_time
-                )
-            else:
-                # 1000개 초과면 대용량 수집
-                df = self.binance_client.get_klines_bulk(
-                    symbol=symbol,
-                    interval='1m',
-                    start_time=start_time,
-                    end_time=end_time
-                )
+            df = self._get_klines_in_range(symbol, start_time, end_time)
             
             if df.empty:
                 logger.warning(f"{symbol} 청크 데이터 없음: {start_time} ~ {end_time}")
-                return 0
+                return []
             
             logger.debug(f"{symbol} 청크 수집 완료: {len(df)}개")
             
             # 지표 계산
-            indicators_data = self._calculate_indicators_for_df(df, symbol)
+            indicators = self._calculate_indicators_for_df(df, symbol)
             
             # DB 저장용 데이터 변환
-            candles_with_indicators = []
-            for _, row in df.iterrows():
-                candle_data = {
-                    'symbol': symbol,
-                    'timestamp': row['timestamp'],
-                    'open': row['open'],
-                    'high': row['high'],
-                    'low': row['low'],
-                    'close': row['close'],
-                    'volume': row['volume']
-                }
-                
-                # 지표 값 추가
-                if row['timestamp'] in indicators_data:
-                    candle_data.update(indicators_data[row['timestamp']])
-                
-                candles_with_indicators.append(candle_data)
-            
-            # DB 저장 (upsert 방식)
-            if candles_with_indicators:
-                logger.info(f"[DATACOLLECTOR] 저장 시도: {len(candles_with_indicators)}개")
-                success = self.db_client.save_market_data_with_retry(candles_with_indicators)
-                logger.info(f"[DATACOLLECTOR] 저장 결과: {success}")
-                if success:
-                    logger.debug(f"{symbol} 청크 저장 완료: {len(candles_with_indicators)}개")
-                    return len(candles_with_indicators)
-                else:
-                    logger.error(f"[DATACOLLECTOR] {symbol} 청크 저장 실패")
-                    return 0
-            
-            return 0
+            return self._build_candle_records(df, symbol, indicators)
             
         except Exception as e:
             logger.error(f"{symbol} 청크 수집 실패: {e}")
-            return 0
+            return []
     
     def ensure_historical_data_all_symbols(self, required_count: int = 200) -> Dict[str, bool]:
         """
@@ -236,8 +340,8 @@ class DataCollector:
         try:
             logger.debug(f"{symbol} 최신 데이터 수집 시작")
             
-            # 최신 1분봉 데이터 수집 (재시도 포함)
-            candles_with_indicators = self._collect_and_calculate_with_retry(symbol, limit=1)
+            # 최신 1분봉 데이터 수집 및 지표 계산 (재시도 포함)
+            candles_with_indicators = self._collect_latest_with_indicators(symbol)
             
             if not candles_with_indicators:
                 logger.error(f"{symbol} 최신 데이터 수집 실패")
@@ -287,7 +391,7 @@ class DataCollector:
             with ThreadPoolExecutor(max_workers=min(len(self.symbols), 3)) as executor:
                 # 각 심볼별 계산 작업 제출
                 future_to_symbol = {
-                    executor.submit(self._collect_and_calculate_with_retry, symbol, 1): symbol
+                    executor.submit(self._collect_latest_with_indicators, symbol): symbol
                     for symbol in self.symbols
                 }
                 
@@ -302,21 +406,25 @@ class DataCollector:
                         logger.error(f"{symbol} 계산 실패: {e}")
                         calculated_data[symbol] = None
             
-            # DB 저장 (순차 처리)
+            # DB 저장 (전체 심볼을 한 번의 배치로 저장)
+            all_candles = []
             for symbol in self.symbols:
                 if calculated_data[symbol]:
-                    try:
-                        success = self.db_client.save_market_data_with_retry(calculated_data[symbol])
-                        results[symbol] = success
-                        if success:
-                            logger.debug(f"{symbol} 저장 완료")
-                        else:
-                            logger.error(f"{symbol} 저장 실패")
-                    except Exception as e:
-                        logger.error(f"{symbol} 저장 중 에러: {e}")
-                        results[symbol] = False
-                else:
-                    results[symbol] = False
+                    all_candles.extend(calculated_data[symbol])
+            
+            saved = False
+            if all_candles:
+                try:
+                    saved = self.db_client.save_market_data_with_retry(all_candles)
+                    if saved:
+                        logger.debug(f"전체 심볼 저장 완료: {len(all_candles)}개")
+                    else:
+                        logger.error("전체 심볼 저장 실패")
+                except Exception as e:
+                    logger.error(f"전체 심볼 저장 중 에러: {e}")
+            
+            for symbol in self.symbols:
+                results[symbol] = bool(calculated_data[symbol]) and saved
             
             elapsed_time = time.time() - start_time
             success_count = sum(results.values())
@@ -362,7 +470,7 @@ class DataCollector:
     
     def _collect_candles_by_range(self, symbol: str, start_time: datetime, end_time: datetime) -> int:
         """
-        특정 시간 구간의 캔들 데이터 수집 (get_klines_by_count 사용)
+        특정 시간 구간의 캔들 데이터 수집 (구간 지정 조회)
         
         Args:
             symbol: 거래 심볼
@@ -377,50 +485,20 @@ class DataCollector:
             total_minutes = int((end_time - start_time).total_seconds() / 60) + 1
             logger.info(f"{symbol} 구간 수집 시작: {start_time} ~ {end_time} ({total_minutes}분)")
             
-            # 기존: get_klines (1000개 제한)
-            # df = self.binance_client.get_klines(symbol, '1m', limit)
-            
-            # 수정: get_klines_by_count (자동 대용량 처리)
-            df = self.binance_client.get_klines_by_count(symbol, '1m', total_minutes)
+            # 최신 N개를 받아 거르면 오래된 구간은 겹치지 않으므로 구간을 지정해서 조회
+            df = self._get_klines_in_range(symbol, start_time, end_time)
             
             if df.empty:
                 logger.warning(f"{symbol} 구간 데이터 없음: {start_time} ~ {end_time}")
                 return 0
             
-            # 시간 범위 필터링 (정확한 범위만)
-            df = df[
-                (df['timestamp'] >= start_time) & 
-                (df['timestamp'] <= end_time)
-            ].copy()
-            
-            if df.empty:
-                logger.warning(f"{symbol} 필터링 후 데이터 없음: {start_time} ~ {end_time}")
-                return 0
-            
             logger.info(f"{symbol} 구간 수집 완료: {len(df)}개")
             
             # 지표 계산
-            indicators_data = self._calculate_indicators_for_df(df, symbol)
+            indicators = self._calculate_indicators_for_df(df, symbol)
             
             # DB 저장용 데이터 변환
-            candles_with_indicators = []
-            for _, row in df.iterrows():
-                candle_data = {
-                    'symbol': symbol,
-                    'timestamp': row['timestamp'],
-                    'open': row['open'],
-                    'high': row['high'],
-                    'low': row['low'],
-                    'close': row['close'],
-                    'volume': row['volume']
-                }
-                
-                # 해당 시간의 지표 값 추가
-                timestamp_key = row['timestamp']
-                if timestamp_key in indicators_data:
-                    candle_data.update(indicators_data[timestamp_key])
-                
-                candles_with_indicators.append(candle_data)
+            candles_with_indicators = self._build_candle_records(df, symbol, indicators)
             
             # DB 저장
             if candles_with_indicators:
@@ -432,6 +510,35 @@ class DataCollector:
             logger.error(f"{symbol} 구간 수집 실패 ({start_time} ~ {end_time}): {e}")
             return 0
     
+    def _get_klines_in_range(self, symbol: str, start_time: datetime, end_time: datetime) -> pd.DataFrame:
+        """
+        시간 구간의 1분봉 조회 (1000개 이하면 단일 호출, 초과면 나눠서 조회)
+        
+        Args:
+            symbol: 거래 심볼
+            start_time: 시작 시간
+            end_time: 종료 시간
+            
+        Returns:
+            캔들 데이터 DataFrame
+        """
+        count = int((end_time - start_time).total_seconds() // 60) + 1
+        
+        if count <= 1000:
+            return self.binance_client.get_klines_by_time_range(
+                symbol=symbol,
+                interval='1m',
+                start_time=start_time,
+                end_time=end_time
+            )
+        
+        return self.binance_client.get_klines_bulk(
+            symbol=symbol,
+            interval='1m',
+            start_time=start_time,
+            end_time=end_time
+        )
+    
     def _collect_and_calculate_with_retry(self, symbol: str, limit: int = 200) -> Optional[List[Dict]]:
         """
         데이터 수집 및 지표 계산 (get_klines_by_count 사용)
@@ -445,64 +552,24 @@ class DataCollector:
         """
         for attempt in range(2):  # 2회 시도
             try:
-                # 기존: get_klines (1000개 제한)
-                # df = self.binance_client.get_klines(symbol, '1m', limit)
+                # 지표 계산에는 최소 50개가 필요하므로 적게 요청하면 200개를 한 번에 받아 끝부분만 반환
+                # (요청 개수와 지표용 데이터를 따로 받으면 호출이 두 번 들고 분 경계에서 어긋날 수 있음)
+                fetch_count = 200 if limit < 50 else limit
                 
-                # 수정: get_klines_by_count (자동 대용량 처리)
-                df = self.binance_client.get_klines_by_count(symbol, '1m', limit)
+                # get_klines_by_count (자동 대용량 처리)
+                df = self.binance_client.get_klines_by_count(symbol, '1m', fetch_count)
                 
                 if df.empty:
                     raise ValueError(f"{symbol} 캔들 데이터가 없습니다")
                 
-                # 지표 계산용으로 더 많은 데이터 필요한 경우
-                if limit < 50 and len(df) < 50:
-                    # 최신 데이터 계산을 위해 200개 데이터로 지표 계산
-                    df_for_indicators = self.binance_client.get_klines_by_count(symbol, '1m', 200)
-                    indicators_data = self._calculate_indicators_for_df(df_for_indicators, symbol)
-                    
-                    # 원래 요청한 개수만큼만 반환 데이터 준비
-                    result_data = []
-                    for _, row in df.tail(limit).iterrows():
-                        candle_data = {
-                            'symbol': symbol,
-                            'timestamp': row['timestamp'],
-                            'open': row['open'],
-                            'high': row['high'],
-                            'low': row['low'],
-                            'close': row['close'],
-                            'volume': row['volume']
-                        }
-                        
-                        # 지표 값 추가
-                        if row['timestamp'] in indicators_data:
-                            candle_data.update(indicators_data[row['timestamp']])
-                        
-                        result_data.append(candle_data)
-                    
-                    return result_data
+                indicators = self._calculate_indicators_for_df(df, symbol)
                 
-                else:
-                    # 충분한 데이터가 있는 경우 바로 계산
-                    indicators_data = self._calculate_indicators_for_df(df, symbol)
-                    
-                    result_data = []
-                    for _, row in df.tail(limit).iterrows():
-                        candle_data = {
-                            'symbol': symbol,
-                            'timestamp': row['timestamp'],
-                            'open': row['open'],
-                            'high': row['high'],
-                            'low': row['low'],
-                            'close': row['close'],
-                            'volume': row['volume']
-                        }
-                        
-                        if row['timestamp'] in indicators_data:
-                            candle_data.update(indicators_data[row['timestamp']])
-                        
-                        result_data.append(candle_data)
-                    
-                    return result_data
+                if limit < 50:
+                    # 매분 수집용 지표 상태 저장 (다음 수집부터 최신 캔들만 갱신)
+                    self._seed_indicator_state(symbol, df, indicators)
+                
+                # 원래 요청한 개수만큼만 반환 데이터 준비
+                return self._build_candle_records(df.tail(limit), symbol, indicators)
                 
             except Exception as e:
                 if attempt == 0:
@@ -514,7 +581,166 @@ class DataCollector:
         
         return None
     
-    def _calculate_indicators_for_df(self, df: pd.DataFrame, symbol: str) -> Dict[datetime, Dict]:
+    def _collect_latest_with_indicators(self, symbol: str) -> Optional[List[Dict]]:
+        """
+        최신 캔들 1개와 지표 계산
+        
+        직전 지표 상태가 이어지면 최신 캔들만 갱신하고, 아니면 200개로 다시 계산한다.
+        
+        Args:
+            symbol: 거래 심볼
+            
+        Returns:
+            지표가 포함된 최신 캔들 데이터 리스트 (실패 시 None)
+        """
+        candles_with_indicators = self._collect_latest_incremental(symbol)
+        if candles_with_indicators is None:
+            candles_with_indicators = self._collect_and_calculate_with_retry(symbol, limit=1)
+        return candles_with_indicators
+    
+    def _collect_latest_incremental(self, symbol: str) -> Optional[List[Dict]]:
+        """
+        저장된 지표 상태에서 최신 캔들 지표만 한 단계 갱신
+        
+        최근 2개 캔들(직전 확정 캔들 + 진행 중인 최신 캔들)만 조회해서
+        확정 캔들로 상태를 전진시킨 뒤 최신 캔들의 지표를 계산한다.
+        
+        Args:
+            symbol: 거래 심볼
+            
+        Returns:
+            지표가 포함된 최신 캔들 데이터 리스트 (상태가 없거나 끊겼으면 None)
+        """
+        state = self._indicator_state.get(symbol)
+        if state is None:
+            return None
+        
+        try:
+            # 캔들 2개뿐이므로 DataFrame 없이 딕셔너리로 받음
+            candles = self.binance_client.get_recent_candles(symbol, '1m', 2)
+            if len(candles) < 2:
+                return None
+            
+            closed = candles[-2]
+            latest = candles[-1]
+            
+            gap = closed['timestamp'] - state['prev_ts']
+            if gap == timedelta(minutes=1):
+                # 직전 캔들이 새로 확정됨 → 상태 전진
+                state = self._advance_indicator_state(state, closed)
+                self._indicator_state[symbol] = state
+            elif gap != timedelta(0):
+                logger.debug(f"{symbol} 지표 상태가 끊김 ({state['prev_ts']} → {closed['timestamp']}), 전체 재계산")
+                return None
+            
+            # 진행 중인 최신 캔들은 저장하지 않고 지표만 계산
+            latest_state = self._advance_indicator_state(state, latest)
+            macd_line = latest_state['ema_fast'] - latest_state['ema_slow']
+            candle_data = {'symbol': symbol, **latest}
+            candle_data.update({
+                'macd_12_26_9_line': macd_line,
+                'macd_12_26_9_histogram': macd_line - latest_state['signal'],
+                'macd_12_26_9_signal': latest_state['signal'],
+                'atr_14_value': latest_state['atr']
+            })
+            
+            return [candle_data]
+            
+        except Exception as e:
+            logger.warning(f"{symbol} 지표 증분 계산 실패, 전체 재계산: {e}")
+            self._indicator_state.pop(symbol, None)
+            return None
+    
+    def _seed_indicator_state(self, symbol: str, df: pd.DataFrame, indicators: pd.DataFrame):
+        """
+        전체 지표 계산 결과로 마지막 확정 캔들(끝에서 두 번째)의 지표 상태 저장
+        
+        Args:
+            symbol: 거래 심볼
+            df: 지표 계산에 사용한 OHLCV DataFrame (마지막 행은 진행 중인 캔들)
+            indicators: _calculate_indicators_for_df 결과 (df와 같은 행 순서)
+        """
+        try:
+            if len(df) < 50 or indicators.empty:
+                return
+            
+            closed = df.iloc[-2]
+            indicator_values = indicators.iloc[-2]
+            if pd.isna(indicator_values['macd_12_26_9_signal']) or pd.isna(indicator_values['atr_14_value']):
+                return
+            
+            # MACD 결과에는 두 EMA가 따로 남지 않으므로 같은 방식으로 다시 계산
+            ema_fast = df.ta.ema(length=12)
+            ema_slow = df.ta.ema(length=26)
+            
+            self._indicator_state[symbol] = {
+                'ema_fast': float(ema_fast.iloc[-2]),
+                'ema_slow': float(ema_slow.iloc[-2]),
+                'signal': float(indicator_values['macd_12_26_9_signal']),
+                'atr': float(indicator_values['atr_14_value']),
+                'prev_close': float(closed['close']),
+                'prev_ts': closed['timestamp']
+            }
+            
+        except Exception as e:
+            logger.warning(f"{symbol} 지표 상태 저장 실패: {e}")
+            self._indicator_state.pop(symbol, None)
+    
+    @staticmethod
+    def _advance_indicator_state(state: Dict, candle) -> Dict:
+        """지표 상태에 캔들 하나를 반영한 새 상태 반환 (EMA/RMA 한 단계 점화식)"""
+        close = float(candle['close'])
+        high = float(candle['high'])
+        low = float(candle['low'])
+        
+        ema_fast = MACD_FAST_ALPHA * close + (1 - MACD_FAST_ALPHA) * state['ema_fast']
+        ema_slow = MACD_SLOW_ALPHA * close + (1 - MACD_SLOW_ALPHA) * state['ema_slow']
+        signal = MACD_SIGNAL_ALPHA * (ema_fast - ema_slow) + (1 - MACD_SIGNAL_ALPHA) * state['signal']
+        
+        prev_close = state['prev_close']
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        atr = (state['atr'] * (ATR_LENGTH - 1) + true_range) / ATR_LENGTH
+        
+        return {
+            'ema_fast': ema_fast,
+            'ema_slow': ema_slow,
+            'signal': signal,
+            'atr': atr,
+            'prev_close': close,
+            'prev_ts': candle['timestamp']
+        }
+    
+    def _build_candle_records(self, df: pd.DataFrame, symbol: str,
+                              indicators: pd.DataFrame) -> List[Dict]:
+        """
+        OHLCV DataFrame을 DB 저장용 캔들 딕셔너리 리스트로 변환
+        
+        Args:
+            df: OHLCV 데이터 DataFrame
+            symbol: 거래 심볼
+            indicators: _calculate_indicators_for_df 결과 (index: timestamp)
+            
+        Returns:
+            지표 값이 병합된 캔들 데이터 리스트
+        """
+        candles = df.assign(symbol=symbol)[CANDLE_RECORD_COLUMNS]
+        
+        # 행마다 Timestamp를 해시하는 대신 시간 인덱스 조인으로 지표 컬럼 병합
+        if not indicators.empty:
+            candles = candles.join(indicators, on='timestamp')
+        
+        # iterrows()의 행별 Series 생성 대신 컬럼 단위로 한 번에 딕셔너리 변환
+        records = candles.to_dict('records')
+        
+        # 값이 없는(NaN) 지표는 키를 생략
+        for record in records:
+            for name in indicators.columns:
+                if record[name] != record[name]:
+                    del record[name]
+        
+        return records
+    
+    def _calculate_indicators_for_df(self, df: pd.DataFrame, symbol: str) -> pd.DataFrame:
         """
         DataFrame에 대한 지표 계산
         
@@ -523,52 +749,33 @@ class DataCollector:
             symbol: 심볼명 (로깅용)
             
         Returns:
-            {timestamp: {지표명: 값}} 딕셔너리
+            지표 DataFrame (index: timestamp, df와 같은 행 순서, 값이 없으면 NaN / 실패 시 빈 DataFrame)
         """
         try:
             if len(df) < 50:
                 logger.warning(f"{symbol} 지표 계산을 위한 데이터 부족: {len(df)}개")
-                return {}
-            
-            # MACD 계산 (12, 26, 9)
-            macd = df.ta.macd(fast=12, slow=26, signal=9)
+                return pd.DataFrame()
             
-            # ATR 계산 (14)
-            atr = df.ta.atr(length=14)
+            # MACD(12, 26, 9) / ATR(14) 계산 (numba가 있으면 한 번의 루프로 계산)
+            macd_line, macd_histogram, macd_signal, atr = _macd_atr(
+                df['close'].to_numpy(dtype=np.float64),
+                df['high'].to_numpy(dtype=np.float64),
+                df['low'].to_numpy(dtype=np.float64)
+            )
             
-            # 결과 딕셔너리 생성
-            indicators_data = {}
-            for i in range(len(df)):
-                timestamp = df.iloc[i]['timestamp']
-                
-                indicator_values = {}
-                
-                # MACD 값들 추가 (NaN 체크)
-                if macd is not None and len(macd.columns) >= 3:
-                    macd_line = macd.iloc[i, 0] if not pd.isna(macd.iloc[i, 0]) else None
-                    macd_histogram = macd.iloc[i, 1] if not pd.isna(macd.iloc[i, 1]) else None
-                    macd_signal = macd.iloc[i, 2] if not pd.isna(macd.iloc[i, 2]) else None
-                    
-                    if macd_line is not None:
-                        indicator_values['macd_12_26_9_line'] = float(macd_line)
-                    if macd_histogram is not None:
-                        indicator_values['macd_12_26_9_histogram'] = float(macd_histogram)
-                    if macd_signal is not None:
-                        indicator_values['macd_12_26_9_signal'] = float(macd_signal)
-                
-                # ATR 값 추가 (NaN 체크)
-                if atr is not None and i < len(atr) and not pd.isna(atr.iloc[i]):
-                    indicator_values['atr_14_value'] = float(atr.iloc[i])
-                
-                if indicator_values:  # 지표 값이 있는 경우만 추가
-                    indicators_data[timestamp] = indicator_values
+            indicators = pd.DataFrame({
+                'macd_12_26_9_line': macd_line,
+                'macd_12_26_9_histogram': macd_histogram,
+                'macd_12_26_9_signal': macd_signal,
+                'atr_14_value': atr
+            }, index=pd.Index(df['timestamp']))
             
-            logger.debug(f"{symbol} 지표 계산 완료: {len(indicators_data)}개 시점")
-            return indicators_data
+            logger.debug(f"{symbol} 지표 계산 완료: {len(indicators)}개 캔들")
+            return indicators
             
         except Exception as e:
             logger.error(f"{symbol} 지표 계산 실패: {e}")
-            return {}
+            return pd.DataFrame()
     
     def get_symbols(self) -> List[str]:
         """현재 설정된 심볼 목록 반환"""
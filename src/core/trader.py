@@ -38,6 +38,9 @@ class Trader:
         self.investment_ratio = investment_ratio
         self.investment_amount = allocated_budget * investment_ratio
         
+        # 거래 내역 저장 함수 (trader_id가 미리 바인딩됨)
+        self.trade_writer = supabase_client.make_trade_writer(trader_id)
+        
         # 현재 포지션 정보 캐시
         self.current_position = None
         self.position_size = 0.0
@@ -433,7 +436,7 @@ class Trader:
     def save_trade_to_db(self, trade_data: Dict):
         """거래 내역을 DB에 저장"""
         try:
-            success = self.db_client.save_trade(self.trader_id, trade_data)
+            success = self.trade_writer(trade_data)
             if success:
                 logger.debug(f"Trader {self.trader_id} 거래 내역 저장 완료")
             else:
@@ -6,10 +6,14 @@ MACD + ATR 전략 구현 (수정된 버전)
 
 from typing import Dict, Optional, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from abc import ABC, abstractmethod
 
 from src.utils.logger import get_logger
+from src.strategies.signals import (
+    SIGNAL_ENTRY_LONG, SIGNAL_ENTRY_SHORT, SIGNAL_EXIT_LONG, SIGNAL_EXIT_SHORT
+)
 
 logger = get_logger(__name__)
 
@@ -252,6 +256,70 @@ class MACDATRStrategy(Strategy):
                 'debug_info': {'error': str(e)}
             }
     
+    def generate_signals_batch(self, market_data: pd.DataFrame) -> np.ndarray:
+        """
+        전체 구간의 시그널을 한 번에 계산 (백테스팅용)
+        
+        generate_signal을 바마다 호출한 것과 같은 조건을 컬럼 단위로 계산해
+        바별 시그널 비트 플래그(SIGNAL_*)로 반환. 진입/청산 중 실제 적용할 시그널은
+        백테스터가 포지션 상태에 따라 고른다.
+        
+        Args:
+            market_data: 시장 데이터 (OHLCV + 지표)
+            
+        Returns:
+            바별 시그널 플래그 배열 (int8)
+        """
+        n = len(market_data)
+        flags = np.zeros(n, dtype=np.int8)
+        
+        columns = ('macd_12_26_9_line', 'macd_12_26_9_signal', 'macd_12_26_9_histogram', 'atr_14_value')
+        if n < 2 or any(col not in market_data.columns for col in columns):
+            return flags
+        
+        values = {}
+        is_none = {}
+        for col in columns:
+            raw = market_data[col].to_numpy()
+            # generate_signal은 None 값이면 HOLD (NaN은 비교 결과가 False일 뿐 HOLD 아님)
+            is_none[col] = np.equal(raw, None) if raw.dtype == object else np.zeros(n, dtype=bool)
+            values[col] = pd.to_numeric(market_data[col], errors='coerce').to_numpy(dtype=np.float64)
+        
+        line = values['macd_12_26_9_line']
+        signal = values['macd_12_26_9_signal']
+        hist = values['macd_12_26_9_histogram']
+        atr = values['atr_14_value']
+        close = market_data['close'].to_numpy(dtype=np.float64)
+        
+        # 현재 바(1:)와 이전 바(:-1) 비교
+        line_now, line_prev = line[1:], line[:-1]
+        signal_now, signal_prev = signal[1:], signal[:-1]
+        hist_now, hist_prev = hist[1:], hist[:-1]
+        
+        with np.errstate(invalid='ignore'):
+            bullish_cross = (line_prev <= signal_prev) & (line_now > signal_now)
+            bearish_cross = (line_prev >= signal_prev) & (line_now < signal_now)
+            hist_positive = (hist_prev <= 0) & (hist_now > 0)
+            hist_negative = (hist_prev >= 0) & (hist_now < 0)
+            atr_ok = atr[1:] > close[1:] * 0.005
+        
+        bar_flags = (
+            np.where(bullish_cross & hist_positive & atr_ok, SIGNAL_ENTRY_LONG, 0)
+            | np.where(bearish_cross & hist_negative & atr_ok, SIGNAL_ENTRY_SHORT, 0)
+            | np.where(bearish_cross | hist_negative, SIGNAL_EXIT_LONG, 0)
+            | np.where(bullish_cross | hist_positive, SIGNAL_EXIT_SHORT, 0)
+        )
+        
+        # 현재 지표 값 중 하나라도, 또는 이전 MACD 값 중 하나라도 None이면 HOLD
+        macd_none = is_none[columns[0]] | is_none[columns[1]] | is_none[columns[2]]
+        none_mask = macd_none[1:] | is_none[columns[3]][1:] | macd_none[:-1]
+        bar_flags[none_mask] = 0
+        flags[1:] = bar_flags
+        
+        # generate_signal은 데이터가 50개 미만이면 HOLD
+        flags[:49] = 0
+        return flags
+    
     def get_strategy_info(self) -> Dict:
         """전략 정보 반환"""
         return {
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+매매 시그널 비트 플래그
+파일 위치: src/strategies/signals.py
+
+전략(generate_signals)과 백테스터(run_backtest의 signals 인자)가 함께 쓰는 값.
+"""
+
+SIGNAL_ENTRY_LONG = 1
+SIGNAL_ENTRY_SHORT = 2
+SIGNAL_EXIT_LONG = 4
+SIGNAL_EXIT_SHORT = 8
@@ -4,12 +4,14 @@
 파일 위치: tests/test_backtesting.py
 """
 
+import gc
 import os
 import sys
 import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 from dotenv import load_dotenv
 
@@ -18,10 +20,33 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-from src.backtesting.backtester import Backtester, BacktestResult
+from src.backtesting.backtester import (
+    Backtester, BacktestResult, EQUITY_DTYPE,
+    SIGNAL_ENTRY_LONG, SIGNAL_ENTRY_SHORT, SIGNAL_EXIT_LONG, SIGNAL_EXIT_SHORT
+)
 from src.backtesting.performance_analyzer import PerformanceAnalyzer
 from src.backtesting.backtest_reporter import BacktestReporter
 
+def _make_backtest_result(name: str, final_capital: float) -> BacktestResult:
+    """거래 없이 자본 곡선만 있는 테스트용 백테스트 결과"""
+    dates = pd.date_range(start='2025-01-01', periods=30, freq='D')
+    equity_curve = pd.DataFrame({
+        'timestamp': dates,
+        'total_value': np.linspace(10000.0, final_capital, len(dates))
+    })
+    total_return = final_capital - 10000.0
+    
+    return BacktestResult(
+        strategy_name=name, symbol="BTCUSDT",
+        start_date=dates[0], end_date=dates[-1],
+        initial_capital=10000.0, final_capital=final_capital,
+        total_return=total_return, total_return_pct=total_return / 100,
+        total_trades=0, winning_trades=0, losing_trades=0, win_rate=0.0,
+        avg_win=0.0, avg_loss=0.0, max_drawdown=0.0, max_drawdown_pct=0.0,
+        sharpe_ratio=0.0, trades=[], equity_curve=equity_curve
+    )
+
+
 class TestBacktester:
     """Backtester 단위 테스트"""
     
@@ -74,7 +99,7 @@ class TestBacktester:
             {'signal': 'HOLD', 'confidence': 0.5, 'reason': 'Test hold'}
         ]
         
-        strategy.generate_signal.side_effect = lambda symbol, position: signal_cycle[
+        strategy.generate_signal.side_effect = lambda symbol, current_position=None, market_data=None: signal_cycle[
             strategy.generate_signal.call_count % len(signal_cycle)
         ]
         
@@ -120,6 +145,28 @@ class TestBacktester:
         assert len(result.trades) > 0
         assert not result.equity_curve.empty
     
+    def test_bar_error_logged_and_raised(self, sample_market_data):
+        """바 처리 중 예외는 바 번호와 함께 로그를 남기고 그대로 전파"""
+        strategy = Mock()
+        hold = {'signal': 'HOLD', 'confidence': 0.5, 'reason': 'Test hold'}
+        
+        def generate_signal(symbol, current_position=None, market_data=None):
+            if strategy.generate_signal.call_count == 6:
+                raise RuntimeError("strategy failure")
+            return hold
+        
+        strategy.generate_signal.side_effect = generate_signal
+        backtester = Backtester(initial_capital=10000.0)
+        
+        with patch('src.backtesting.backtester.logger') as mock_logger:
+            with pytest.raises(RuntimeError, match="strategy failure"):
+                backtester.run_backtest(strategy, sample_market_data, "BTCUSDT")
+        
+        bar_errors = [call.args[0] for call in mock_logger.error.call_args_list if '바 처리 중 에러' in call.args[0]]
+        assert len(bar_errors) == 1
+        assert '5번째 바' in bar_errors[0]
+        assert strategy.generate_signal.call_count == 6
+    
     def test_position_management(self, mock_strategy):
         """포지션 관리 테스트"""
         backtester = Backtester(initial_capital=10000.0)
@@ -145,6 +192,119 @@ class TestBacktester:
         # 수익 확인 (51000 - 50000 = 1000 이익, 수수료 제외)
         assert backtester.current_capital > 10000.0
 
+    
+    def test_signal_array_matches_bar_loop(self, sample_market_data):
+        """시그널 배열 시뮬레이션이 바 단위 실행과 같은 결과를 내는지 테스트"""
+        rng = np.random.default_rng(0)
+        flags = rng.integers(0, 16, len(sample_market_data)).astype(np.int8)
+        
+        class FlagStrategy:
+            """플래그 배열을 포지션에 맞는 시그널로 돌려주는 전략"""
+            def __init__(self):
+                self.index = 0
+            
+            def generate_signal(self, symbol, current_position=None, market_data=None):
+                f = flags[self.index]
+                self.index += 1
+                if current_position is None:
+                    signal = 'ENTRY_LONG' if f & SIGNAL_ENTRY_LONG else 'ENTRY_SHORT' if f & SIGNAL_ENTRY_SHORT else 'HOLD'
+                elif current_position == 'LONG':
+                    signal = 'EXIT_LONG' if f & SIGNAL_EXIT_LONG else 'HOLD'
+                else:
+                    signal = 'EXIT_SHORT' if f & SIGNAL_EXIT_SHORT else 'HOLD'
+                return {'signal': signal, 'reason': 'SIGNAL'}
+        
+        loop_result = Backtester().run_backtest(FlagStrategy(), sample_market_data, "BTCUSDT")
+        array_result = Backtester().run_backtest(FlagStrategy(), sample_market_data, "BTCUSDT", signals=flags)
+        
+        assert loop_result.total_trades > 0
+        assert array_result.final_capital == pytest.approx(loop_result.final_capital)
+        assert array_result.total_trades == loop_result.total_trades
+        assert [t.price for t in array_result.trades] == [t.price for t in loop_result.trades]
+        pd.testing.assert_frame_equal(array_result.equity_curve, loop_result.equity_curve)
+        
+        # 거래 배열이 거래 내역과 일치
+        for result in (loop_result, array_result):
+            exits = [t for t in result.trades if t.trade_type == 'EXIT']
+            np.testing.assert_array_equal(result.exit_pnls, [t.signal_data['pnl'] for t in exits])
+            np.testing.assert_array_equal(result.exit_timestamps, pd.to_datetime([t.timestamp for t in exits]))
+            assert len(result.entry_timestamps) == len(result.trades) - len(exits)
+
+    
+    def test_macd_batch_signals_match_bar_loop(self, sample_market_data):
+        """MACD 전략의 일괄 시그널이 바 단위 generate_signal과 같은 거래를 내는지 테스트"""
+        from src.strategies.macd_atr import MACDATRStrategy
+        
+        market_data = sample_market_data.copy()
+        market_data['macd_12_26_9_histogram'] = (
+            market_data['macd_12_26_9_line'] - market_data['macd_12_26_9_signal']
+        )
+        strategy = MACDATRStrategy()
+        
+        batch_result = Backtester().run_backtest(strategy, market_data, "BTCUSDT")
+        with patch.object(MACDATRStrategy, 'generate_signals_batch', None):
+            loop_result = Backtester().run_backtest(strategy, market_data, "BTCUSDT")
+        
+        assert loop_result.total_trades > 0
+        assert [(t.timestamp, t.trade_type, t.price) for t in batch_result.trades] == \
+               [(t.timestamp, t.trade_type, t.price) for t in loop_result.trades]
+        assert batch_result.final_capital == pytest.approx(loop_result.final_capital)
+        
+        # 거래 기록의 시그널 정보(진입 시그널 딕셔너리, 청산 사유)도 바 단위 실행과 동일
+        for batch_trade, loop_trade in zip(batch_result.trades, loop_result.trades):
+            batch_data = dict(batch_trade.signal_data)
+            loop_data = dict(loop_trade.signal_data)
+            assert batch_data.pop('pnl', None) == pytest.approx(loop_data.pop('pnl', None))
+            assert batch_data == loop_data
+        assert any(t.signal_data.get('reason') == 'MACD 상향 돌파 + 히스토그램 양전환'
+                   or t.signal_data.get('reason') == 'MACD 하향 돌파 + 히스토그램 음전환'
+                   for t in batch_result.trades)
+
+    
+    def test_signal_cache(self, sample_market_data):
+        """같은 데이터로 다시 실행하면 캐시된 시그널을 재사용하는지 테스트"""
+        strategy = Mock(spec=['generate_signal'])
+        strategy.generate_signal.side_effect = lambda symbol, current_position, market_data: {
+            'signal': 'ENTRY_LONG' if current_position is None and len(market_data) % 7 == 0
+                      else 'EXIT_LONG' if current_position and len(market_data) % 5 == 0 else 'HOLD',
+            'reason': 'Test'
+        }
+        backtester = Backtester(signal_cache_size=1024)
+        
+        first = backtester.run_backtest(strategy, sample_market_data, "BTCUSDT")
+        calls = strategy.generate_signal.call_count
+        second = backtester.run_backtest(strategy, sample_market_data, "BTCUSDT")
+        
+        assert strategy.generate_signal.call_count == calls
+        assert backtester.signal_cache_hits == len(sample_market_data)
+        assert second.final_capital == first.final_capital
+        assert second.total_trades == first.total_trades > 0
+
+    def test_equity_sample_interval(self, sample_market_data):
+        """간격 기록 시 기록 수는 줄고 결과 곡선은 전체 바로 채워지는지 테스트"""
+        strategy = Mock(spec=['generate_signal'])
+        strategy.generate_signal.side_effect = lambda symbol, current_position, market_data: {
+            'signal': 'ENTRY_LONG' if current_position is None and len(market_data) == 30
+                      else 'EXIT_LONG' if current_position and len(market_data) == 50 else 'HOLD',
+            'reason': 'Test'
+        }
+        full = Backtester().run_backtest(strategy, sample_market_data, "BTCUSDT")
+
+        backtester = Backtester(equity_sample_interval=60)
+        sampled = backtester.run_backtest(strategy, sample_market_data, "BTCUSDT")
+
+        assert backtester._eq_len < len(sample_market_data)
+        assert len(sampled.equity_curve) == len(full.equity_curve) == len(sample_market_data)
+        assert sampled.equity_curve['timestamp'].equals(full.equity_curve['timestamp'])
+        assert sampled.final_capital == full.final_capital
+        assert sampled.equity_curve['capital'].iloc[-1] == full.equity_curve['capital'].iloc[-1]
+
+        # 구조화 배열도 빈 바를 채운 같은 곡선
+        arr = backtester.equity_array
+        assert arr.dtype == EQUITY_DTYPE
+        assert len(arr) == len(sample_market_data)
+        np.testing.assert_array_equal(arr['total_value'], sampled.equity_curve['total_value'].to_numpy())
+
 
 class TestPerformanceAnalyzer:
     """PerformanceAnalyzer 단위 테스트"""
@@ -246,6 +406,51 @@ class TestPerformanceAnalyzer:
         assert trade['winning_trades'] == 1
         assert trade['win_rate'] == 100.0
     
+    def test_analysis_without_charts(self, sample_backtest_result):
+        """차트 없이 지표만 분석하는지 테스트"""
+        analyzer = PerformanceAnalyzer()
+        
+        with patch.object(analyzer, '_generate_charts') as generate_charts:
+            analysis = analyzer.analyze_performance(sample_backtest_result, include_charts=False)
+        
+        generate_charts.assert_not_called()
+        assert analysis['charts'] == {}
+        assert analysis['trade_analysis']['total_trades'] == 1
+    
+    def test_analysis_memoized(self):
+        """같은 결과 객체는 다시 분석하지 않고, 결과가 바뀌면 다시 분석하는지 테스트"""
+        analyzer = PerformanceAnalyzer()
+        result = _make_backtest_result('Memo', 11000.0)
+        
+        with patch.object(analyzer, '_analyze', wraps=analyzer._analyze) as analyze:
+            first = analyzer.analyze_performance(result, include_charts=False)
+            assert analyzer.analyze_performance(result, include_charts=False) is first
+            assert analyze.call_count == 1
+            
+            # 지문 필드가 바뀌면 캐시 무효화
+            result.final_capital = 12000.0
+            assert analyzer.analyze_performance(result, include_charts=False) is not first
+            assert analyze.call_count == 2
+        
+        assert analyzer.analysis_cache_hits == 1
+        
+        del result, first, analyze
+        gc.collect()
+        assert analyzer._analysis_cache == {}
+    
+    def test_concurrent_chart_generation(self):
+        """여러 분석을 동시에 실행해도 순차 실행과 같은 차트를 생성하는지 테스트"""
+        results = [_make_backtest_result(f'C{i}', 10000.0 + 500.0 * i) for i in range(4)]
+        
+        sequential = [PerformanceAnalyzer()._generate_charts(r) for r in results]
+        
+        analyzer = PerformanceAnalyzer()
+        with ThreadPoolExecutor(max_workers=len(results)) as executor:
+            concurrent = list(executor.map(analyzer._generate_charts, results))
+        
+        assert all(charts for charts in concurrent)
+        assert concurrent == sequential
+    
     def test_summary_report_generation(self, sample_backtest_result):
         """요약 리포트 생성 테스트"""
         analyzer = PerformanceAnalyzer()
@@ -259,6 +464,17 @@ class TestPerformanceAnalyzer:
         assert "BTCUSDT" in report
         assert "29.00%" in report  # 수익률
 
+    def test_numeric_kernels_match_numpy(self):
+        """낙폭/PnL 집계 커널이 numpy 구현과 같은 결과를 내는지 테스트"""
+        from src.backtesting import performance_analyzer as pa
+        
+        rng = np.random.default_rng(1)
+        values = 10000 * np.cumprod(1 + rng.normal(0, 0.01, 500))
+        pnls = np.round(rng.normal(0, 50, 200), 0)  # 0인 거래 포함
+        
+        assert pa._drawdown_stats(values, 0.01) == pytest.approx(pa._drawdown_stats_py(values, 0.01))
+        assert pa._pnl_stats(pnls) == pytest.approx(pa._pnl_stats_py(pnls))
+
 
 class TestBacktestReporter:
     """BacktestReporter 단위 테스트"""
@@ -292,6 +508,125 @@ class TestBacktestReporter:
         assert header_block['type'] == 'header'
         assert 'text' in header_block
     
+    def test_comparison_block_creation(self, mock_slack_client):
+        """전략 비교 블록 생성 테스트 (수익률 내림차순)"""
+        reporter = BacktestReporter(mock_slack_client)
+        
+        results = [
+            _make_backtest_result(name, final_capital)
+            for name, final_capital in [('Low', 9000.0), ('High', 12000.0), ('Mid', 10500.0)]
+        ]
+        
+        blocks = reporter._create_comparison_blocks(results)
+        
+        strategy_texts = [
+            b['text']['text'] for b in blocks
+            if b['type'] == 'section' and b['text']['text'].startswith(('🥇', '🥈', '🥉'))
+        ]
+        assert [t.split('*')[1] for t in strategy_texts] == ['High', 'Mid', 'Low']
+    
+    def test_comparison_report_chunking(self, mock_slack_client):
+        """블록 수가 제한을 넘으면 여러 메시지로 나눠 전송하는지 테스트"""
+        reporter = BacktestReporter(mock_slack_client)
+        results = [_make_backtest_result(f'S{i}', 10000.0 + i) for i in range(21)]
+        
+        # 비교 리포트는 지표 표만 보내므로 차트를 렌더링하지 않음
+        with patch.object(reporter.analyzer, '_generate_charts', return_value={}) as generate_charts:
+            assert reporter.send_comparison_report(results) is True
+        generate_charts.assert_not_called()
+        
+        sent_calls = mock_slack_client.send_message.call_args_list
+        sent_blocks = [c.kwargs['blocks'] for c in sent_calls]
+        assert len(sent_blocks) == 2
+        assert [c.kwargs['text'].rsplit(' ', 1)[-1] for c in sent_calls] == ['[1/2]', '[2/2]']
+        assert all(len(b) <= reporter.MAX_BLOCKS_PER_MESSAGE for b in sent_blocks)
+        assert sum(len(b) for b in sent_blocks) == len(reporter._create_comparison_blocks(results))
+        assert any(b[-1]['type'] == 'context' for b in sent_blocks)
+    
+    def test_analysis_cache(self, mock_slack_client):
+        """같은 결과 객체에 대한 분석 재사용 테스트"""
+        reporter = BacktestReporter(mock_slack_client)
+        result = _make_backtest_result('Cached', 11000.0)
+        
+        analyzer = reporter.analyzer
+        with patch.object(analyzer, '_analyze', wraps=analyzer._analyze) as analyze:
+            first = reporter._analyze(result)
+            second = reporter._analyze(result)
+            
+            assert first is second
+            assert analyze.call_count == 1
+            
+            # 분석 후 결과가 바뀌면 리포터도 다시 분석한 결과를 받음
+            result.final_capital = 12000.0
+            assert reporter._analyze(result) is not first
+            assert analyze.call_count == 2
+        
+        assert analyzer.analysis_cache_hits == 1
+        
+        # 결과 객체가 사라지면 캐시 항목도 제거
+        del result, first, second, analyze
+        gc.collect()
+        assert analyzer._analysis_cache == {}
+    
+    def test_report_blocks_without_analysis(self, mock_slack_client):
+        """분석 데이터가 없을 때 경고 블록만 생성하는지 테스트"""
+        reporter = BacktestReporter(mock_slack_client)
+        result = _make_backtest_result('Empty', 10000.0)
+        
+        blocks = reporter._create_main_report_blocks(result, {})
+        
+        assert len(blocks) == 1
+        assert "분석 데이터 없음" in blocks[0]['text']['text']
+    
+    def test_save_detailed_report(self, mock_slack_client, tmp_path):
+        """상세 리포트 파일 저장 테스트"""
+        from src.backtesting.backtester import BacktestTrade
+        
+        reporter = BacktestReporter(mock_slack_client)
+        result = _make_backtest_result('Detailed', 11000.0)
+        result.trades = [
+            BacktestTrade(pd.Timestamp('2025-01-02 03:04'), 'BUY', 'LONG', 100.0, 0.5, 'ENTRY', {}),
+            BacktestTrade(pd.Timestamp('2025-01-03 05:06'), 'SELL', 'LONG', 110.0, 0.5, 'EXIT', {'pnl': 5.0})
+        ]
+        analysis = reporter._analyze(result)
+        filepath = tmp_path / 'report.txt'
+        
+        assert reporter.save_detailed_report(result, analysis, str(filepath)) is True
+        
+        content = filepath.read_text(encoding='utf-8')
+        assert "Detailed" in content
+        assert "1. 2025-01-02 03:04 | BUY LONG | $100.00 | 0.500000 | ENTRY" in content
+        assert "2. 2025-01-03 05:06 | SELL LONG | $110.00 | 0.500000 | EXIT" in content
+        assert "2025-01-30 00:00:00 | $11000.00 | 포지션: None" in content
+    
+    def test_send_and_save(self, mock_slack_client, tmp_path):
+        """전송과 저장이 분석 결과 하나를 공유하는지 테스트"""
+        reporter = BacktestReporter(mock_slack_client)
+        result = _make_backtest_result('Fused', 10500.0)
+        filepath = tmp_path / 'fused.txt'
+        
+        with patch.object(reporter.analyzer, 'analyze_performance',
+                          wraps=reporter.analyzer.analyze_performance) as analyze:
+            sent, saved, analysis = reporter.send_and_save(result, str(filepath), include_charts=False)
+        
+        assert sent is True
+        assert saved is True
+        assert analyze.call_count == 1
+        assert analysis['basic_metrics']['final_capital'] == 10500.0
+        assert filepath.exists()
+    
+    def test_send_and_save_analysis_failure(self, mock_slack_client, tmp_path):
+        """분석이 실패하면 예외 대신 (False, False, {})를 반환하는지 테스트"""
+        reporter = BacktestReporter(mock_slack_client)
+        result = _make_backtest_result('Broken', 11000.0)
+        filepath = tmp_path / 'broken.txt'
+        
+        with patch.object(reporter.analyzer, 'analyze_performance', side_effect=ValueError("bad result")):
+            assert reporter.send_and_save(result, str(filepath)) == (False, False, {})
+        
+        mock_slack_client.send_message.assert_not_called()
+        assert not filepath.exists()
+    
     def test_quick_summary(self, mock_slack_client, sample_backtest_result):
         """간단 요약 전송 테스트"""
         reporter = BacktestReporter(mock_slack_client)
@@ -7,7 +7,10 @@ DataCollector 테스트 코드
 import os
 import sys
 import time
+import numpy as np
+import pandas as pd
 from pathlib import Path
+from unittest.mock import Mock, patch
 from dotenv import load_dotenv
 
 # 프로젝트 루트를 sys.path에 추가
@@ -16,7 +19,7 @@ sys.path.append(str(project_root))
 
 from src.api.binance_client import BinanceClient
 from src.api.supabase_client import SupabaseClient
-from src.core.data_collector import DataCollector
+from src.core.data_collector import DataCollector, _macd_atr, _macd_atr_py
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -228,6 +231,95 @@ def test_database_status(supabase_client):
         print(f"❌ 데이터베이스 상태 확인 실패: {e}")
         return False
 
+def test_indicator_kernel_matches_pandas_ta():
+    """MACD/ATR 계산 커널과 pandas-ta 결과 일치 확인 (네트워크 불필요)"""
+    print("\n7️⃣ 지표 계산 커널 확인")
+    
+    rng = np.random.default_rng(0)
+    for length in (34, 200):
+        close = 100 + np.cumsum(rng.normal(0, 1, length))
+        high = close + rng.random(length)
+        low = close - rng.random(length)
+        high[5] = low[5] = close[5]  # 고가 = 저가인 캔들 포함
+        
+        for fast, reference in zip(_macd_atr(close, high, low), _macd_atr_py(close, high, low)):
+            np.testing.assert_allclose(fast, reference, rtol=1e-10, equal_nan=True)
+    
+    print("✅ 지표 계산 커널 일치")
+
+def _make_minute_candles(length: int = 202) -> pd.DataFrame:
+    """1분 간격 OHLCV DataFrame 생성 (네트워크 불필요)"""
+    rng = np.random.default_rng(1)
+    close = 100 + np.cumsum(rng.normal(0, 1, length))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2025-01-01', periods=length, freq='min'),
+        'open': close,
+        'high': close + rng.random(length),
+        'low': close - rng.random(length),
+        'close': close,
+        'volume': rng.random(length)
+    })
+
+def _seeded_collector(candles: pd.DataFrame, seed_length: int = 200) -> DataCollector:
+    """앞쪽 seed_length개 캔들(마지막은 진행 중)로 지표 상태를 저장한 DataCollector"""
+    collector = DataCollector(Mock(), Mock(), ['BTCUSDT'])
+    seed = candles.iloc[:seed_length]
+    collector._seed_indicator_state('BTCUSDT', seed, collector._calculate_indicators_for_df(seed, 'BTCUSDT'))
+    return collector
+
+def test_incremental_indicators_match_recompute():
+    """지표 상태를 두 단계 전진시킨 결과가 전체 재계산과 일치하는지 확인"""
+    print("\n8️⃣ 지표 증분 계산 확인")
+    
+    candles = _make_minute_candles()
+    collector = _seeded_collector(candles)
+    
+    for end in (201, 202):
+        # 직전 확정 캔들 + 진행 중인 최신 캔들
+        collector.binance_client.get_recent_candles.return_value = candles.iloc[end - 2:end].to_dict('records')
+        latest = collector._collect_latest_incremental('BTCUSDT')[0]
+        
+        reference = collector._calculate_indicators_for_df(candles.iloc[:end], 'BTCUSDT').iloc[-1]
+        assert latest['timestamp'] == candles['timestamp'].iloc[end - 1]
+        for name, value in reference.items():
+            np.testing.assert_allclose(latest[name], value, rtol=1e-12, atol=1e-12)
+        assert collector._indicator_state['BTCUSDT']['prev_ts'] == candles['timestamp'].iloc[end - 2]
+    
+    print("✅ 지표 증분 계산 일치")
+
+def test_incremental_gap_falls_back_to_recompute():
+    """캔들이 끊기면 증분 계산 대신 전체 재계산하는지 확인"""
+    candles = _make_minute_candles(210)
+    collector = _seeded_collector(candles)
+    state = collector._indicator_state['BTCUSDT']
+    
+    # 상태 이후 5분이 지난 캔들
+    collector.binance_client.get_recent_candles.return_value = candles.iloc[203:205].to_dict('records')
+    assert collector._collect_latest_incremental('BTCUSDT') is None
+    assert collector._indicator_state['BTCUSDT'] is state
+    
+    with patch.object(collector, '_collect_and_calculate_with_retry', return_value=[{}]) as recompute:
+        assert collector._collect_latest_with_indicators('BTCUSDT') == [{}]
+    recompute.assert_called_once_with('BTCUSDT', limit=1)
+
+def test_incremental_same_minute_keeps_state():
+    """같은 분에 다시 수집하면 상태는 그대로 두고 최신 캔들 지표만 계산하는지 확인"""
+    candles = _make_minute_candles()
+    collector = _seeded_collector(candles)
+    state = dict(collector._indicator_state['BTCUSDT'])
+    
+    # 시드와 같은 확정 캔들(간격 0) + 값이 바뀐 진행 중 캔들
+    recent = candles.iloc[198:200].to_dict('records')
+    recent[-1]['close'] += 0.5
+    collector.binance_client.get_recent_candles.return_value = recent
+    
+    first = collector._collect_latest_incremental('BTCUSDT')[0]
+    second = collector._collect_latest_incremental('BTCUSDT')[0]
+    
+    assert collector._indicator_state['BTCUSDT'] == state
+    assert first == second
+    assert first['atr_14_value'] == collector._advance_indicator_state(state, recent[-1])['atr']
+
 def main():
     """메인 테스트 함수"""
     print("🧪 DataCollector 통합 테스트 시작")